@@ -0,0 +1,190 @@
+"""
+Cold-start import budget for every Lambda entry point.
+
+Imports each function's app.main in a fresh interpreter under
+``python -X importtime``, the way the Lambda runtime does on a cold start, and
+reports the import time of app.main (median of --repeat runs) together with
+its heaviest third-party packages. Exits non-zero if any entry point is over
+its budget_ms, or if it loaded a module listed in its deferred set at import —
+those belong on the code paths that need them (see each app's imports).
+
+Environment variables the modules read at import are set to placeholders;
+nothing may call AWS or the database at import, so a network call shows up
+as an import failure rather than a slow run. Budgets are for a developer
+laptop; --scale loosens them on slower hardware.
+
+    cd api/backend
+    python benchmarks/bench_cold_start.py
+    python benchmarks/bench_cold_start.py -k database_api --top 15
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+BACKEND = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+# Heavy libraries no entry point should load before a route needs them.
+_DATA_STACK = ("pandas", "geopandas", "shapely", "pyarrow", "sqlalchemy")
+
+ENTRY_POINTS = {
+    "database_api": {
+        "dir":       "database_api",
+        "env":       {"DB_SECRET_ARN": "local", "SQS_QUEUE_URL": "local"},
+        "budget_ms": 150,
+        "deferred":  _DATA_STACK + ("numpy", "boto3"),
+    },
+    "worker_lambda": {
+        "dir":       "worker_lambda",
+        "env":       {"DB_SECRET_ARN": "local"},
+        "budget_ms": 1500,
+        "deferred":  ("geopandas", "sqlalchemy"),
+    },
+    "job_status": {
+        "dir":       "job_status",
+        "env":       {"JOB_TABLE": "local"},
+        "budget_ms": 50,
+        "deferred":  _DATA_STACK + ("boto3",),
+    },
+    "pixel_selection": {
+        "dir":       "pixel_selection",
+        "env":       {"BATCH_JOB_QUEUE": "local", "BATCH_JOB_DEFINITION": "local",
+                      "DYNAMODB_TABLE": "local", "DB_SECRET_ARN": "local"},
+        "budget_ms": 100,
+        "deferred":  _DATA_STACK + ("boto3",),
+    },
+    "admin_tool": {
+        "dir":       "admin_tool",
+        "env":       {"COGNITO_USER_POOL_ID": "local"},
+        "budget_ms": 600,
+        "deferred":  _DATA_STACK,
+    },
+    "ingest_trigger": {
+        "dir":       "ingestion/ingest_trigger",
+        "env":       {"CONFIG_BUCKET": "local", "JOB_TABLE": "local", "QAQC_FUNCTION_NAME": "local"},
+        "budget_ms": 600,
+        "deferred":  _DATA_STACK,
+    },
+    "qaqc": {
+        "dir":       "ingestion/qaqc",
+        "env":       {"CONFIG_BUCKET": "local", "JOB_TABLE": "local", "STAGING_DB_SECRET_ARN": "local"},
+        "budget_ms": 1000,
+        "deferred":  ("geopandas", "sqlalchemy", "boto3"),
+    },
+    "promotion": {
+        "dir":       "ingestion/promotion",
+        "env":       {"JOB_TABLE": "local", "STAGING_DB_SECRET_ARN": "local",
+                      "PROMOTION_DB_SECRET_ARN": "local"},
+        "budget_ms": 600,
+        "deferred":  _DATA_STACK,
+    },
+    "rejection": {
+        "dir":       "ingestion/rejection",
+        "env":       {"JOB_TABLE": "local", "STAGING_DB_SECRET_ARN": "local"},
+        "budget_ms": 600,
+        "deferred":  _DATA_STACK,
+    },
+}
+
+
+def parse_importtime(stderr: str) -> list:
+    """
+    ``-X importtime`` output → [(depth, name, self_us, cumulative_us)] in the
+    order printed (children before their parent).
+    """
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        entries.append((depth, name.strip(), int(self_us), int(cumulative_us)))
+    return entries
+
+
+def measure(name: str, spec: dict) -> dict:
+    """Import app.main once in a fresh interpreter; times in milliseconds."""
+    env = dict(os.environ)
+    env.update({
+        "AWS_REGION":                "us-west-2",
+        "AWS_DEFAULT_REGION":        "us-west-2",
+        "AWS_ACCESS_KEY_ID":         "local",
+        "AWS_SECRET_ACCESS_KEY":     "local",
+        "AWS_EC2_METADATA_DISABLED": "true",
+    })
+    env.update(spec["env"])
+    env.pop("DB_HOST", None)
+
+    child = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        cwd=os.path.join(BACKEND, spec["dir"]),
+        env=env, capture_output=True, text=True, timeout=60,
+    )
+    entries = parse_importtime(child.stderr)
+    if child.returncode != 0:
+        error = [line for line in child.stderr.splitlines() if not line.startswith("import time:")]
+        raise RuntimeError(f"{name}: import failed\n" + "\n".join(error[-5:]))
+
+    # app.main's subtree: everything printed after the previous top-level
+    # import (interpreter startup) up to app.main itself.
+    end      = next(i for i, e in enumerate(entries) if e[1] == "app.main")
+    start    = max((i + 1 for i, e in enumerate(entries[:end]) if e[0] == 0), default=0)
+    subtree  = entries[start:end + 1]
+    packages = {}
+    for _, module, _, cumulative in subtree:
+        top = module.split(".")[0]
+        if "." not in module and top != "app":
+            packages[top] = max(packages.get(top, 0), cumulative / 1000)
+    loaded = {module for _, module, _, _ in entries}
+
+    return {
+        "import_ms": entries[end][3] / 1000,
+        "packages":  packages,
+        "deferred":  sorted(m for m in spec["deferred"] if m in loaded),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-k", "--filter", action="append", default=[],
+                        help="only entry points whose name contains this (repeatable)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=5, help="heaviest packages to list per entry point")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply every budget by this")
+    args = parser.parse_args()
+
+    names = [n for n in ENTRY_POINTS if not args.filter or any(f in n for f in args.filter)]
+    failures = []
+
+    print(f"{'entry point':18s} {'import ms':>10s} {'budget ms':>10s}  heaviest packages (cumulative ms)")
+    for name in names:
+        spec   = ENTRY_POINTS[name]
+        budget = spec["budget_ms"] * args.scale
+        try:
+            measure(name, spec)     # first run pays for .pyc compilation and a cold page cache
+            runs = [measure(name, spec) for _ in range(args.repeat)]
+        except (RuntimeError, subprocess.TimeoutExpired) as exc:
+            print(f"{name:18s} {'—':>10s} {budget:10.0f}  {exc}")
+            failures.append(f"{name}: import failed")
+            continue
+
+        import_ms = statistics.median(r["import_ms"] for r in runs)
+        heaviest  = sorted(runs[-1]["packages"].items(), key=lambda kv: -kv[1])[:args.top]
+        print(f"{name:18s} {import_ms:10.1f} {budget:10.0f}  "
+              + ", ".join(f"{pkg} {ms:.0f}" for pkg, ms in heaviest))
+
+        if import_ms > budget:
+            failures.append(f"{name}: {import_ms:.0f} ms over its {budget:.0f} ms budget")
+        if runs[-1]["deferred"]:
+            failures.append(f"{name}: loaded {', '.join(runs[-1]['deferred'])} at import")
+
+    for line in failures:
+        print("FAIL", line)
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+"""
+cache.py — response cache for synchronous view queries.
+
+The map UI re-issues the same plot_shape_view / granule_view /
+extracted_metadata_view requests over and over. Finished Lambda responses are
+cached per warm container in an LRU with a TTL and a byte budget, keyed by the
+normalised request (view, filters, select, limit, offset, cursor, format).
+
+Every key is prefixed with the data-version stamp (vswir_plants.data_version),
+which promotion bumps in the same transaction as the rows it inserts — a
+promoted batch therefore invalidates everything cached before it. The stamp is
+re-read at most every RESPONSE_CACHE_VERSION_CHECK seconds.
+
+Set RESPONSE_CACHE_BUCKET to add a shared tier: responses are also written to
+s3://<bucket>/response-cache/<version>/<key>.json so other containers can reuse
+them. Entries older than the TTL are ignored there too.
+
+RESPONSE_CACHE_TTL=0 disables the cache.
+"""
+
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+
+from app.db import get_connection
+
+logger = logging.getLogger("lambda_handler")
+
+CACHE_TTL_SECONDS     = float(os.environ.get("RESPONSE_CACHE_TTL", "300"))
+CACHE_MAX_ENTRIES     = int(os.environ.get("RESPONSE_CACHE_MAX_ENTRIES", "256"))
+CACHE_MAX_BYTES       = int(float(os.environ.get("RESPONSE_CACHE_MAX_MB", "64")) * 1024 * 1024)
+VERSION_CHECK_SECONDS = float(os.environ.get("RESPONSE_CACHE_VERSION_CHECK", "10"))
+SHARED_BUCKET         = os.environ.get("RESPONSE_CACHE_BUCKET")
+SHARED_PREFIX         = "response-cache/"
+
+
+# ---------------------------------------------------------------------------
+# Keys
+# ---------------------------------------------------------------------------
+
+def _normalise_filters(filters: dict | None) -> dict:
+    """
+    Sort filter keys and the values of IN-style list filters, so equivalent
+    payloads share a key. geom is left untouched — coordinate order matters.
+    """
+    out = {}
+    for col, val in (filters or {}).items():
+        if col != "geom" and isinstance(val, list) and all(
+            not isinstance(v, (list, dict)) for v in val
+        ):
+            val = sorted(set(val), key=lambda v: (type(v).__name__, str(v)))
+        out[col] = val
+    return out
+
+
+def cache_key(view_name, filters, select, limit, offset, cursor, format_type) -> str:
+    payload = json.dumps(
+        [view_name, _normalise_filters(filters), select, limit, offset or 0, cursor, format_type],
+        sort_keys=True, separators=(",", ":"), default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Data-version stamp
+# ---------------------------------------------------------------------------
+
+_version_lock    = threading.Lock()
+_version         = None
+_version_checked = float("-inf")
+
+
+def data_version():
+    """
+    Current data-version stamp, re-read at most every VERSION_CHECK_SECONDS.
+    Returns None if it cannot be read — callers then bypass the cache.
+    """
+    global _version, _version_checked
+    with _version_lock:
+        if time.monotonic() - _version_checked < VERSION_CHECK_SECONDS:
+            return _version
+        _version_checked = time.monotonic()
+        try:
+            with get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute("SELECT version FROM vswir_plants.data_version")
+                    row = cur.fetchone()
+        except Exception as exc:
+            logger.warning("Response cache: data version unavailable (%s)", exc)
+            row = None
+
+        version = row[0] if row else None
+        if version != _version:
+            logger.debug("Response cache: data version %s → %s", _version, version)
+            _local.clear()
+        _version = version
+        return _version
+
+
+# ---------------------------------------------------------------------------
+# In-process tier
+# ---------------------------------------------------------------------------
+
+def _response_size(response: dict) -> int:
+    return len(response.get("body") or b"")
+
+
+class _LRU:
+    """Thread-safe LRU of Lambda responses with a TTL and a total body-size budget."""
+
+    def __init__(self, max_entries: int, max_bytes: int, ttl: float):
+        self.max_entries = max_entries
+        self.max_bytes   = max_bytes
+        self.ttl         = ttl
+        self._entries    = OrderedDict()    # key → (expires_at, size, response)
+        self._bytes      = 0
+        self._lock       = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                self._drop(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry[2]
+
+    def put(self, key, response: dict):
+        size = _response_size(response)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (time.monotonic() + self.ttl, size, response)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _drop(self, key):
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+
+_local = _LRU(CACHE_MAX_ENTRIES, CACHE_MAX_BYTES, CACHE_TTL_SECONDS)
+
+
+# ---------------------------------------------------------------------------
+# Shared tier (optional, S3)
+# ---------------------------------------------------------------------------
+
+_s3 = None
+
+
+def _s3_client():
+    global _s3
+    if _s3 is None:
+        import boto3
+        _s3 = boto3.client("s3", region_name=os.environ.get("AWS_REGION", "us-west-2"))
+    return _s3
+
+
+def _shared_get(object_key: str):
+    try:
+        obj = _s3_client().get_object(Bucket=SHARED_BUCKET, Key=object_key)
+    except Exception as exc:
+        if getattr(exc, "response", {}).get("Error", {}).get("Code") not in ("NoSuchKey", "404"):
+            logger.warning("Response cache: shared get failed (%s)", exc)
+        return None
+    age = (datetime.now(timezone.utc) - obj["LastModified"]).total_seconds()
+    if age > CACHE_TTL_SECONDS:
+        return None
+    return json.loads(obj["Body"].read())
+
+
+def _shared_put(object_key: str, response: dict):
+    stored = dict(response)
+    if isinstance(stored.get("body"), bytes):
+        stored["body"] = stored["body"].decode("ascii")
+    try:
+        _s3_client().put_object(
+            Bucket=SHARED_BUCKET, Key=object_key,
+            Body=json.dumps(stored).encode(), ContentType="application/json",
+        )
+    except Exception as exc:
+        logger.warning("Response cache: shared put failed (%s)", exc)
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def enabled() -> bool:
+    return CACHE_TTL_SECONDS > 0
+
+
+def get(key: str):
+    """Return a cached response (tagged X-Cache: hit) or None."""
+    version = data_version()
+    if version is None:
+        return None
+    versioned = f"{version}/{key}"
+
+    response = _local.get(versioned)
+    if response is None and SHARED_BUCKET:
+        response = _shared_get(f"{SHARED_PREFIX}{versioned}.json")
+        if response is not None:
+            _local.put(versioned, response)
+    if response is None:
+        return None
+
+    logger.debug("Response cache hit: %s", key[:12])
+    return {**response, "headers": {**response.get("headers", {}), "X-Cache": "hit"}}
+
+
+def put(key: str, response: dict):
+    """Cache a successful response under the current data version."""
+    if response.get("statusCode") != 200:
+        return
+    version = data_version()
+    if version is None:
+        return
+    versioned = f"{version}/{key}"
+    _local.put(versioned, response)
+    if SHARED_BUCKET:
+        _shared_put(f"{SHARED_PREFIX}{versioned}.json", response)
@@ -0,0 +1,33 @@
+"""
+cursor.py — opaque keyset-pagination cursors.
+
+A cursor is the natural ordering key of the last row on a page, bound to the
+view (or "query" for the linked query) it was issued for, as url-safe base64
+JSON. Clients treat it as an opaque string and send it back unchanged.
+"""
+
+import json
+import base64
+import binascii
+
+
+def encode_cursor(scope: str, key: list) -> str:
+    """Encode the last row's ordering key (JSON-safe values) for the given scope."""
+    raw = json.dumps({"v": scope, "k": list(key)}, separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(scope: str, cursor: str, key_length: int) -> list:
+    """Decode a cursor issued for `scope`; raise ValueError if it is malformed or foreign."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError, AttributeError):
+        raise ValueError("Invalid cursor")
+
+    if not isinstance(payload, dict) or payload.get("v") != scope:
+        raise ValueError("Invalid cursor")
+    key = payload.get("k")
+    if not isinstance(key, list) or len(key) != key_length:
+        raise ValueError("Invalid cursor")
+    return key
@@ -1,31 +1,155 @@
 import os
 import json
-import boto3
+import time
+import logging
+import threading
+from contextlib import contextmanager
+
 import psycopg2
+import psycopg2.pool
+
+logger = logging.getLogger("lambda_handler")
+
+# Widest ThreadPoolExecutor fan-out in orchestration.run_linked_query is the
+# three stage-4 page fetches — one pooled connection per concurrent query.
+POOL_MAX = int(os.environ.get("DB_POOL_MAX", "3"))
+
+# Connections idle longer than this are pinged before reuse. A frozen Lambda
+# container can sit for minutes, long enough for RDS / the NAT to drop the socket.
+PING_AFTER_SECONDS = float(os.environ.get("DB_POOL_PING_AFTER", "30"))
+
+
+class _CountingPool(psycopg2.pool.ThreadedConnectionPool):
+    """
+    ThreadedConnectionPool that opens connections lazily, keeps up to maxconn
+    of them idle between invocations, and counts new vs. reused checkouts.
+    """
+
+    def __init__(self, maxconn, **kwargs):
+        self.opened = 0
+        self.reused = 0
+        super().__init__(0, maxconn, **kwargs)
+        # psycopg2 closes returned connections beyond minconn — raise it after
+        # construction so nothing is opened eagerly but nothing is thrown away.
+        self.minconn = maxconn
+
+    def _connect(self, key=None):
+        self.opened += 1
+        return super()._connect(key)
+
+
+def _connection_settings() -> dict:
+    """
+    psycopg2 connect kwargs, resolved on first connection rather than at import
+    so routes that never touch the database don't wait on Secrets Manager.
 
-secret_arn = os.environ['DB_SECRET_ARN']
-region = os.environ.get("AWS_REGION", "us-west-2")
+    DB_HOST in the environment overrides Secrets Manager — used to point the app
+    at a local Postgres (benchmarks/). DB_USER / DB_PASS / DB_NAME / DB_PORT
+    apply to either source.
+    """
+    if os.environ.get("DB_HOST"):
+        secret = {
+            "host":     os.environ["DB_HOST"],
+            "username": os.environ.get("DB_USER", "postgres"),
+            "password": os.environ.get("DB_PASS", ""),
+        }
+    else:
+        import boto3
+        region = os.environ.get("AWS_REGION", "us-west-2")
+        client = boto3.client("secretsmanager", region_name=region)
+        secret = json.loads(client.get_secret_value(SecretId=os.environ["DB_SECRET_ARN"])["SecretString"])
 
-client = boto3.client("secretsmanager", region_name=region)
-secret = json.loads(client.get_secret_value(SecretId=secret_arn)['SecretString'])
+    return {
+        "host":     secret["host"],
+        "port":     os.environ.get("DB_PORT", "5432"),
+        "dbname":   os.environ.get("DB_NAME", "vswirplants"),
+        "user":     os.environ.get("DB_USER", secret["username"]),
+        "password": os.environ.get("DB_PASS", secret["password"]),
+    }
 
-DB_HOST = secret["host"]
-DB_USER = secret["username"]
-DB_PASS = secret["password"]
-DB_NAME = "vswirplants"
 
+_pool: _CountingPool | None = None
+_pool_lock = threading.Lock()
+_last_used: dict[int, float] = {}
 
+
+def _get_pool() -> _CountingPool:
+    """Create the module-level pool on first use; it survives warm invocations."""
+    global _pool
+    if _pool is None or _pool.closed:
+        with _pool_lock:
+            if _pool is None or _pool.closed:
+                try:
+                    _pool = _CountingPool(
+                        POOL_MAX,
+                        **_connection_settings(),
+                        connect_timeout=10,
+                        keepalives=1,
+                        keepalives_idle=30,
+                        keepalives_interval=10,
+                        keepalives_count=3,
+                    )
+                except Exception as e:
+                    print("Type:", type(e))
+                    print("Error:", repr(e))
+                    raise
+    return _pool
+
+
+def _is_healthy(conn) -> bool:
+    """Cheap liveness check — only round-trips if the connection has been idle a while."""
+    if conn.closed:
+        return False
+    idle = time.monotonic() - _last_used.get(id(conn), 0.0)
+    if idle < PING_AFTER_SECONDS:
+        return True
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT 1")
+        conn.rollback()
+        return True
+    except psycopg2.Error:
+        return False
+
+
+def _checkout():
+    pool = _get_pool()
+    for _ in range(POOL_MAX + 1):
+        opened_before = pool.opened
+        conn = pool.getconn()
+        if pool.opened > opened_before or _is_healthy(conn):
+            break
+        logger.debug("DB pool: discarding stale connection")
+        _last_used.pop(id(conn), None)
+        pool.putconn(conn, close=True)
+    else:
+        raise psycopg2.OperationalError("No healthy database connection available")
+
+    if pool.opened == opened_before:
+        pool.reused += 1
+    logger.debug(
+        "DB pool: %s connection (opened=%d reused=%d)",
+        "new" if pool.opened > opened_before else "reused", pool.opened, pool.reused,
+    )
+    return conn
+
+
+@contextmanager
 def get_connection():
+    """
+    Borrow a pooled connection for the duration of a with-block.
+
+    The block runs as one transaction (committed on success, rolled back on
+    error) and the connection goes back to the pool afterwards — broken
+    connections are closed instead of returned.
+    """
+    conn = _checkout()
     try:
-        return psycopg2.connect(
-            host=DB_HOST,
-            port='5432',
-            dbname=DB_NAME,
-            user=DB_USER,
-            password=DB_PASS,
-            connect_timeout=10,
-        )
-    except Exception as e:
-        print("Type:", type(e))
-        print("Error:", repr(e))
-        raise
\ No newline at end of file
+        with conn:
+            yield conn
+    finally:
+        _last_used[id(conn)] = time.monotonic()
+        broken = bool(conn.closed)
+        if broken:
+            _last_used.pop(id(conn), None)
+        _get_pool().putconn(conn, close=broken)
@@ -0,0 +1,189 @@
+"""
+exports.py — content-addressed async export jobs.
+
+An export's job_id is derived from what the file will contain: a hash of the
+normalised SQL, params, spectral metadata, export format and the current
+data-version stamp (cache.data_version). Identical requests therefore share
+one record in the export-jobs table and one object under exports/:
+
+  - a completed export whose file still exists is returned straight away with
+    a fresh presigned URL;
+  - a queued or running export is returned as-is, so concurrent duplicates
+    coalesce onto one job;
+  - otherwise the request claims the record with a conditional put and is the
+    only one to enqueue. Failed, stale (no activity for EXPORT_CLAIM_TIMEOUT
+    seconds) and expired records are reclaimed the same way.
+
+A promotion bumps the data version and so starts a fresh set of job ids.
+Without JOB_TABLE / EXPORT_BUCKET, or if the data version cannot be read,
+every request gets a random job_id as before.
+"""
+
+import os
+import re
+import json
+import time
+import uuid
+import hashlib
+import logging
+
+from app.cache import data_version
+
+logger = logging.getLogger("lambda_handler")
+
+JOB_TABLE     = os.environ.get("JOB_TABLE")
+EXPORT_BUCKET = os.environ.get("EXPORT_BUCKET")
+
+# The worker Lambda times out after 15 minutes; a claim with no progress for
+# longer than this belongs to a job that died without marking itself failed.
+CLAIM_TIMEOUT_SECONDS = int(os.environ.get("EXPORT_CLAIM_TIMEOUT", "1800"))
+
+# Matches the worker's presigned URL lifetime (job_store.finalize_job).
+PRESIGNED_URL_SECONDS = 6 * 3600
+
+_WHITESPACE = re.compile(r"\s+")
+
+_dynamodb = None
+_s3       = None
+
+
+def _clients():
+    global _dynamodb, _s3
+    if _dynamodb is None:
+        import boto3
+        region    = os.environ.get("AWS_REGION", "us-west-2")
+        _dynamodb = boto3.client("dynamodb", region_name=region)
+        _s3       = boto3.client("s3", region_name=region)
+    return _dynamodb, _s3
+
+
+def enabled() -> bool:
+    return bool(JOB_TABLE and EXPORT_BUCKET)
+
+
+def export_job_id(sql: str, params: list, spectral_metadata, export_format: str, version) -> str:
+    """UUID-shaped job id for an export, stable for identical requests at one data version."""
+    payload = json.dumps(
+        [_WHITESPACE.sub(" ", sql).strip(), params, spectral_metadata, export_format, version],
+        sort_keys=True, separators=(",", ":"), default=str,
+    )
+    return str(uuid.UUID(hashlib.sha256(payload.encode()).hexdigest()[:32]))
+
+
+def _reusable_url(item: dict):
+    """Fresh presigned URL for a completed export whose object still exists, else None."""
+    s3_key = item.get("s3_key", {}).get("S")
+    if not s3_key:
+        return None
+    _, s3 = _clients()
+    try:
+        s3.head_object(Bucket=EXPORT_BUCKET, Key=s3_key)
+    except Exception:
+        return None     # expired by the exports/ lifecycle rule (or never written)
+    return s3.generate_presigned_url(
+        ClientMethod="get_object",
+        Params={"Bucket": EXPORT_BUCKET, "Key": s3_key},
+        ExpiresIn=PRESIGNED_URL_SECONDS,
+    )
+
+
+def _in_progress(item: dict) -> bool:
+    if item.get("status", {}).get("S"):
+        return False
+    last_activity = max(
+        int(item.get(attr, {}).get("N", 0)) for attr in ("claimed_at", "progress_at")
+    )
+    return time.time() - last_activity < CLAIM_TIMEOUT_SECONDS
+
+
+def claim(sql: str, params: list, spectral_metadata, export_format: str):
+    """
+    Find or claim the export job for a request.
+
+    Returns (job_id, body):
+      - (job_id, body)  an existing job to hand back as-is — body is the
+                        response payload (with presigned_url if complete);
+      - (job_id, None)  this request claimed the job and must enqueue it;
+      - (None, None)    deduplication unavailable; enqueue with a random id.
+    """
+    if not enabled():
+        return None, None
+    version = data_version()
+    if version is None:
+        return None, None
+
+    job_id = export_job_id(sql, params, spectral_metadata, export_format, version)
+    dynamodb, _ = _clients()
+
+    item = dynamodb.get_item(
+        TableName=JOB_TABLE, Key={"job_id": {"S": job_id}}, ConsistentRead=True,
+    ).get("Item")
+
+    if item is not None:
+        if item.get("status", {}).get("S") == "complete":
+            url = _reusable_url(item)
+            if url:
+                logger.debug("Export reuse: job_id=%s complete", job_id)
+                return job_id, {"job_id": job_id, "status": "complete", "presigned_url": url}
+        elif _in_progress(item):
+            logger.debug("Export reuse: job_id=%s in progress", job_id)
+            return job_id, {"job_id": job_id}
+
+    # Claim (or reclaim) the record. The condition pins what we just read, so
+    # only one of several concurrent duplicates gets to enqueue.
+    if item is None:
+        condition, values = "attribute_not_exists(job_id)", None
+    elif "claimed_at" in item:
+        condition, values = "claimed_at = :seen", {":seen": item["claimed_at"]}
+    else:
+        condition, values = "attribute_not_exists(claimed_at)", None
+
+    now = int(time.time())
+    kwargs = {}
+    if values:
+        kwargs["ExpressionAttributeValues"] = values
+    try:
+        dynamodb.put_item(
+            TableName=JOB_TABLE,
+            Item={
+                "job_id":     {"S": job_id},
+                "claimed_at": {"N": str(now)},
+                "expire_at":  {"N": str(now + 24 * 3600)},
+            },
+            ConditionExpression=condition,
+            **kwargs,
+        )
+    except dynamodb.exceptions.ConditionalCheckFailedException:
+        logger.debug("Export reuse: job_id=%s claimed concurrently", job_id)
+        return job_id, {"job_id": job_id}
+
+    return job_id, None
+
+
+def register_parent(job_id: str, shard_count: int, row_count: int) -> None:
+    """Mark job_id as fanned out into shard_count shard jobs (shards.py / sqs.send_shard_jobs)."""
+    dynamodb, _ = _clients()
+    now = int(time.time())
+    dynamodb.update_item(
+        TableName=JOB_TABLE,
+        Key={"job_id": {"S": job_id}},
+        UpdateExpression=(
+            "SET shard_count = :n, total_rows_estimate = :t, "
+            "claimed_at = if_not_exists(claimed_at, :now), expire_at = :ttl"
+        ),
+        ExpressionAttributeValues={
+            ":n":   {"N": str(shard_count)},
+            ":t":   {"N": str(row_count)},
+            ":now": {"N": str(now)},
+            ":ttl": {"N": str(now + 24 * 3600)},
+        },
+    )
+
+
+def release(job_id: str) -> None:
+    """Drop a claim whose job could not be enqueued, so the next request retries."""
+    try:
+        dynamodb, _ = _clients()
+        dynamodb.delete_item(TableName=JOB_TABLE, Key={"job_id": {"S": job_id}})
+    except Exception:
+        logger.exception("Failed to release export claim job_id=%s", job_id)
@@ -1,22 +1,28 @@
 import json
 import io
+import uuid
 import base64
 import logging
 import math
 
-import geopandas as gpd
-import shapely.wkt
-import shapely.geometry
-
-from app.query import execute_query, build_query
-from app.view_config import VIEW_CONFIG, get_selectable_columns
-from app.sqs import send_sqs
-from app.orchestration import run_linked_query
+# Heavy libraries (pandas, geopandas, shapely, pyarrow) are imported by the
+# code paths that use them, not here: async exports, cache hits and errors
+# return without loading any of them, which keeps cold starts short.
+from app.query import execute_query, execute_arrow, build_query, next_cursor
+from app.serialize import feature_collection, records, dumps, arrow_stream
+from app import cache as response_cache
+from app import exports
+from app.view_config import VIEW_CONFIG, get_selectable_columns, get_order_key
+from app.sqs import send_sqs, send_shard_jobs
+from app.shards import plan_shards
 
 
 logger = logging.getLogger("lambda_handler")
 logger.setLevel(logging.WARNING)
 
+# File formats the async worker can write (export_format on spectra/reflectance requests)
+EXPORT_FORMATS = ("csv", "parquet")
+
 
 def _json_safe(obj):
     """json.dumps default= handler: NaN/Inf → None, dates → str."""
@@ -37,11 +43,38 @@ def _parse_body(event):
         raise ValueError("Invalid JSON body")
 
 
-def _format_response(df, view_name, format_type):
-    """Serialise a DataFrame/GeoDataFrame to the requested format."""
+def _format_response(df, view_name, format_type, cursor=None):
+    """
+    Serialise a DataFrame/GeoDataFrame to the requested format.
+
+    cursor, when set, is returned in the X-Next-Cursor header — the body shape
+    of every format stays the same as for un-paged requests.
+    """
+    response = _serialise(df, view_name, format_type)
+    if cursor:
+        response["headers"]["X-Next-Cursor"] = cursor
+    return response
+
+
+def _serialise(df, view_name, format_type):
+    if format_type == "arrow":
+        # df is already a pyarrow Table from execute_arrow
+        return {
+            "statusCode": 200,
+            "headers": {
+                "Content-Type": "application/vnd.apache.arrow.stream",
+                "Content-Disposition": f"attachment; filename={view_name}.arrows",
+            },
+            "body": base64.b64encode(arrow_stream(df)),
+            "isBase64Encoded": True,
+        }
+
     has_geom = "geom" in df.columns
 
     if format_type in ("parquet", "geoparquet") and has_geom:
+        import geopandas as gpd
+        import shapely.wkt
+
         df["geom"] = df["geom"].apply(
             lambda g: shapely.wkt.loads(g) if isinstance(g, str) else g
         )
@@ -72,17 +105,9 @@ def _format_response(df, view_name, format_type):
         }
 
     if format_type in ("json", "geojson") and has_geom:
-        features = []
-        for _, row in df.iterrows():
-            geom = row["geom"]
-            if isinstance(geom, str):
-                geom = shapely.wkt.loads(geom)
-            geojson_geom = shapely.geometry.mapping(geom) if geom else None
-            properties = row.drop("geom").to_dict()
-            features.append({"type": "Feature", "geometry": geojson_geom, "properties": properties})
         return {
             "statusCode": 200,
-            "body": json.dumps({"type": "FeatureCollection", "features": features}, default=str),
+            "body": feature_collection(df),
             "isBase64Encoded": False,
             "headers": {
                 "Content-Type": "application/geo+json",
@@ -93,7 +118,7 @@ def _format_response(df, view_name, format_type):
     # plain JSON
     return {
         "statusCode": 200,
-        "body": json.dumps(df.to_dict(orient="records"), default=str),
+        "body": json.dumps(records(df), default=str),
         "headers": {"Content-Type": "application/json"},
     }
 
@@ -109,6 +134,8 @@ def handle_linked_query(event):
     except ValueError as exc:
         return {"statusCode": 400, "body": json.dumps({"error": str(exc)})}
 
+    from app.orchestration import run_linked_query
+
     try:
         result = run_linked_query(body)
     except ValueError as exc:
@@ -119,7 +146,7 @@ def handle_linked_query(event):
 
     return {
         "statusCode": 200,
-        "body": json.dumps(result, default=_json_safe),
+        "body": dumps(result, default=_json_safe),
         "headers": {"Content-Type": "application/json"},
     }
 
@@ -147,13 +174,19 @@ def handle_view_query(event, view_name):
     if view_name not in VIEW_CONFIG:
         return {"statusCode": 400, "body": json.dumps({"error": "View not allowed"})}
 
-    # limit / offset
+    # limit / offset / cursor
     try:
         limit  = int(query_params["limit"])  if query_params.get("limit")  else None
         offset = int(query_params["offset"]) if query_params.get("offset") else None
     except ValueError:
         return {"statusCode": 400, "body": json.dumps({"error": "Invalid limit or offset"})}
 
+    cursor = query_params.get("cursor") or None
+    if cursor is not None and not isinstance(cursor, str):
+        return {"statusCode": 400, "body": json.dumps({"error": "Invalid cursor"})}
+    if cursor and offset:
+        return {"statusCode": 400, "body": json.dumps({"error": "cursor and offset cannot be combined"})}
+
     # select
     select = query_params.get("select")
     if select is None:
@@ -171,6 +204,14 @@ def handle_view_query(event, view_name):
             return {"statusCode": 400, "body": json.dumps({"error": f"Invalid columns: {', '.join(invalid)}"})}
         select_statement = ", ".join(select)
 
+    # Paged responses carry a cursor built from the order_key, so fetch any key
+    # columns the caller did not select and drop them again before serialising.
+    paged = bool(limit) and not VIEW_CONFIG[view_name]["is_async"]
+    key_extra = []
+    if paged and select is not None:
+        key_extra = [c for c in get_order_key(view_name) if c not in select]
+        select_statement = ", ".join(list(select) + key_extra)
+
     # filters
     filters_param = query_params.get("filters")
     if isinstance(filters_param, str):
@@ -185,6 +226,16 @@ def handle_view_query(event, view_name):
     else:
         return {"statusCode": 400, "body": json.dumps({"error": "Invalid type for filters"})}
 
+    format_type = query_params.get("format", "json").lower()
+
+    # Synchronous views: serve repeated requests from the response cache
+    key = None
+    if response_cache.enabled() and not VIEW_CONFIG[view_name]["is_async"]:
+        key = response_cache.cache_key(view_name, filters, select, limit, offset, cursor, format_type)
+        cached = response_cache.get(key)
+        if cached is not None:
+            return cached
+
     try:
         sql, params = build_query(
             view_name=view_name,
@@ -192,17 +243,59 @@ def handle_view_query(event, view_name):
             limit=limit,
             offset=offset,
             filters=filters,
+            cursor=cursor,
         )
+    except ValueError as exc:
+        return {"statusCode": 400, "body": json.dumps({"error": str(exc)})}
     except Exception as exc:
         logger.exception("Query build error")
         return {"statusCode": 500, "body": json.dumps({"error": f"Database error: {exc}"})}
 
     if VIEW_CONFIG[view_name]["is_async"]:
+        export_format = (query_params.get("export_format") or "csv").lower()
+        if export_format not in EXPORT_FORMATS:
+            return {"statusCode": 400, "body": json.dumps({"error": f"Invalid export_format: {export_format}"})}
+        spectral_metadata = query_params.get("metadata")
+        try:
+            job_id, existing = exports.claim(sql, params, spectral_metadata, export_format)
+        except Exception:
+            logger.exception("Export dedup unavailable — enqueueing a new job")
+            job_id, existing = None, None
+        if existing is not None:
+            return {
+                "statusCode": 200,
+                "body": json.dumps(existing),
+                "headers": {"Content-Type": "application/json"},
+            }
+
+        # Large CSV exports fan out into key-range shards stitched back into one
+        # file by the worker; Parquet files can't be concatenated, so they don't.
+        # Any failure before the shards are sent falls back to a single job.
+        shard_queries = None
+        if export_format == "csv" and exports.enabled() and not (limit or offset or cursor):
+            try:
+                shard_plan = plan_shards(view_name, filters)
+                if shard_plan:
+                    row_count, ranges = shard_plan
+                    queries = [
+                        build_query(view_name, select_statement, filters=filters, key_range=key_range)
+                        for key_range in ranges
+                    ]
+                    job_id = job_id or str(uuid.uuid4())
+                    exports.register_parent(job_id, len(ranges), row_count)
+                    shard_queries = queries
+            except Exception:
+                logger.exception("Shard planning failed — exporting as a single job")
+
         try:
-            spectral_metadata = query_params.get("metadata")
-            job_id = send_sqs(sql, params, spectral_metadata, debug)
+            if shard_queries:
+                send_shard_jobs(job_id, shard_queries, spectral_metadata, debug, export_format)
+            else:
+                job_id = send_sqs(sql, params, spectral_metadata, debug, export_format, job_id=job_id)
         except Exception as exc:
             logger.exception("SQS error")
+            if job_id:
+                exports.release(job_id)
             return {"statusCode": 500, "body": json.dumps({"error": f"SQS error: {exc}"})}
         return {
             "statusCode": 200,
@@ -210,17 +303,27 @@ def handle_view_query(event, view_name):
             "headers": {"Content-Type": "application/json"},
         }
 
+    # arrow reads the cursor straight into record batches; other formats go via pandas
+    execute = execute_arrow if format_type == "arrow" else execute_query
     try:
-        df = execute_query(view_name=view_name, sql=sql, params=params, debug=debug)
+        df = execute(view_name=view_name, sql=sql, params=params, debug=debug)
     except Exception as exc:
         logger.exception("Database error")
         return {"statusCode": 500, "body": json.dumps({"error": f"Database error: {exc}"})}
 
-    if df.empty:
+    if len(df) == 0:
         return {"statusCode": 404, "body": json.dumps({"error": "No data found"})}
 
-    format_type = query_params.get("format", "json").lower()
-    return _format_response(df, view_name, format_type)
+    next_page = None
+    if paged and len(df) == limit:
+        next_page = next_cursor(view_name, df)
+    if key_extra:
+        df = df.drop_columns(key_extra) if format_type == "arrow" else df.drop(columns=key_extra)
+
+    response = _format_response(df, view_name, format_type, cursor=next_page)
+    if key is not None:
+        response_cache.put(key, response)
+    return response
 
 
 # ---------------------------------------------------------------------------
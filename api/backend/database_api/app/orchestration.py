@@ -4,12 +4,25 @@ orchestration.py — 4-stage linked plot / trait / granule query.
 Stage 1 : Spatial filter on plot_shape_view → all matching plot_ids + total_plots
 Stage 2 : Parallel COUNT queries (two separate DB connections) → total_traits,
           total_granules.  No data rows fetched yet.
-Stage 3 : Paginate plot_ids → plot_ids_page[offset:offset+limit]
+Stage 3 : Paginate plot_ids (ordered by plot_id) → plot_ids_page, either
+          [offset:offset+limit] or the `limit` plot_ids after a cursor
 Stage 4 : Parallel data queries for the page only (two separate DB connections):
             4a — plot geometries   (plot_shape_view)
             4b — trait rows        (trait_view)
             4c — granule rows      (granule_view CTE → pixel JOIN → array_agg)
 
+Two engines run stages 1–3 (body["engine"], default LINKED_QUERY_ENGINE):
+  staged — separate queries; plot_id lists round-trip through Python as
+           = ANY(%s) arrays and are intersected with sets.
+  cte    — one CTE chain computes the matched plot set, both totals and the
+           page slice server-side; only the page's plot_ids come back.
+
+Totals and the trait/granule narrowing are answered from vswir_plants.plot_summary
+(per-plot trait counts and granule ids, kept current by promotion) whenever the
+filters allow — so stages 1–3 never scan pixel, and trait_view only when trait
+filters go beyond the trait name. USE_PLOT_SUMMARY=false falls back to counting
+from the views.
+
 Granule queries use a CTE so the planner narrows granules BEFORE joining pixels.
 All filter clause building goes through build_where_clause / _build_array_in_clause
 — no hand-rolled SQL predicates.
@@ -17,17 +30,20 @@ All filter clause building goes through build_where_clause / _build_array_in_cla
 
 import logging
 import io
+import os
 import base64
+import bisect
 import concurrent.futures
-import shapely.geometry
 import shapely.wkt
 
 import geopandas as gpd
 import pandas as pd
 
+from app.cursor import encode_cursor, decode_cursor
 from app.db import get_connection
 from app.filter import build_where_clause
 from app.filter_utils import _build_array_in_clause
+from app.serialize import feature_collection, records
 
 logger = logging.getLogger("lambda_handler")
 
@@ -65,16 +81,17 @@ def _trait_where(trait_filters: dict, plot_ids: list):
     return build_where_clause("trait_view", filters)
 
 
-def _granule_cte_and_where(granule_filters: dict, plot_ids: list):
-    """
-    Return (cte_sql, where_sql, params) for the granule+pixel aggregation query.
+def _trait_filter_where(trait_filters: dict):
+    """WHERE clause + params for trait_view from the trait filters alone (no plot scoping)."""
+    filters = _remap_date_aliases(dict(trait_filters or {}), _TRAIT_DATE_ALIASES)
+    return build_where_clause("trait_view", filters)
 
-    The CTE narrows granule_view by any granule-column filters BEFORE the pixel
-    JOIN, so the planner touches only the relevant granule rows first.
 
-    pixel-side filter (px.plot_id = ANY(%s)) is appended after the CTE.
+def _filtered_granules_cte(granule_filters: dict):
+    """
+    Return (cte_body, params) for the `filtered_granules AS (...)` CTE, which
+    narrows granule_view by any granule-column filters.
     """
-    # Build granule-column WHERE via build_where_clause
     granule_fragment = ""
     granule_params: tuple = ()
     if granule_filters:
@@ -83,8 +100,7 @@ def _granule_cte_and_where(granule_filters: dict, plot_ids: list):
         if granule_where:
             granule_fragment = granule_where.lstrip().removeprefix("WHERE").strip()
 
-    cte_sql = f"""
-        WITH filtered_granules AS (
+    cte_body = f"""filtered_granules AS (
             SELECT
                 granule_id,
                 campaign_name,
@@ -96,6 +112,21 @@ def _granule_cte_and_where(granule_filters: dict, plot_ids: list):
             FROM vswir_plants.granule_view
             {"WHERE " + granule_fragment if granule_fragment else ""}
         )"""
+    return cte_body, list(granule_params)
+
+
+def _granule_cte_and_where(granule_filters: dict, plot_ids: list):
+    """
+    Return (cte_sql, where_sql, params) for the granule+pixel aggregation query.
+
+    The CTE narrows granule_view by any granule-column filters BEFORE the pixel
+    JOIN, so the planner touches only the relevant granule rows first.
+
+    pixel-side filter (px.plot_id = ANY(%s)) is appended after the CTE.
+    """
+    cte_body, granule_params = _filtered_granules_cte(granule_filters)
+    cte_sql = f"""
+        WITH {cte_body}"""
 
     # pixel-side clause
     px_clauses = []
@@ -104,7 +135,7 @@ def _granule_cte_and_where(granule_filters: dict, plot_ids: list):
     pixel_fragment = px_clauses[0].replace('"plot_id"', 'px.plot_id')
 
     # combined params: granule params bind into the CTE, pixel params into WHERE
-    params = list(granule_params) + px_params
+    params = granule_params + px_params
 
     return cte_sql, pixel_fragment, params
 
@@ -113,18 +144,22 @@ def _granule_cte_and_where(granule_filters: dict, plot_ids: list):
 # Stage 1 — spatial filter
 # ---------------------------------------------------------------------------
 
-def _stage1_plot_ids(geojson, campaign_name, conn):
-    """
-    Return all plot_ids matching the spatial + campaign filters.
-    Cheap: returns only integers via the GIST index on plot_shape.
-    """
+def _stage1_where(geojson, campaign_name):
+    """WHERE clause + params for the spatial + campaign filter on plot_shape_view."""
     filters = {}
     if campaign_name:
         filters["campaign_name"] = campaign_name
     if geojson:
         filters["geom"] = geojson
+    return build_where_clause("plot_shape_view", filters)
+
 
-    where_clause, where_params = build_where_clause("plot_shape_view", filters)
+def _stage1_plot_ids(geojson, campaign_name, conn):
+    """
+    Return all plot_ids matching the spatial + campaign filters.
+    Cheap: returns only integers via the GIST index on plot_shape.
+    """
+    where_clause, where_params = _stage1_where(geojson, campaign_name)
     sql = f"SELECT DISTINCT plot_id FROM vswir_plants.plot_shape_view{where_clause}"
     logger.debug("Stage 1 SQL: %s", sql)
 
@@ -196,6 +231,207 @@ def _count_granules(plot_ids, granule_filters):
     return int(df["n"].iloc[0])
 
 
+# ---------------------------------------------------------------------------
+# Stages 1b–2 from plot_summary (no pixel / trait_view scans)
+# ---------------------------------------------------------------------------
+
+USE_PLOT_SUMMARY = os.environ.get("USE_PLOT_SUMMARY", "true").lower() == "true"
+
+
+def _summary_trait_rows(trait_filters):
+    """
+    (sql_expr, params) for the number of matching trait_view rows a
+    plot_summary row (alias ps) stands for, or None when the filters need
+    trait_view itself. Only no filter, or a filter on trait alone, can be
+    answered from the summary's per-trait counts.
+    """
+    filters = _remap_date_aliases(dict(trait_filters or {}), _TRAIT_DATE_ALIASES)
+    filters = {k: v for k, v in filters.items() if v is not None}
+    traits  = filters.pop("trait", None)
+    if filters:
+        return None
+
+    # Same reading of the value as _build_string_clause: a scalar or a list,
+    # None entries dropped, an empty list meaning no filter.
+    if not isinstance(traits, list):
+        traits = [traits]
+    traits = [t for t in traits if t is not None]
+    if not traits:
+        return "ps.trait_rows", []
+    return (
+        "(SELECT COALESCE(SUM((ps.trait_counts ->> t)::bigint), 0) FROM unnest(%s::text[]) AS t)",
+        [traits],
+    )
+
+
+def _summary_granule_match(granule_filters):
+    """
+    (cte_sql, predicate, params): predicate on an unnested plot_summary
+    granule id `g` that keeps only granules passing granule_filters. The
+    filters only touch granule_view, one row per granule.
+    """
+    if not granule_filters:
+        return "", "TRUE", []
+    cte_body, params = _filtered_granules_cte(granule_filters)
+    return f"WITH {cte_body}", "g IN (SELECT granule_id FROM filtered_granules)", params
+
+
+def _summary_plot_ids_with_traits(plot_ids, trait_rows):
+    """_plot_ids_with_traits from plot_summary; trait_rows is from _summary_trait_rows."""
+    expr, expr_params = trait_rows
+    sql = f"SELECT ps.plot_id FROM vswir_plants.plot_summary ps WHERE ps.plot_id = ANY(%s) AND {expr} > 0"
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(sql, [list(plot_ids)] + expr_params)
+            return [r[0] for r in cur.fetchall()]
+
+
+def _summary_plot_ids_with_granules(plot_ids, granule_filters):
+    """_plot_ids_with_granules from plot_summary.granule_ids — no pixel join."""
+    cte_sql, predicate, params = _summary_granule_match(granule_filters)
+    sql = f"""
+        {cte_sql}
+        SELECT ps.plot_id FROM vswir_plants.plot_summary ps
+        WHERE ps.plot_id = ANY(%s)
+          AND EXISTS (SELECT 1 FROM unnest(ps.granule_ids) AS g WHERE {predicate})
+    """
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(sql, params + [list(plot_ids)])
+            return [r[0] for r in cur.fetchall()]
+
+
+def _summary_totals(plot_ids, trait_rows, granule_filters):
+    """
+    (total_traits, total_granules) for the matched plots in one query on
+    plot_summary. total_traits is None when trait_rows is None (the caller
+    counts on trait_view instead).
+    """
+    cte_sql, predicate, params = _summary_granule_match(granule_filters)
+    trait_sql, trait_params = trait_rows or ("0", [])
+    sql = f"""
+        {cte_sql}
+        SELECT
+            (SELECT COALESCE(SUM({trait_sql}), 0)
+               FROM vswir_plants.plot_summary ps WHERE ps.plot_id = ANY(%s)) AS total_traits,
+            (SELECT COUNT(DISTINCT g)
+               FROM vswir_plants.plot_summary ps, unnest(ps.granule_ids) AS g
+              WHERE ps.plot_id = ANY(%s) AND {predicate}) AS total_granules
+    """
+    logger.debug("Summary totals SQL: %s", sql)
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(sql, params + trait_params + [list(plot_ids), list(plot_ids)])
+            total_traits, total_granules = cur.fetchone()
+    return (int(total_traits) if trait_rows else None), int(total_granules)
+
+
+# ---------------------------------------------------------------------------
+# Stages 1–3 as one statement (engine="cte")
+# ---------------------------------------------------------------------------
+
+_CTE_SEPARATOR = ",\n        "
+
+
+def _cte_totals_and_page(geojson, campaign_name, trait_filters, granule_filters, limit, offset,
+                         after=None):
+    """
+    Run stage 1, the trait/granule narrowing, both COUNTs and the page slice as
+    a single CTE chain — one round trip, and only the page's plot_ids come back.
+
+    trait_matches and granule_matches are each referenced twice (narrowing and
+    totals), so Postgres materialises them once rather than rescanning. With
+    USE_PLOT_SUMMARY, granule_matches unnests plot_summary.granule_ids instead
+    of joining pixel, and trait_matches is replaced by the summary's trait
+    counts when the trait filters allow.
+
+    The page holds up to limit + 1 plot_ids so the caller can tell whether
+    another page follows.
+
+    Returns (total_plots, total_traits, total_granules, plot_ids_page).
+    """
+    stage1_where, stage1_params = _stage1_where(geojson, campaign_name)
+    trait_rows = _summary_trait_rows(trait_filters) if USE_PLOT_SUMMARY else None
+
+    ctes   = [f"stage1 AS (SELECT DISTINCT plot_id FROM vswir_plants.plot_shape_view{stage1_where})"]
+    params = list(stage1_params)
+
+    if trait_rows is None:
+        trait_where, trait_params = _trait_filter_where(trait_filters)
+        trait_scope = "plot_id IN (SELECT plot_id FROM stage1)"
+        trait_where = f"{trait_where} AND {trait_scope}" if trait_where else f" WHERE {trait_scope}"
+        ctes.append(f"trait_matches AS (SELECT plot_id FROM vswir_plants.trait_view{trait_where})")
+        params += list(trait_params)
+
+    if USE_PLOT_SUMMARY:
+        granule_cte, predicate, granule_params = _summary_granule_match(granule_filters)
+        if granule_cte:
+            ctes.append(granule_cte.removeprefix("WITH "))
+        ctes.append(
+            "summary AS (SELECT ps.* FROM vswir_plants.plot_summary ps"
+            " WHERE ps.plot_id IN (SELECT plot_id FROM stage1))"
+        )
+        ctes.append(
+            "granule_matches AS (SELECT ps.plot_id, g AS granule_id"
+            f" FROM summary ps, unnest(ps.granule_ids) AS g WHERE {predicate})"
+        )
+    else:
+        granules_cte, granule_params = _filtered_granules_cte(granule_filters)
+        ctes.append(granules_cte)
+        ctes.append("""granule_matches AS (
+            SELECT px.plot_id, fg.granule_id
+            FROM filtered_granules fg
+            JOIN vswir_plants.pixel px ON px.granule_id = fg.granule_id
+            WHERE px.plot_id IN (SELECT plot_id FROM stage1)
+        )""")
+    params += granule_params
+
+    narrowing = []
+    if trait_filters:
+        if trait_rows is None:
+            narrowing.append("s1.plot_id IN (SELECT plot_id FROM trait_matches)")
+        else:
+            narrowing.append(f"s1.plot_id IN (SELECT ps.plot_id FROM summary ps WHERE {trait_rows[0]} > 0)")
+            params += trait_rows[1]
+    if granule_filters:
+        narrowing.append("s1.plot_id IN (SELECT plot_id FROM granule_matches)")
+    ctes.append(f"""matched AS (
+            SELECT s1.plot_id FROM stage1 s1
+            {"WHERE " + " AND ".join(narrowing) if narrowing else ""}
+        )""")
+
+    if trait_rows is None:
+        total_traits = """(SELECT COUNT(*) FROM trait_matches
+              WHERE plot_id IN (SELECT plot_id FROM matched))"""
+    else:
+        total_traits = f"""(SELECT COALESCE(SUM({trait_rows[0]}), 0)::bigint FROM summary ps
+              WHERE ps.plot_id IN (SELECT plot_id FROM matched))"""
+        params += trait_rows[1]
+
+    sql = f"""
+        WITH {_CTE_SEPARATOR.join(ctes)}
+        SELECT
+            (SELECT COUNT(*) FROM matched) AS total_plots,
+            {total_traits} AS total_traits,
+            (SELECT COUNT(DISTINCT granule_id) FROM granule_matches
+              WHERE plot_id IN (SELECT plot_id FROM matched)) AS total_granules,
+            ARRAY(
+                SELECT plot_id FROM matched
+                {"WHERE plot_id > %s" if after is not None else ""}
+                ORDER BY plot_id LIMIT %s OFFSET %s
+            ) AS plot_ids_page
+    """
+    params += ([after] if after is not None else []) + [limit + 1, offset]
+    logger.debug("Linked CTE SQL: %s", sql)
+
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(sql, params)
+            total_plots, total_traits, total_granules, plot_ids_page = cur.fetchone()
+
+    return total_plots, total_traits, total_granules, list(plot_ids_page)
+
+
 # ---------------------------------------------------------------------------
 # Stage 4 — parallel data queries for the page (separate connections)
 # ---------------------------------------------------------------------------
@@ -231,26 +467,9 @@ def _fetch_plots(plot_ids_page, fmt):
         return {"plots_geoparquet": base64.b64encode(buf.getvalue()).decode()}
 
     if fmt in ("json", "geojson") and "geom" in df.columns:
-        features = []
-        for _, row in df.iterrows():
-            geom = row["geom"]
-            if isinstance(geom, str):
-                geom = shapely.wkt.loads(geom)
-            props = {k: (v.isoformat() if hasattr(v, "isoformat") else v)
-                     for k, v in row.drop("geom").items()}
-            features.append({
-                "type": "Feature",
-                "geometry": shapely.geometry.mapping(geom) if geom else None,
-                "properties": props,
-            })
-        return {"plots_geojson": {"type": "FeatureCollection", "features": features}}
-
-    records = df.to_dict(orient="records")
-    for row in records:
-        for k, v in row.items():
-            if hasattr(v, "isoformat"):
-                row[k] = v.isoformat()
-    return {"plots": records}
+        return {"plots_geojson": feature_collection(df)}
+
+    return {"plots": records(df)}
 
 
 def _fetch_traits(plot_ids_page, trait_filters):
@@ -314,20 +533,95 @@ def _fetch_granules(plot_ids_page, granule_filters):
                 lambda v: list(v) if hasattr(v, "__iter__") and not isinstance(v, str) else v
             )
 
-    records = []
-    for row in df.to_dict(orient="records"):
-        for key, val in row.items():
-            if hasattr(val, "isoformat"):
-                row[key] = val.isoformat()
-        records.append(row)
-
-    return records
+    return records(df)
 
 
 # ---------------------------------------------------------------------------
 # Public entry point
 # ---------------------------------------------------------------------------
 
+def _staged_totals_and_page(geojson, campaign_name, trait_filters, granule_filters, limit, offset,
+                            after=None):
+    """
+    Stages 1–3 as separate queries, with plot_id lists held in Python (engine="staged").
+
+    Like the cte engine, the page holds up to limit + 1 plot_ids.
+
+    Returns (total_plots, total_traits, total_granules, plot_ids_page).
+    """
+    # ------------------------------------------------------------------
+    # Stage 1 — spatial filter (single connection)
+    # ------------------------------------------------------------------
+    with get_connection() as conn:
+        all_plot_ids = _stage1_plot_ids(geojson, campaign_name, conn)
+
+    # Stage 1b — if trait or granule filters are provided, narrow plot_ids
+    # to only those that actually have matching traits / granules.
+    # Run in parallel when both filters are active.
+    trait_rows = _summary_trait_rows(trait_filters) if USE_PLOT_SUMMARY else None
+    if trait_rows:
+        with_traits, trait_arg = _summary_plot_ids_with_traits, trait_rows
+    else:
+        with_traits, trait_arg = _plot_ids_with_traits, trait_filters
+    with_granules = _summary_plot_ids_with_granules if USE_PLOT_SUMMARY else _plot_ids_with_granules
+
+    if trait_filters and granule_filters:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
+            tf = pool.submit(with_traits,   all_plot_ids, trait_arg)
+            gf = pool.submit(with_granules, all_plot_ids, granule_filters)
+            trait_plot_ids   = set(tf.result())
+            granule_plot_ids = set(gf.result())
+        all_plot_ids = [p for p in all_plot_ids if p in trait_plot_ids and p in granule_plot_ids]
+    elif trait_filters:
+        trait_plot_ids = set(with_traits(all_plot_ids, trait_arg))
+        all_plot_ids = [p for p in all_plot_ids if p in trait_plot_ids]
+    elif granule_filters:
+        granule_plot_ids = set(with_granules(all_plot_ids, granule_filters))
+        all_plot_ids = [p for p in all_plot_ids if p in granule_plot_ids]
+
+    total_plots = len(all_plot_ids)
+    if not all_plot_ids:
+        return 0, 0, 0, []
+
+    # ------------------------------------------------------------------
+    # Stage 2 — parallel COUNT queries (two separate connections)
+    # Counts are over the full matched plot set so pagination totals are accurate.
+    # With the summary both come from one plot_summary query, plus a
+    # trait_view COUNT only for trait filters the summary can't answer.
+    # ------------------------------------------------------------------
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
+        if USE_PLOT_SUMMARY:
+            summary_future     = pool.submit(_summary_totals, all_plot_ids, trait_rows, granule_filters)
+            trait_count_future = None if trait_rows else pool.submit(_count_traits, all_plot_ids, trait_filters)
+            total_traits, total_granules = summary_future.result()
+            if trait_count_future:
+                total_traits = trait_count_future.result()
+        else:
+            trait_count_future   = pool.submit(_count_traits,   all_plot_ids, trait_filters)
+            granule_count_future = pool.submit(_count_granules, all_plot_ids, granule_filters)
+            total_traits   = trait_count_future.result()
+            total_granules = granule_count_future.result()
+
+    # ------------------------------------------------------------------
+    # Stage 3 — paginate plot list
+    # ------------------------------------------------------------------
+    all_plot_ids.sort()
+    if after is not None:
+        offset = bisect.bisect_right(all_plot_ids, after)
+    plot_ids_page = all_plot_ids[offset: offset + limit + 1]
+
+    return total_plots, total_traits, total_granules, plot_ids_page
+
+
+_ENGINES = {
+    "staged": _staged_totals_and_page,
+    "cte":    _cte_totals_and_page,
+}
+
+# Default engine for stages 1–3; a request can override it with body["engine"].
+LINKED_QUERY_ENGINE = os.environ.get("LINKED_QUERY_ENGINE", "staged")
+
+
 def run_linked_query(body: dict) -> dict:
     """
     Execute the 4-stage linked query and return the assembled response body.
@@ -338,6 +632,9 @@ def run_linked_query(body: dict) -> dict:
     Stage 4 : Parallel data queries for page only (three connections) →
               plots, traits, granules
 
+    With engine="cte", stages 1–3 run as a single SQL statement and only the
+    page's plot_ids cross the wire; the response shape is identical.
+
     Parameters (all optional):
         campaign_name   : str
         geojson         : GeoJSON geometry dict
@@ -346,6 +643,9 @@ def run_linked_query(body: dict) -> dict:
         format          : str   — 'geoparquet' | 'geojson' | 'json'
         limit           : int   — plots per page (default 100)
         offset          : int   — plot page offset (default 0)
+        cursor          : str   — next_cursor from the previous page; resumes
+                                  after its last plot_id instead of using offset
+        engine          : str   — 'staged' | 'cte' (default LINKED_QUERY_ENGINE)
     """
     campaign_name   = body.get("campaign_name")
     geojson         = body.get("geojson")
@@ -354,58 +654,40 @@ def run_linked_query(body: dict) -> dict:
     fmt             = (body.get("format") or "json").lower()
     limit           = int(body.get("limit", 100))
     offset          = int(body.get("offset", 0))
+    engine          = (body.get("engine") or LINKED_QUERY_ENGINE).lower()
+    cursor          = body.get("cursor")
+
+    if engine not in _ENGINES:
+        raise ValueError(f"Unknown engine '{engine}'. Available engines: {sorted(_ENGINES)}")
+
+    after = None
+    if cursor:
+        if offset:
+            raise ValueError("cursor and offset cannot be combined")
+        (after,) = decode_cursor("query", str(cursor), 1)
+        if not isinstance(after, int):
+            raise ValueError("Invalid cursor")
+
+    total_plots, total_traits, total_granules, plot_ids_page = _ENGINES[engine](
+        geojson, campaign_name, trait_filters, granule_filters, limit, offset, after,
+    )
 
-    # ------------------------------------------------------------------
-    # Stage 1 — spatial filter (single connection)
-    # ------------------------------------------------------------------
-    with get_connection() as conn:
-        all_plot_ids = _stage1_plot_ids(geojson, campaign_name, conn)
-
-    # Stage 1b — if trait or granule filters are provided, narrow plot_ids
-    # to only those that actually have matching traits / granules.
-    # Run in parallel when both filters are active.
-    if trait_filters and granule_filters:
-        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
-            tf = pool.submit(_plot_ids_with_traits,   all_plot_ids, trait_filters)
-            gf = pool.submit(_plot_ids_with_granules, all_plot_ids, granule_filters)
-            trait_plot_ids   = set(tf.result())
-            granule_plot_ids = set(gf.result())
-        all_plot_ids = [p for p in all_plot_ids if p in trait_plot_ids and p in granule_plot_ids]
-    elif trait_filters:
-        trait_plot_ids = set(_plot_ids_with_traits(all_plot_ids, trait_filters))
-        all_plot_ids = [p for p in all_plot_ids if p in trait_plot_ids]
-    elif granule_filters:
-        granule_plot_ids = set(_plot_ids_with_granules(all_plot_ids, granule_filters))
-        all_plot_ids = [p for p in all_plot_ids if p in granule_plot_ids]
-
-    total_plots = len(all_plot_ids)
-
-    if not all_plot_ids:
+    if not total_plots:
         return {
             "total_plots":    0,
             "total_traits":   0,
             "total_granules": 0,
             "truncated":      False,
+            "next_cursor":    None,
             "plots":          [],
             "traits":         [],
             "granules":       [],
         }
 
-    # ------------------------------------------------------------------
-    # Stage 2 — parallel COUNT queries (two separate connections)
-    # Counts are over the full matched plot set so pagination totals are accurate.
-    # ------------------------------------------------------------------
-    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
-        trait_count_future   = pool.submit(_count_traits,   all_plot_ids, trait_filters)
-        granule_count_future = pool.submit(_count_granules, all_plot_ids, granule_filters)
-        total_traits   = trait_count_future.result()
-        total_granules = granule_count_future.result()
-
-    # ------------------------------------------------------------------
-    # Stage 3 — paginate plot list
-    # ------------------------------------------------------------------
-    truncated     = total_plots > (offset + limit)
-    plot_ids_page = all_plot_ids[offset: offset + limit]
+    # Engines return one plot_id past the page when more follow.
+    truncated     = len(plot_ids_page) > limit
+    plot_ids_page = plot_ids_page[:limit]
+    next_cursor   = encode_cursor("query", [plot_ids_page[-1]]) if truncated else None
 
     # ------------------------------------------------------------------
     # Stage 4 — parallel data queries for the page only (three connections)
@@ -419,8 +701,9 @@ def run_linked_query(body: dict) -> dict:
         page_granules = granules_future.result()
 
     logger.debug(
-        "Linked query: %d plots total (%d traits, %d granules), page %d-%d",
-        total_plots, total_traits, total_granules, offset, offset + limit,
+        "Linked query (%s): %d plots total (%d traits, %d granules), page of %d after %s",
+        engine, total_plots, total_traits, total_granules, len(plot_ids_page),
+        after if after is not None else f"offset {offset}",
     )
 
     response = {
@@ -428,6 +711,7 @@ def run_linked_query(body: dict) -> dict:
         "total_traits":   total_traits,
         "total_granules": total_granules,
         "truncated":      truncated,
+        "next_cursor":    next_cursor,
         "traits":         page_traits,
         "granules":       page_granules,
     }
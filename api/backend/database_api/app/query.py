@@ -1,28 +1,127 @@
+from __future__ import annotations
+
+import io
+import os
 import logging
-import pandas as pd
-import geopandas as gpd
+from functools import cache
+from app.cursor import encode_cursor, decode_cursor
 from app.db import get_connection
 from app.filter import build_where_clause
-from app.view_config import VIEW_CONFIG
+from app.serialize import records, _to_geometry_array
+from app.view_config import VIEW_CONFIG, get_order_key
 
 logger = logging.getLogger("lambda_handler")
 
+# Rows fetched from the server-side cursor per Arrow record batch.
+ARROW_BATCH_ROWS = int(os.environ.get("ARROW_BATCH_ROWS", "50000"))
+
+# Postgres type OID → Arrow type for execute_arrow. Text types become string
+# columns; anything else unlisted is a vswir_plants enum (psycopg2 returns the
+# label) and becomes a dictionary-encoded column — the Arrow equivalent of a
+# categorical, and what keeps the stream close to Parquet in size.
+#
+# pandas / geopandas / pyarrow / shapely are imported by the execute_* paths
+# only: build_query is also what the async export route uses, and that route
+# should not pay for loading them.
+@cache
+def _arrow_types() -> dict:
+    import pyarrow as pa
+
+    return {
+        16:   pa.bool_(),
+        20:   pa.int64(),
+        21:   pa.int16(),
+        23:   pa.int32(),
+        700:  pa.float32(),
+        701:  pa.float64(),
+        1700: pa.float64(),
+        1082: pa.date32(),
+        1083: pa.time64("us"),
+        1114: pa.timestamp("us"),
+        1184: pa.timestamp("us", tz="UTC"),
+        1005: pa.list_(pa.int16()),
+        1007: pa.list_(pa.int32()),
+        1016: pa.list_(pa.int64()),
+        1021: pa.list_(pa.float32()),
+        1022: pa.list_(pa.float64()),
+    }
+
+
+_TEXT_OIDS   = {19, 25, 1042, 1043}
+_NUMERIC_OID = 1700
+
+_GEOARROW_WKB = {
+    b"ARROW:extension:name":     b"geoarrow.wkb",
+    b"ARROW:extension:metadata": b'{"crs":"EPSG:4326","crs_type":"authority_code"}',
+}
+
+
+def _order_key_sql(view_name: str) -> list:
+    """Quoted order_key expressions; nullable columns compare as '' so row comparisons stay total."""
+    columns = VIEW_CONFIG[view_name]["columns"]
+    return [
+        f'COALESCE("{col}"::text, \'\')' if columns[col].get("nullable") else f'"{col}"'
+        for col in get_order_key(view_name)
+    ]
 
-def build_query(view_name: str, select_statement: str, limit: int = None, offset: int = 0, filters: dict = None):
+
+def next_cursor(view_name: str, df) -> str:
+    """
+    Cursor resuming after the last row of df — a DataFrame or an Arrow table
+    from execute_arrow — which must include the order_key columns.
+    """
+    key_cols = list(get_order_key(view_name))
+    if not hasattr(df, "iloc"):     # Arrow table
+        last = df.select(key_cols).slice(df.num_rows - 1).to_pylist()[0]
+    else:
+        last = records(df[key_cols].iloc[[-1]])[0]
+    nullable = {c for c in key_cols if VIEW_CONFIG[view_name]["columns"][c].get("nullable")}
+    return encode_cursor(view_name, ["" if c in nullable and last[c] is None else last[c] for c in key_cols])
+
+
+def build_query(view_name: str, select_statement: str, limit: int = None, offset: int = 0,
+                filters: dict = None, cursor: str = None, key_range: tuple = None):
+    """
+    Build the SELECT for a view query.
+
+    Limited or cursor-paged queries are ordered by the view's order_key so pages
+    are stable. With a cursor the page starts after the encoded key (keyset
+    pagination) instead of skipping rows with OFFSET, so every page costs the
+    same as the first.
+
+    key_range=(lo, hi) restricts rows to lo <= order_key < hi on a view with a
+    single-column order_key — one shard of a fanned-out export (shards.py).
+    """
     if view_name not in VIEW_CONFIG:
         raise ValueError(f"View '{view_name}' is not allowed.")
 
     sql = f'SELECT {select_statement} FROM "{view_name}"'
     params = []
 
+    where_clause = ""
     if filters:
         where_clause, where_params = build_where_clause(view_name, filters)
-        sql += where_clause
         if isinstance(where_params, (tuple, list)):
             params.extend(where_params)
         else:
             params.append(where_params)
 
+    order_key = _order_key_sql(view_name)
+    if cursor:
+        after = decode_cursor(view_name, cursor, len(order_key))
+        keyset = f"({', '.join(order_key)}) > ({', '.join(['%s'] * len(order_key))})"
+        where_clause = f"{where_clause} AND {keyset}" if where_clause else f" WHERE {keyset}"
+        params.extend(after)
+    if key_range:
+        (key,) = order_key
+        bounds = f"{key} >= %s AND {key} < %s"
+        where_clause = f"{where_clause} AND {bounds}" if where_clause else f" WHERE {bounds}"
+        params.extend(key_range)
+    sql += where_clause
+
+    if (limit or cursor) and order_key:
+        sql += " ORDER BY " + ", ".join(order_key)
+
     if limit:
         sql += " LIMIT %s"
         params.append(int(limit))
@@ -38,7 +137,98 @@ def build_query(view_name: str, select_statement: str, limit: int = None, offset
     return sql, params
 
 
+def _copy_types(description, has_geo: bool) -> dict:
+    """
+    Column → Arrow type for reading COPY CSV output. Geometry, enums and arrays
+    are read as strings (hex EWKB / labels / '{...}' literals) and fixed up after.
+    """
+    import pyarrow as pa
+
+    types = {}
+    for col in description:
+        arrow_type = _arrow_types().get(col.type_code)
+        if arrow_type is None or pa.types.is_list(arrow_type) or (has_geo and col.name == "geom"):
+            arrow_type = pa.string()
+        types[col.name] = arrow_type
+    return types
+
+
+def _parse_pg_arrays(col: pa.ChunkedArray, list_type: pa.DataType) -> pa.ChunkedArray:
+    """'{1.5,2,3}' array literals → Arrow list column, split and cast in bulk."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    inner = pc.utf8_trim(col, characters="{}")
+    parts = pc.split_pattern(inner, pattern=",")
+    empty = pa.scalar([], type=pa.list_(pa.string()))
+    return pc.if_else(pc.equal(inner, ""), empty, parts).cast(list_type)
+
+
+def _copy_table(conn, view_name: str, sql: str, params: list):
+    """
+    query_engine="copy": stream the result with COPY (...) TO STDOUT as CSV and
+    decode it in bulk with pyarrow.csv, typed from the result's column OIDs —
+    no per-value Python objects for numeric/date columns, and FLOAT4 stays float32.
+
+    Returns (Arrow table, cursor description); geometry is still hex EWKB text.
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+
+    has_geo = VIEW_CONFIG[view_name]["has_geo"]
+
+    with conn.cursor() as cur:
+        cur.execute("SET LOCAL DateStyle = 'ISO, YMD'")
+        cur.execute(f"SELECT * FROM ({sql}) AS q LIMIT 0", params)
+        description = cur.description
+        buf = io.BytesIO()
+        cur.copy_expert(
+            f"COPY ({cur.mogrify(sql, params).decode()}) TO STDOUT WITH (FORMAT csv)", buf
+        )
+
+    names = [col.name for col in description]
+    types = _copy_types(description, has_geo)
+    if buf.tell() == 0:
+        table = pa.table({n: pa.array([], type=types[n]) for n in names})
+    else:
+        buf.seek(0)
+        table = pa_csv.read_csv(
+            buf,
+            read_options=pa_csv.ReadOptions(column_names=names),
+            convert_options=pa_csv.ConvertOptions(
+                column_types=types,
+                null_values=[""],
+                strings_can_be_null=True,
+                quoted_strings_can_be_null=False,
+                true_values=["t"],
+                false_values=["f"],
+            ),
+        )
+
+    for i, col in enumerate(description):
+        arrow_type = _arrow_types().get(col.type_code)
+        if arrow_type is not None and pa.types.is_list(arrow_type):
+            table = table.set_column(i, col.name, _parse_pg_arrays(table[col.name], arrow_type))
+
+    return table, description
+
+
+def _copy_frame(conn, view_name: str, sql: str, params: list) -> pd.DataFrame:
+    """_copy_table as a DataFrame (GeoDataFrame for has_geo views)."""
+    import geopandas as gpd
+
+    table, _ = _copy_table(conn, view_name, sql, params)
+    df = table.to_pandas()
+    if VIEW_CONFIG[view_name]["has_geo"] and "geom" in df.columns:
+        df["geom"] = _to_geometry_array(df["geom"].to_numpy())
+        df = gpd.GeoDataFrame(df, geometry="geom", crs="EPSG:4326")
+    return df
+
+
 def execute_query(view_name: str, sql: str, params: list, debug: bool = False):
+    import geopandas as gpd
+    import pandas as pd
+
     logger.debug("Executing query on view: %s", view_name)
     logger.debug("SQL: %s", sql)
     logger.debug("Params: %s", params)
@@ -46,8 +236,13 @@ def execute_query(view_name: str, sql: str, params: list, debug: bool = False):
     has_geo = VIEW_CONFIG[view_name]["has_geo"]
     logger.debug("Returning GeoDataFrame: %s", has_geo)
 
+    engine = VIEW_CONFIG[view_name].get("query_engine", "pandas")
+    logger.debug("Query engine: %s", engine)
+
     with get_connection() as conn:
-        if has_geo:
+        if engine == "copy":
+            df = _copy_frame(conn, view_name, sql, params)
+        elif has_geo:
             try:
                 df = gpd.read_postgis(sql, conn, geom_col="geom", params=params)
             except ValueError:
@@ -59,3 +254,93 @@ def execute_query(view_name: str, sql: str, params: list, debug: bool = False):
 
     logger.debug("Query returned %d rows", len(df))
     return df
+
+
+def _arrow_schema(description, has_geo: bool) -> pa.Schema:
+    import pyarrow as pa
+
+    arrow_types = _arrow_types()
+    fields = []
+    for col in description:
+        if has_geo and col.name == "geom":
+            fields.append(pa.field("geom", pa.binary(), metadata=_GEOARROW_WKB))
+        elif col.type_code in arrow_types:
+            fields.append(pa.field(col.name, arrow_types[col.type_code]))
+        elif col.type_code in _TEXT_OIDS:
+            fields.append(pa.field(col.name, pa.string()))
+        else:
+            fields.append(pa.field(col.name, pa.dictionary(pa.int32(), pa.string())))
+    return pa.schema(fields)
+
+
+def _record_batch(rows: list, schema: pa.Schema, numeric: set) -> pa.RecordBatch:
+    """Transpose one fetchmany() page into Arrow arrays, one column at a time."""
+    import pyarrow as pa
+    import shapely
+
+    arrays = []
+    for i, (field, values) in enumerate(zip(schema, zip(*rows))):
+        if field.metadata == _GEOARROW_WKB:
+            wkb = shapely.to_wkb(_to_geometry_array(values), flavor="iso")
+            arrays.append(pa.array(wkb, type=pa.binary()))
+        elif i in numeric:
+            arrays.append(pa.array([None if v is None else float(v) for v in values], type=field.type))
+        else:
+            arrays.append(pa.array(values, type=field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def _conform_copy_table(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    """Bring a _copy_table result to the execute_arrow schema (WKB geometry, dictionary enums)."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import shapely
+
+    columns = []
+    for field, col in zip(schema, table.columns):
+        if field.metadata == _GEOARROW_WKB:
+            wkb = shapely.to_wkb(_to_geometry_array(col.to_numpy(zero_copy_only=False)), flavor="iso")
+            col = pa.array(wkb, type=pa.binary())
+        elif pa.types.is_dictionary(field.type):
+            col = pc.dictionary_encode(col)
+        columns.append(col)
+    return pa.Table.from_arrays(columns, schema=schema).unify_dictionaries()
+
+
+def execute_arrow(view_name: str, sql: str, params: list, debug: bool = False) -> pa.Table:
+    """
+    Run the query and build an Arrow table straight from the cursor — no
+    DataFrame in between. Rows are pulled from a server-side cursor
+    ARROW_BATCH_ROWS at a time and converted to one record batch per page
+    (query_engine="copy" views read via _copy_table instead); geometry becomes
+    ISO WKB tagged with GeoArrow extension metadata.
+    """
+    import pyarrow as pa
+
+    logger.debug("Executing Arrow query on view: %s", view_name)
+    logger.debug("SQL: %s", sql)
+    logger.debug("Params: %s", params)
+
+    has_geo = VIEW_CONFIG[view_name]["has_geo"]
+    batches = []
+
+    if VIEW_CONFIG[view_name].get("query_engine") == "copy":
+        with get_connection() as conn:
+            table, description = _copy_table(conn, view_name, sql, params)
+        return _conform_copy_table(table, _arrow_schema(description, has_geo))
+
+    with get_connection() as conn:
+        with conn.cursor(name="arrow_cursor") as cur:
+            cur.itersize = ARROW_BATCH_ROWS
+            cur.execute(sql, params)
+            rows    = cur.fetchmany(ARROW_BATCH_ROWS)
+            schema  = _arrow_schema(cur.description, has_geo)
+            numeric = {i for i, col in enumerate(cur.description) if col.type_code == _NUMERIC_OID}
+            while rows:
+                batches.append(_record_batch(rows, schema, numeric))
+                rows = cur.fetchmany(ARROW_BATCH_ROWS)
+
+    # One dictionary per enum column across all batches
+    table = pa.Table.from_batches(batches, schema=schema).unify_dictionaries()
+    logger.debug("Arrow query returned %d rows in %d batches", table.num_rows, len(batches))
+    return table
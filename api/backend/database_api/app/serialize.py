@@ -0,0 +1,151 @@
+"""
+serialize.py — columnar JSON / GeoJSON / Arrow serialisation shared by main.py,
+query.py and orchestration.py.
+
+The whole geometry column is converted in one pass with shapely's vectorised
+to_geojson, and properties are made JSON-safe column by column rather than
+row by row. No iterrows / per-row shapely.geometry.mapping calls.
+
+numpy / pandas / pyarrow / shapely are imported inside the functions that use
+them: dumps() is on every response path, including ones that never build a
+DataFrame, and must not pull them into a cold start.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import string
+
+_HEX_DIGITS = set(string.hexdigits)
+
+
+def _to_geometry_array(values) -> np.ndarray:
+    """
+    Coerce a geometry column to a numpy array of shapely geometries.
+
+    Accepts shapely objects (GeoSeries from read_postgis), hex WKB strings
+    (plain read_sql on a PostGIS column), raw WKB bytes or WKT strings.
+    Missing values stay None.
+    """
+    import numpy as np
+    import pandas as pd
+    import shapely
+
+    arr = np.asarray(values, dtype=object)
+    present = pd.notna(arr)
+    if not present.any():
+        return np.full(len(arr), None, dtype=object)
+
+    sample = arr[present][0]
+    out = np.full(len(arr), None, dtype=object)
+    if isinstance(sample, shapely.Geometry):
+        out[present] = arr[present]
+    elif isinstance(sample, (bytes, memoryview)):
+        out[present] = shapely.from_wkb(arr[present])
+    elif isinstance(sample, str) and set(sample) <= _HEX_DIGITS:
+        out[present] = shapely.from_wkb(arr[present])
+    else:
+        out[present] = shapely.from_wkt(arr[present])
+    return out
+
+
+def _json_safe_column(col: pd.Series) -> list:
+    """Return a column as a list of JSON-safe Python values (NaN/NaT → None, dates → ISO)."""
+    import numpy as np
+    import pandas as pd
+
+    if pd.api.types.is_datetime64_any_dtype(col):
+        return [None if pd.isna(v) else v.isoformat() for v in col]
+
+    if pd.api.types.is_bool_dtype(col) or pd.api.types.is_integer_dtype(col):
+        if col.hasnans:
+            return col.astype(object).where(col.notna(), None).tolist()
+        return col.tolist()
+
+    if pd.api.types.is_float_dtype(col):
+        if col.dtype == np.float32:
+            # widen via the shortest float32 repr so FLOAT4 values print as
+            # stored (0.1, not 0.10000000149011612)
+            values = col.to_numpy().astype("U").astype(float)
+        else:
+            values = col.to_numpy(dtype=float, na_value=np.nan)
+        return [None if not math.isfinite(v) else v for v in values.tolist()]
+
+    out = col.tolist()
+    for i, v in enumerate(out):
+        if v is None:
+            continue
+        if isinstance(v, float) and not math.isfinite(v):
+            out[i] = None
+        elif hasattr(v, "isoformat"):
+            out[i] = v.isoformat()
+        elif isinstance(v, np.generic):
+            out[i] = v.item()
+    return out
+
+
+def records(df: pd.DataFrame) -> list[dict]:
+    """DataFrame → list of JSON-safe row dicts, built column-wise."""
+    names   = list(df.columns)
+    columns = [_json_safe_column(df[c]) for c in names]
+    return [dict(zip(names, row)) for row in zip(*columns)]
+
+
+class RawJSON(str):
+    """An already-encoded JSON fragment; spliced verbatim by dumps()."""
+
+
+def feature_collection(df: pd.DataFrame, geom_col: str = "geom") -> RawJSON:
+    """
+    DataFrame/GeoDataFrame → GeoJSON FeatureCollection as an encoded string.
+
+    Geometry is encoded for the whole column with shapely.to_geojson and the
+    resulting strings are spliced directly into the output — coordinates are
+    never round-tripped through Python lists and json.dumps.
+    """
+    import shapely
+
+    geoms      = _to_geometry_array(df[geom_col].to_numpy())
+    geo_json   = shapely.to_geojson(geoms)
+    properties = records(df.drop(columns=[geom_col]))
+
+    features = ",".join(
+        '{"type": "Feature", "geometry": '
+        + (g if g is not None else "null")
+        + ', "properties": '
+        + json.dumps(p, default=str)
+        + "}"
+        for g, p in zip(geo_json, properties)
+    )
+    return RawJSON('{"type": "FeatureCollection", "features": [' + features + "]}")
+
+
+def dumps(body: dict, default=None) -> str:
+    """
+    json.dumps for a response dict whose top-level values may be RawJSON
+    fragments (e.g. plots_geojson from orchestration._fetch_plots).
+    """
+    raw  = {k: v for k, v in body.items() if isinstance(v, RawJSON)}
+    text = json.dumps({k: v for k, v in body.items() if k not in raw}, default=default)
+    if not raw:
+        return text
+    spliced = ", ".join(f"{json.dumps(k)}: {v}" for k, v in raw.items())
+    return text[:-1] + (", " if len(text) > 2 else "") + spliced + "}"
+
+
+def arrow_stream(table: pa.Table) -> bytes:
+    """
+    Arrow table → Arrow IPC stream bytes, one message per record batch.
+
+    Buffers are zstd-compressed (part of the IPC format, read transparently by
+    pyarrow / R arrow): repetitive string columns would otherwise make the
+    stream an order of magnitude larger than the equivalent Parquet.
+    """
+    import pyarrow as pa
+
+    sink    = pa.BufferOutputStream()
+    options = pa.ipc.IpcWriteOptions(compression="zstd")
+    with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
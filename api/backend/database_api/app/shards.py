@@ -0,0 +1,111 @@
+"""
+shards.py — fan-out planning for large async CSV exports.
+
+A whole-campaign spectra export is too much for one worker Lambda (one core,
+15-minute limit). Views with a `shard_table` in VIEW_CONFIG are split into
+contiguous ranges of their integer order_key (pixel_id), each exported by its
+own worker; the last shard to finish stitches the shard files into one object
+(worker_lambda/app/shards.py).
+
+Planning runs before the API responds, so it works from statistics. The
+planner's row estimate for the export (EXPLAIN, not executed) decides whether
+to fan out at all, so small exports cost no scan. Only exports big enough to
+shard read min / max of the key over their filters. That query runs under
+EXPORT_PLAN_TIMEOUT_MS, and if it is cancelled the export runs as one job. The
+cuts come from the shard table's pg_stats histogram on the key. The histogram
+is equi-depth, so cutting at evenly spaced bounds inside [min, max] gives
+shards of roughly equal row counts. If the range is too narrow for the
+histogram to resolve, it is cut evenly by key value instead.
+
+Env: EXPORT_SHARD_ROWS (target rows per shard, 0 disables fan-out),
+EXPORT_MAX_SHARDS and EXPORT_PLAN_TIMEOUT_MS.
+"""
+
+import os
+import math
+import logging
+
+import psycopg2.errors
+
+from app.db import get_connection
+from app.query import build_query
+from app.view_config import VIEW_CONFIG, get_order_key
+
+logger = logging.getLogger("lambda_handler")
+
+SHARD_ROWS = int(os.environ.get("EXPORT_SHARD_ROWS", "150000"))
+MAX_SHARDS = int(os.environ.get("EXPORT_MAX_SHARDS", "16"))
+PLAN_TIMEOUT_MS = int(os.environ.get("EXPORT_PLAN_TIMEOUT_MS", "5000"))
+
+
+def _cut_points(lo: int, hi: int, shard_count: int, histogram: list) -> list:
+    """shard_count - 1 increasing cut points strictly inside (lo, hi]."""
+    inside = sorted({b for b in histogram if lo < b <= hi})
+    if len(inside) >= shard_count - 1:
+        step = len(inside) / shard_count
+        cuts = [inside[int(step * i)] for i in range(1, shard_count)]
+    else:
+        span = hi - lo + 1
+        cuts = [lo + span * i // shard_count for i in range(1, shard_count)]
+    return sorted({c for c in cuts if lo < c <= hi})
+
+
+def _estimate_rows(cur, view_name: str, filters: dict | None, key: str) -> int:
+    """Planner row estimate for the export's rows (EXPLAIN, not executed)."""
+    sql, params = build_query(view_name=view_name, select_statement=f'"{key}"', filters=filters)
+    cur.execute("EXPLAIN (FORMAT JSON) " + sql, params)
+    return int(cur.fetchone()[0][0]["Plan"]["Plan Rows"])
+
+
+def plan_shards(view_name: str, filters: dict | None) -> tuple[int, list] | None:
+    """
+    Split an export into key ranges.
+
+    Returns (estimated_row_count, [(lo, hi), ...]) with half-open ranges
+    lo <= key < hi covering every matching row, or None when the view can't be
+    sharded, the export is estimated small enough for a single worker, or its
+    key bounds could not be read within EXPORT_PLAN_TIMEOUT_MS.
+    """
+    table = VIEW_CONFIG[view_name].get("shard_table")
+    if not table or SHARD_ROWS <= 0:
+        return None
+    (key,) = get_order_key(view_name)
+
+    sql, params = build_query(
+        view_name=view_name,
+        select_statement=f'min("{key}"), max("{key}")',
+        filters=filters,
+    )
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            row_count   = _estimate_rows(cur, view_name, filters, key)
+            shard_count = min(MAX_SHARDS, math.ceil(row_count / SHARD_ROWS))
+            if shard_count < 2:
+                return None
+
+            try:
+                cur.execute("SET LOCAL statement_timeout = %s", (PLAN_TIMEOUT_MS,))
+                cur.execute(sql, params)
+                lo, hi = cur.fetchone()
+            except psycopg2.errors.QueryCanceled:
+                logger.warning("Shard planning: key bounds not read within %d ms", PLAN_TIMEOUT_MS)
+                conn.rollback()
+                return None
+            if lo is None:
+                return None
+
+            cur.execute(
+                """
+                SELECT histogram_bounds::text::bigint[]
+                FROM pg_stats
+                WHERE schemaname = 'vswir_plants' AND tablename = %s AND attname = %s
+                """,
+                (table, key),
+            )
+            stats = cur.fetchone()
+
+    cuts   = _cut_points(lo, hi, shard_count, (stats and stats[0]) or [])
+    edges  = [lo, *cuts, hi + 1]
+    ranges = list(zip(edges[:-1], edges[1:]))
+    logger.debug("Export of ~%d rows split into %d shards: %s", row_count, len(ranges), ranges)
+    return row_count, ranges
@@ -1,4 +1,3 @@
-import boto3
 import json
 import uuid
 import os
@@ -11,23 +10,34 @@ logger = logging.getLogger("lambda_handler")
 # -----------------------------
 queue_url = os.environ['SQS_QUEUE_URL']
 region = os.environ['AWS_REGION']
-sqs = boto3.client("sqs", region_name=region)
+_sqs = None
 
-def send_sqs(sql, params, metadata=None, debug=False):
-    job_id = str(uuid.uuid4())
+
+def _client():
+    """The SQS client, created on the first enqueue — sync routes never need it."""
+    global _sqs
+    if _sqs is None:
+        import boto3
+        _sqs = boto3.client("sqs", region_name=region)
+    return _sqs
+
+
+def send_sqs(sql, params, metadata=None, debug=False, export_format="csv", job_id=None):
+    job_id = job_id or str(uuid.uuid4())
     
     message_body = {
         "job_id": job_id,
         "sql_query": sql,
         "params": params,
         "spectral_metadata": metadata,
+        "format": export_format,
         "debug": debug
     }
 
     logger.debug(f"SQS URL: {queue_url}")
     logger.debug(f"Generated SQS message: {message_body}")
     
-    response = sqs.send_message(
+    response = _client().send_message(
         QueueUrl=queue_url,
         MessageBody=json.dumps(message_body)
     )
@@ -35,3 +45,37 @@ def send_sqs(sql, params, metadata=None, debug=False):
     logger.debug(f"SQS Response: {response}")
     
     return job_id
+
+
+def shard_job_id(parent_job_id, index):
+    return f"{parent_job_id}.{index:03d}"
+
+
+def send_shard_jobs(parent_job_id, shard_queries, metadata=None, debug=False, export_format="csv"):
+    """
+    Enqueue one message per shard of a fanned-out export. shard_queries is a
+    list of (sql, params), one per key range, in key order.
+    """
+    entries = []
+    for index, (sql, params) in enumerate(shard_queries):
+        entries.append({
+            "Id": str(index),
+            "MessageBody": json.dumps({
+                "job_id": shard_job_id(parent_job_id, index),
+                "sql_query": sql,
+                "params": params,
+                "spectral_metadata": metadata,
+                "format": export_format,
+                "debug": debug,
+                "shard": {"parent_job_id": parent_job_id, "index": index, "count": len(shard_queries)},
+            }),
+        })
+
+    # SendMessageBatch takes at most 10 entries
+    for start in range(0, len(entries), 10):
+        response = _client().send_message_batch(QueueUrl=queue_url, Entries=entries[start:start + 10])
+        if response.get("Failed"):
+            raise RuntimeError(f"Failed to enqueue shards: {response['Failed']}")
+
+    logger.debug(f"Enqueued {len(entries)} shard jobs for parent {parent_job_id}")
+    return parent_job_id
@@ -8,10 +8,19 @@
 #   is_async    (bool)  — whether queries are dispatched via SQS
 #   date_column (str)   — column used for start_date/end_date range filters
 #                         (omit if the view has no date range filter)
+#   order_key   (tuple) — columns that uniquely order the view's rows; paged
+#                         queries ORDER BY it and cursors resume after it
+#   query_engine (str)  — "pandas" (default: read_sql / read_postgis) or "copy"
+#                         (COPY ... TO STDOUT decoded in bulk by pyarrow; for
+#                         views that return large result sets)
+#   shard_table (str)   — async views only: table whose pg_stats histogram on
+#                         the (single, integer) order_key column guides
+#                         splitting large CSV exports into key-range shards
 #   columns     (dict)  — every column the view exposes:
 #       type        : "string" | "numeric" | "boolean" | "date" | "array" | "geom"
 #       filterable  : True if the column can be used as a filter
 #       selectable  : True if the column can be requested in a SELECT
+#       nullable    : True if an order_key column can be NULL (optional)
 # ============================================================================
 
 VIEW_CONFIG = {
@@ -22,6 +31,7 @@ VIEW_CONFIG = {
     "plot_shape_view": {
         "has_geo":     True,
         "is_async":    False,
+        "order_key":   ("plot_id", "plot_shape_id"),
         "columns": {
             "plot_id":          {"type": "numeric", "filterable": True,  "selectable": True},
             "campaign_name":    {"type": "string",  "filterable": True,  "selectable": True},
@@ -37,6 +47,8 @@ VIEW_CONFIG = {
         "has_geo":     False,
         "is_async":    False,
         "date_column": "collection_date",
+        "order_key":   ("plot_id", "collection_date", "sample_name", "trait"),
+        "query_engine": "copy",
         "columns": {
             "plot_id":             {"type": "array",   "filterable": True,  "selectable": True},
             "campaign_name":       {"type": "string",  "filterable": True,  "selectable": True},
@@ -54,7 +66,7 @@ VIEW_CONFIG = {
             "subplot_cover_method":{"type": "string",  "filterable": True,  "selectable": True},
             "floristic_survey":    {"type": "boolean", "filterable": True,  "selectable": True},
             "plot_method":         {"type": "string",  "filterable": True,  "selectable": True},
-            "trait":               {"type": "string",  "filterable": True,  "selectable": True},
+            "trait":               {"type": "string",  "filterable": True,  "selectable": True, "nullable": True},
             "value":               {"type": "numeric", "filterable": True,  "selectable": True},
             "units":               {"type": "string",  "filterable": True,  "selectable": True},
             "method":              {"type": "string",  "filterable": True,  "selectable": True},
@@ -68,6 +80,7 @@ VIEW_CONFIG = {
         "has_geo":     False,
         "is_async":    False,
         "date_column": "acquisition_date",
+        "order_key":   ("granule_id",),
         "columns": {
             "granule_id":            {"type": "string",  "filterable": True,  "selectable": True},
             "campaign_name":         {"type": "string",  "filterable": True,  "selectable": True},
@@ -88,6 +101,8 @@ VIEW_CONFIG = {
     "extracted_spectra_view": {
         "has_geo":  False,
         "is_async": True,
+        "order_key":   ("pixel_id",),
+        "shard_table": "extracted_spectra",
         "columns": {
             "pixel_id":              {"type": "numeric", "filterable": True,  "selectable": True},
             "campaign_name":         {"type": "string",  "filterable": True,  "selectable": True},
@@ -117,6 +132,8 @@ VIEW_CONFIG = {
     "reflectance_view": {
         "has_geo":  False,
         "is_async": True,
+        "order_key":   ("pixel_id",),
+        "shard_table": "output_pixel_rfl",
         "columns": {
             "pixel_id":              {"type": "numeric", "filterable": True,  "selectable": True},
             "campaign_name":         {"type": "string",  "filterable": True,  "selectable": True},
@@ -137,6 +154,7 @@ VIEW_CONFIG = {
     "extracted_metadata_view": {
         "has_geo":  False,
         "is_async": False,
+        "order_key":   ("campaign_name", "sensor_name"),
         "columns": {
             "campaign_name":    {"type": "string",  "filterable": True,  "selectable": True},
             "sensor_name":      {"type": "string",  "filterable": True,  "selectable": True},
@@ -166,3 +184,7 @@ def get_field_type(view_name: str, col: str) -> str:
 
 def get_date_column(view_name: str):
     return VIEW_CONFIG[view_name].get("date_column")
+
+
+def get_order_key(view_name: str) -> tuple:
+    return VIEW_CONFIG[view_name].get("order_key", ())
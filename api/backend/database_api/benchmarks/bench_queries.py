@@ -0,0 +1,247 @@
+"""
+Latency and memory benchmarks for the database API query paths.
+
+Runs each scenario against a local Postgres + PostGIS loaded by
+synthetic_data.py and reports p50 / p95 wall time and peak RSS. Scenarios:
+
+    view:<view>:<format>      POST /query/<view> through lambda_handler
+                              (build_query → execute → _format_response)
+    linked:<engine>:<format>  POST /query through lambda_handler (run_linked_query)
+    format:<view>:<format>    _format_response alone, on rows fetched up front
+    geojson:plot_shape_view:<impl>
+                              a GeoJSON FeatureCollection body from the same
+                              plot_shape_view rows, fetched up front: iterrows
+                              is the per-row serialiser serialize.py replaced,
+                              columnar is serialize.feature_collection
+
+Scenarios that serialise rows fetched up front also report rows/s (rows / p50).
+
+Each scenario runs in its own subprocess, so peak RSS is that scenario's own
+high-water mark, imports included. The response cache is disabled
+(RESPONSE_CACHE_TTL=0) unless --cache is given. Async views are skipped —
+they only enqueue to SQS.
+
+--save writes the results as JSON; --baseline compares against a saved run
+and exits non-zero if any scenario's p95 or peak RSS grew by more than
+--tolerance.
+
+    cd api/backend/database_api
+    DB_HOST=localhost python benchmarks/synthetic_data.py --reset
+    DB_HOST=localhost python benchmarks/bench_queries.py --save before.json
+    DB_HOST=localhost python benchmarks/bench_queries.py --baseline before.json -k view:trait_view
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from synthetic_data import CAMPAIGNS  # noqa: E402
+
+VIEW_FORMATS   = ("json", "parquet", "arrow")
+LINKED_FORMATS = ("json", "geojson", "geoparquet")
+LINKED_ENGINES = ("staged", "cte")
+GEOJSON_IMPLS  = ("iterrows", "columnar")
+
+
+def _local_env(cache: bool) -> None:
+    """Settings the app reads at import, pointed at nothing outside this machine."""
+    os.environ.setdefault("DB_HOST", "localhost")
+    os.environ.setdefault("AWS_REGION", "us-west-2")
+    os.environ.setdefault("SQS_QUEUE_URL", "local")
+    if not cache:
+        os.environ["RESPONSE_CACHE_TTL"] = "0"
+
+
+def scenario_names() -> list:
+    from app.view_config import VIEW_CONFIG
+
+    views = [v for v, cfg in VIEW_CONFIG.items() if not cfg["is_async"]]
+    names = [f"view:{v}:{fmt}" for v in views for fmt in VIEW_FORMATS]
+    names += [f"linked:{e}:{fmt}" for e in LINKED_ENGINES for fmt in LINKED_FORMATS]
+    names += [f"format:{v}:{fmt}" for v in views for fmt in VIEW_FORMATS]
+    names += [f"geojson:plot_shape_view:{impl}" for impl in GEOJSON_IMPLS]
+    return names
+
+
+def _iterrows_feature_collection(df) -> str:
+    """
+    The FeatureCollection body _format_response built before serialize.py:
+    iterrows, one shapely.geometry.mapping per row, json.dumps over the lot.
+    Kept here as the baseline for the geojson:*:iterrows scenario.
+    """
+    import shapely.geometry
+    import shapely.wkt
+
+    features = []
+    for _, row in df.iterrows():
+        geom = row["geom"]
+        if isinstance(geom, str):
+            geom = shapely.wkt.loads(geom)
+        geojson_geom = shapely.geometry.mapping(geom) if geom else None
+        properties = row.drop("geom").to_dict()
+        features.append({"type": "Feature", "geometry": geojson_geom, "properties": properties})
+    return json.dumps({"type": "FeatureCollection", "features": features}, default=str)
+
+
+def build_scenario(name: str, limit: int):
+    """
+    A zero-argument callable that runs one request of the scenario, and the
+    number of rows it serialises (None when the scenario includes the query).
+    """
+    from app.main import _format_response, lambda_handler
+    from app.query import build_query, execute_arrow, execute_query
+    from app.serialize import feature_collection
+
+    kind, target, fmt = name.split(":")
+
+    if kind == "view":
+        event = {
+            "path": f"/query/{target}",
+            "httpMethod": "POST",
+            "body": json.dumps({"format": fmt, "limit": limit}),
+        }
+        return (lambda: lambda_handler(event, None)), None
+
+    if kind == "linked":
+        event = {
+            "path": "/query",
+            "httpMethod": "POST",
+            "body": json.dumps({
+                "campaign_name": CAMPAIGNS[0], "format": fmt, "limit": limit, "engine": target,
+            }),
+        }
+        return (lambda: lambda_handler(event, None)), None
+
+    if kind == "format":
+        sql, params = build_query(view_name=target, select_statement="*", limit=limit)
+        execute = execute_arrow if fmt == "arrow" else execute_query
+        rows = execute(view_name=target, sql=sql, params=params)
+        # _format_response may convert columns in place (geometries for parquet)
+        copy = (lambda: rows) if fmt == "arrow" else rows.copy
+        return (lambda: _format_response(copy(), target, fmt)), len(rows)
+
+    if kind == "geojson":
+        sql, params = build_query(view_name=target, select_statement="*", limit=limit)
+        rows = execute_query(view_name=target, sql=sql, params=params)
+        serialise = {"iterrows": _iterrows_feature_collection, "columnar": feature_collection}[fmt]
+        return (lambda: {"statusCode": 200, "body": serialise(rows)}), len(rows)
+
+    raise ValueError(f"Unknown scenario kind '{kind}'")
+
+
+def percentile(values: list, q: float) -> float:
+    """Linear-interpolated percentile, q in [0, 100]."""
+    ordered = sorted(values)
+    pos = (len(ordered) - 1) * q / 100
+    lo  = int(pos)
+    hi  = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (pos - lo)
+
+
+def run_scenario(name: str, repeat: int, warmup: int, limit: int) -> dict:
+    """Time one scenario in this process. Called in the per-scenario subprocess."""
+    t0 = time.perf_counter()
+    run, rows = build_scenario(name, limit)
+    setup = time.perf_counter() - t0
+
+    for _ in range(warmup):
+        run()
+    times, status = [], None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        response = run()
+        times.append(time.perf_counter() - t0)
+        status = response["statusCode"]
+
+    return {
+        "scenario":     name,
+        "status":       status,
+        "setup_s":      setup,
+        "p50_ms":       percentile(times, 50) * 1000,
+        "p95_ms":       percentile(times, 95) * 1000,
+        "rows_per_s":   rows / percentile(times, 50) if rows else None,
+        "peak_rss_mib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "body_bytes":   len(response.get("body") or b""),
+    }
+
+
+def regressions(results: list, baseline: list, tolerance: float) -> list:
+    before = {r["scenario"]: r for r in baseline}
+    found = []
+    for r in results:
+        old = before.get(r["scenario"])
+        if old is None:
+            continue
+        for metric in ("p95_ms", "peak_rss_mib"):
+            if r[metric] > old[metric] * (1 + tolerance):
+                found.append(f"{r['scenario']}: {metric} {old[metric]:.1f} → {r[metric]:.1f}")
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-k", "--filter", action="append", default=[],
+                        help="only scenarios whose name contains this (repeatable)")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--limit", type=int, default=1000, help="rows (or plots) per request")
+    parser.add_argument("--cache", action="store_true", help="leave the response cache on")
+    parser.add_argument("--save", help="write results to this JSON file")
+    parser.add_argument("--baseline", help="JSON file from an earlier --save to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--list", action="store_true", help="list scenario names and exit")
+    parser.add_argument("--run", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    _local_env(args.cache)
+
+    if args.run:
+        print(json.dumps(run_scenario(args.run, args.repeat, args.warmup, args.limit)))
+        return
+
+    names = [n for n in scenario_names() if not args.filter or any(f in n for f in args.filter)]
+    if args.list:
+        print("\n".join(names))
+        return
+
+    print(f"{'scenario':44s} {'status':>6s} {'p50 ms':>9s} {'p95 ms':>9s} {'peak RSS MiB':>13s} "
+          f"{'body KiB':>9s} {'rows/s':>9s}")
+    results = []
+    for name in names:
+        child = subprocess.run(
+            [sys.executable, __file__, "--run", name, "--repeat", str(args.repeat),
+             "--warmup", str(args.warmup), "--limit", str(args.limit)]
+            + (["--cache"] if args.cache else []),
+            capture_output=True, text=True,
+        )
+        if child.returncode != 0:
+            print(f"{name:44s} failed:\n{child.stderr.strip()}")
+            continue
+        r = json.loads(child.stdout.strip().splitlines()[-1])
+        results.append(r)
+        rate = f"{r['rows_per_s']:9.0f}" if r.get("rows_per_s") else ""
+        print(f"{name:44s} {r['status']:>6d} {r['p50_ms']:9.1f} {r['p95_ms']:9.1f} "
+              f"{r['peak_rss_mib']:13.0f} {r['body_bytes'] / 1024:9.0f} {rate:>9s}")
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            found = regressions(results, json.load(f), args.tolerance)
+        for line in found:
+            print("REGRESSION", line)
+        if found:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+"""
+Fill a local Postgres + PostGIS database with synthetic VSWIR Plants data.
+
+Creates the vswir_plants schema from the repo's DDL (schema/init_database.sql,
+plants_v5_types.sql, plants_v5_tables.sql, views_v2.sql) and generates rows
+server-side with generate_series, so even spectra at full band count load in
+seconds rather than streaming through Python. Output is deterministic for a
+given --seed and scale.
+
+Scale:
+    plots × granules-per-plot plot/granule intersections, each with
+    pixels-per-intersection pixels; every pixel gets an extracted_spectra and
+    an output_pixel_rfl row of --bands values. Each plot has one field event
+    with --samples samples and --traits traits per sample.
+
+Connection settings are the same env vars app/db.py reads for local runs:
+DB_HOST, DB_PORT, DB_USER, DB_PASS, DB_NAME (default vswirplants).
+
+    cd api/backend/database_api
+    DB_HOST=localhost python benchmarks/synthetic_data.py --reset --plots 2000 --bands 425
+"""
+
+import argparse
+import math
+import os
+import time
+
+import psycopg2
+from psycopg2 import sql
+
+SCHEMA_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "schema")
+SCHEMA_FILES = ("init_database.sql", "plants_v5_types.sql", "plants_v5_tables.sql", "views_v2.sql")
+
+CAMPAIGNS = ("Synthetic Campaign A", "Synthetic Campaign B")
+
+# Plots are laid out on a grid starting at this corner (East River, CO),
+# PLOT_SIZE degrees square with PLOT_SPACING between corners.
+ORIGIN_LON, ORIGIN_LAT = -107.0, 38.8
+PLOT_SIZE    = 0.0003
+PLOT_SPACING = 0.001
+
+
+def connect():
+    return psycopg2.connect(
+        host=os.environ.get("DB_HOST", "localhost"),
+        port=os.environ.get("DB_PORT", "5432"),
+        user=os.environ.get("DB_USER", "postgres"),
+        password=os.environ.get("DB_PASS", ""),
+        dbname=os.environ.get("DB_NAME", "vswirplants"),
+    )
+
+
+def enum(name: str) -> str:
+    """Array of an enum's labels, for picking values by index in SQL."""
+    return f'enum_range(NULL::vswir_plants."{name}")'
+
+
+def pick(name: str, index_expr: str) -> str:
+    """Cycle through an enum's labels by an integer SQL expression."""
+    return f"({enum(name)})[1 + mod({index_expr}, array_length({enum(name)}, 1))]"
+
+
+def create_schema(cur, schema_dir: str, reset: bool) -> None:
+    if reset:
+        cur.execute("DROP SCHEMA IF EXISTS vswir_plants CASCADE")
+        cur.execute("DROP SCHEMA IF EXISTS vswir_plants_staging CASCADE")
+    for name in SCHEMA_FILES:
+        with open(os.path.join(schema_dir, name)) as f:
+            cur.execute(f.read())
+
+
+def generate(cur, args) -> None:
+    grid = math.ceil(math.sqrt(args.plots))
+    cur.execute("SELECT setseed(%s)", (args.seed / 2**31,))
+
+    cur.execute(
+        "INSERT INTO vswir_plants.campaign (campaign_name, primary_funding_source) "
+        "SELECT unnest(%s::varchar[]), 'NASA'",
+        (list(CAMPAIGNS),),
+    )
+
+    # Every campaign flies every sensor used below.
+    cur.execute(
+        f"""
+        INSERT INTO vswir_plants.sensor_campaign
+        SELECT c.campaign_name, s.sensor_name, {pick("ELEVATION_source", "0")},
+               ARRAY(SELECT (380 + b * 2100.0 / %(bands)s)::float4 FROM generate_series(0, %(bands)s - 1) b),
+               array_fill(5.5::float4, ARRAY[%(bands)s])
+        FROM vswir_plants.campaign c
+        CROSS JOIN unnest(({enum("Sensor_name")})[1:2]) AS s(sensor_name)
+        """,
+        {"bands": args.bands},
+    )
+
+    cur.execute(
+        f"""
+        INSERT INTO vswir_plants.granule
+        SELECT format('SYN%%s_%%s', to_char(DATE '2018-06-01' + g, 'YYYYMMDD'), g),
+               (%(campaigns)s::varchar[])[1 + g %% 2],
+               ({enum("Sensor_name")})[1 + (g / 2) %% 2],
+               TIME '17:30:00' + g * INTERVAL '7 minutes',
+               DATE '2018-06-01' + g,
+               NULL, NULL, NULL,
+               {pick("CLOUD_conditions", "g")},
+               {pick("CLOUD_type", "g")},
+               1.0, 32613
+        FROM generate_series(0, %(granules)s - 1) g
+        """,
+        {"granules": args.granules, "campaigns": list(CAMPAIGNS)},
+    )
+
+    cur.execute(
+        f"""
+        INSERT INTO vswir_plants.plot (plot_id, campaign_name, site_id, plot_name, plot_method)
+        SELECT p, (%(campaigns)s::varchar[])[1 + p %% 2], format('SITE%%s', p / 100),
+               format('PLOT_%%s', p), {pick("PLOT_method", "p")}
+        FROM generate_series(1, %(plots)s) p
+        """,
+        {"plots": args.plots, "campaigns": list(CAMPAIGNS)},
+    )
+
+    cur.execute(
+        """
+        INSERT INTO vswir_plants.plot_shape (plot_shape_id, geom)
+        SELECT p, format(
+            'SRID=4326;POLYGON((%%1$s %%2$s, %%3$s %%2$s, %%3$s %%4$s, %%1$s %%4$s, %%1$s %%2$s))',
+            x, y, x + %(size)s, y + %(size)s)
+        FROM generate_series(1, %(plots)s) p,
+             LATERAL (SELECT %(lon)s + ((p - 1) %% %(grid)s) * %(spacing)s AS x,
+                             %(lat)s + ((p - 1) / %(grid)s) * %(spacing)s AS y) corner
+        """,
+        {"plots": args.plots, "size": PLOT_SIZE, "spacing": PLOT_SPACING,
+         "lon": ORIGIN_LON, "lat": ORIGIN_LAT, "grid": grid},
+    )
+
+    # Each plot is seen by granules_per_plot granules of its own campaign.
+    cur.execute(
+        f"""
+        INSERT INTO vswir_plants.plot_raster_intersect
+        SELECT pl.plot_id, g.granule_id, pl.plot_id,
+               {pick("EXTRACTION_method", "0")}, {pick("DELINEATION_method", "0")}, true
+        FROM vswir_plants.plot pl
+        CROSS JOIN LATERAL (
+            SELECT granule_id FROM vswir_plants.granule g
+            WHERE g.campaign_name = pl.campaign_name
+            ORDER BY (hashint4(pl.plot_id) # hashtext(g.granule_id))
+            LIMIT %(per_plot)s
+        ) g
+        """,
+        {"per_plot": args.granules_per_plot},
+    )
+
+    # Pixels sit on a square GLT grid inside their plot's polygon.
+    side = math.ceil(math.sqrt(args.pixels))
+    cur.execute(
+        """
+        INSERT INTO vswir_plants.pixel (
+            plot_id, granule_id, glt_row, glt_column, shade_mask, path_length,
+            to_sensor_azimuth, to_sensor_zenith, to_sun_azimuth, to_sun_zenith,
+            solar_phase, slope, aspect, utc_time, cosine_i, raw_cosine_i,
+            lon, lat, elevation)
+        SELECT pri.plot_id, pri.granule_id, k / %(side)s, k %% %(side)s, random() < 0.1,
+               4000 + random() * 500, random() * 360, random() * 30, random() * 360,
+               20 + random() * 40, random() * 60, random() * 30, random() * 360,
+               17.5 + random(), random(), random(),
+               %(lon)s + ((pri.plot_id - 1) %% %(grid)s) * %(spacing)s + (k %% %(side)s + 0.5) * %(size)s / %(side)s,
+               %(lat)s + ((pri.plot_id - 1) / %(grid)s) * %(spacing)s + (k / %(side)s + 0.5) * %(size)s / %(side)s,
+               2800 + random() * 600
+        FROM vswir_plants.plot_raster_intersect pri
+        CROSS JOIN generate_series(0, %(pixels)s - 1) k
+        ORDER BY pri.plot_id, pri.granule_id, k
+        """,
+        {"pixels": args.pixels, "side": side, "size": PLOT_SIZE,
+         "spacing": PLOT_SPACING, "lon": ORIGIN_LON, "lat": ORIGIN_LAT, "grid": grid},
+    )
+
+    # The correlated reference to pixel_id makes the planner draw a fresh
+    # spectrum per pixel rather than one shared array.
+    for table, column in (("extracted_spectra", "radiance"), ("output_pixel_rfl", "reflectance")):
+        cur.execute(
+            f"""
+            INSERT INTO vswir_plants.{table} (pixel_id, {column})
+            SELECT p.pixel_id,
+                   ARRAY(SELECT (random() * (p.pixel_id %% 7 + 1))::float4
+                         FROM generate_series(1, %(bands)s))
+            FROM vswir_plants.pixel p
+            """,
+            {"bands": args.bands},
+        )
+
+    cur.execute(
+        f"""
+        INSERT INTO vswir_plants.insitu_plot_event
+        SELECT plot_id, DATE '2018-07-01' + mod(plot_id, 60),
+               {pick("VEGETATION_type", "plot_id")}, {pick("SUBPLOT_cover_method", "plot_id")}, true
+        FROM vswir_plants.plot
+        """
+    )
+    cur.execute(
+        f"""
+        INSERT INTO vswir_plants.sample
+        SELECT e.collection_date, e.plot_id, format('S%%s', s),
+               {pick("TAXA", "e.plot_id * 7 + s")}, {pick("VEG_or_cover_type", "s")},
+               {pick("PHENOPHASE", "e.plot_id")}, {pick("FRACTIONAL_class", "s")},
+               (random() * 100)::int, {pick("PLANT_status", "s")}, {pick("CANOPY_position", "s")}
+        FROM vswir_plants.insitu_plot_event e
+        CROSS JOIN generate_series(1, %(samples)s) s
+        """,
+        {"samples": args.samples},
+    )
+    cur.execute(
+        f"""
+        INSERT INTO vswir_plants.leaf_traits (
+            sample_name, plot_id, collection_date, trait, value, method, handling, units)
+        SELECT s.sample_name, s.plot_id, s.collection_date, t.trait, random() * 100,
+               {pick("Trait_method", "0")}, {pick("Sample_handling", "0")}, {pick("Trait_units", "0")}
+        FROM vswir_plants.sample s
+        CROSS JOIN unnest(({enum("Trait")})[1:%(traits)s]) AS t(trait)
+        """,
+        {"traits": args.traits},
+    )
+
+    for table, column in (("plot", "plot_id"), ("plot_shape", "plot_shape_id")):
+        cur.execute(
+            f"SELECT setval(pg_get_serial_sequence('vswir_plants.{table}', '{column}'), "
+            f"(SELECT max({column}) FROM vswir_plants.{table}))"
+        )
+    # Rows were inserted directly, not promoted — build the summary promotion maintains.
+    cur.execute("SELECT vswir_plants.refresh_plot_summary()")
+    cur.execute("UPDATE vswir_plants.data_version SET version = version + 1, updated_at = now()")
+
+    # The API queries views unqualified, as it does against the deployed database.
+    cur.execute(
+        sql.SQL("ALTER DATABASE {} SET search_path = vswir_plants, public").format(
+            sql.Identifier(cur.connection.info.dbname)
+        )
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--plots", type=int, default=500)
+    parser.add_argument("--granules", type=int, default=20)
+    parser.add_argument("--granules-per-plot", type=int, default=2)
+    parser.add_argument("--pixels", type=int, default=25, help="pixels per plot/granule intersection")
+    parser.add_argument("--bands", type=int, default=425)
+    parser.add_argument("--samples", type=int, default=3, help="samples per plot")
+    parser.add_argument("--traits", type=int, default=4, help="traits per sample")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--schema-dir", default=SCHEMA_DIR)
+    parser.add_argument("--reset", action="store_true", help="drop the vswir_plants schemas first")
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    conn = connect()
+    with conn, conn.cursor() as cur:
+        create_schema(cur, args.schema_dir, args.reset)
+        generate(cur, args)
+    conn.autocommit = True
+    with conn.cursor() as cur:
+        cur.execute("ANALYZE")
+        cur.execute(
+            "SELECT relname, n_live_tup FROM pg_stat_user_tables "
+            "WHERE schemaname = 'vswir_plants' ORDER BY relname"
+        )
+        counts = cur.fetchall()
+    conn.close()
+
+    for table, rows in counts:
+        print(f"  {table:28s} {rows:>10d}")
+    print(f"loaded in {time.perf_counter() - t0:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Last steps of a promotion (promote_sql.py): refresh the derived tables for
+the promoted plots, delete the batch's staging rows and bump the data-version
+stamp. Runs inside the promotion transaction.
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+STAGING_TABLES = [
+    "extracted_spectra", "pixel", "leaf_traits", "sample",
+    "insitu_plot_event", "plot_raster_intersect", "plot",
+    "plot_shape", "granule", "sensor_campaign", "campaign",
+]
+
+
+def finalize(conn, batch_id: str, plot_ids: list):
+    """plot_ids: production plot_ids inserted by this batch."""
+    logger.info("Refreshing plot_summary")
+    _refresh_plot_summary(conn, plot_ids)
+
+    logger.info("Refreshing plot_pixels_mv")
+    _refresh_plot_pixels(conn, plot_ids)
+
+    logger.info("Cleaning up staging")
+    _cleanup_staging(conn, batch_id)
+
+    _bump_data_version(conn, batch_id)
+
+
+def _refresh_plot_summary(conn, plot_ids: list):
+    """
+    Recompute the plot_summary rows of the promoted plots only — the linked
+    query reads its totals from there (vswir_plants.refresh_plot_summary).
+    """
+    if not plot_ids:
+        return
+    with conn.cursor() as cur:
+        cur.execute("SELECT vswir_plants.refresh_plot_summary(%s::integer[])", (plot_ids,))
+        logger.info("plot_summary rows refreshed: %s", cur.fetchone()[0])
+
+
+def _refresh_plot_pixels(conn, plot_ids: list):
+    """
+    Insert the promoted plots' plot_pixels_mv rows — the rest of the table is
+    untouched, unlike the full REFRESH MATERIALIZED VIEW it replaces
+    (vswir_plants.refresh_plot_pixels).
+    """
+    if not plot_ids:
+        return
+    with conn.cursor() as cur:
+        cur.execute("SELECT vswir_plants.refresh_plot_pixels(%s::integer[])", (plot_ids,))
+        logger.info("plot_pixels_mv rows refreshed: %s", cur.fetchone()[0])
+
+
+def _cleanup_staging(conn, batch_id: str):
+    with conn.cursor() as cur:
+        for table in STAGING_TABLES:
+            cur.execute(
+                f"DELETE FROM vswir_plants_staging.{table} WHERE batch_id = %s",
+                (batch_id,)
+            )
+            logger.info("Deleted staging.%s for batch_id=%s", table, batch_id)
+
+
+def _bump_data_version(conn, batch_id: str):
+    """
+    Record this batch in the data-version stamp. Runs inside the promotion
+    transaction, so caches keyed on the stamp only move on once the rows are visible.
+    """
+    with conn.cursor() as cur:
+        cur.execute("""
+            UPDATE vswir_plants.data_version
+            SET version = version + 1, batch_id = %s, updated_at = now()
+            RETURNING version
+        """, (batch_id,))
+        row = cur.fetchone()
+    logger.info("Data version now %s (batch_id=%s)", row[0] if row else None, batch_id)
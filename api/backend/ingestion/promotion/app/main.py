@@ -3,7 +3,7 @@ import logging
 from app.auth import get_claims, require_superadmin, respond
 from app.db import get_connection
 from app.dynamo import get_batch, mark_promoted
-from app.promote import promote
+from app.promote_sql import promote
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
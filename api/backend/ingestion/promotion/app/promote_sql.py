@@ -0,0 +1,224 @@
+"""
+Set-based promotion — copies a batch from vswir_plants_staging to vswir_plants
+in dependency order as INSERT INTO vswir_plants.x SELECT ... FROM
+vswir_plants_staging.x statements, so no row leaves the database.
+
+Serial IDs are remapped through temp tables that are dropped at commit:
+  _plot_map   staging plot_id → production plot_id, from RETURNING joined back
+              on (campaign_name, plot_name)
+  _pixel_map  staging pixel_id → production pixel_id, from RETURNING joined
+              back on (plot_id, granule_id, glt_row, glt_column)
+  _shape_map  staging plot_shape_id → production plot_shape_id. Shapes have no
+              natural key to join RETURNING back on, so their ids are drawn
+              from the production sequence before the insert.
+Dependent tables join these maps. Rows whose parent did not map are left
+out.
+"""
+
+import logging
+
+from app.finalize import finalize
+
+logger = logging.getLogger(__name__)
+
+PIXEL_COLUMNS = (
+    "granule_id", "glt_row", "glt_column", "shade_mask",
+    "path_length", "to_sensor_azimuth", "to_sensor_zenith",
+    "to_sun_azimuth", "to_sun_zenith", "solar_phase", "slope", "aspect",
+    "utc_time", "cosine_i", "raw_cosine_i", "lon", "lat", "elevation",
+)
+
+
+def promote(conn, batch_id: str):
+    """
+    Run the full promotion in a single transaction.
+    Commits on success. Rolls back on failure — staging data preserved.
+    """
+    with conn:
+        with conn.cursor() as cur:
+            logger.info("Promoting campaign + sensor_campaign")
+            _promote_campaign(cur, batch_id)
+
+            logger.info("Promoting granule")
+            _promote_granule(cur, batch_id)
+
+            logger.info("Promoting plots")
+            _promote_plot_shapes(cur, batch_id)
+            plot_ids = _promote_plots(cur, batch_id)
+            _promote_plot_raster_intersect(cur, batch_id)
+
+            logger.info("Promoting traits")
+            _promote_traits(cur, batch_id)
+
+            logger.info("Promoting pixels + spectra")
+            _promote_pixels(cur, batch_id)
+            _promote_spectra(cur, batch_id)
+
+        finalize(conn, batch_id, plot_ids)
+
+
+# ── Table promoters ───────────────────────────────────────────────────────────
+
+def _promote_campaign(cur, batch_id: str):
+    cur.execute("""
+        INSERT INTO vswir_plants.campaign
+            (campaign_name, primary_funding_source, data_repository, taxa_system)
+        SELECT campaign_name, primary_funding_source, data_repository, taxa_system
+        FROM vswir_plants_staging.campaign WHERE batch_id = %s
+    """, (batch_id,))
+    cur.execute("""
+        INSERT INTO vswir_plants.sensor_campaign
+            (campaign_name, sensor_name, elevation_source, wavelength_center, fwhm)
+        SELECT campaign_name, sensor_name, elevation_source, wavelength_center, fwhm
+        FROM vswir_plants_staging.sensor_campaign WHERE batch_id = %s
+        ON CONFLICT DO NOTHING
+    """, (batch_id,))
+
+
+def _promote_granule(cur, batch_id: str):
+    cur.execute("""
+        INSERT INTO vswir_plants.granule (
+            granule_id, campaign_name, sensor_name, acquisition_start_time,
+            acquisition_date, granule_rad_url, granule_refl_url, flightline_id,
+            cloudy_conditions, cloud_type, gsd, raster_epsg
+        )
+        SELECT granule_id, campaign_name, sensor_name, acquisition_start_time,
+               acquisition_date, granule_rad_url, granule_refl_url, flightline_id,
+               cloudy_conditions, cloud_type, gsd, raster_epsg
+        FROM vswir_plants_staging.granule WHERE batch_id = %s
+    """, (batch_id,))
+    logger.info("granule rows: %s", cur.rowcount)
+
+
+def _promote_plot_shapes(cur, batch_id: str):
+    cur.execute("""
+        CREATE TEMP TABLE _shape_map ON COMMIT DROP AS
+        SELECT plot_shape_id AS staging_id,
+               nextval(pg_get_serial_sequence('vswir_plants.plot_shape', 'plot_shape_id'))::integer
+                   AS plot_shape_id
+        FROM vswir_plants_staging.plot_shape WHERE batch_id = %s
+    """, (batch_id,))
+    cur.execute("""
+        INSERT INTO vswir_plants.plot_shape (plot_shape_id, geom)
+        SELECT m.plot_shape_id, s.geom
+        FROM vswir_plants_staging.plot_shape s
+        JOIN _shape_map m ON m.staging_id = s.plot_shape_id
+        WHERE s.batch_id = %s
+    """, (batch_id,))
+    logger.info("plot_shape rows: %s", cur.rowcount)
+
+
+def _promote_plots(cur, batch_id: str) -> list:
+    """Returns the production plot_ids inserted."""
+    cur.execute("CREATE TEMP TABLE _plot_map (staging_id INTEGER PRIMARY KEY, plot_id INTEGER) ON COMMIT DROP")
+    cur.execute("""
+        WITH inserted AS (
+            INSERT INTO vswir_plants.plot (campaign_name, site_id, plot_name, plot_method)
+            SELECT campaign_name, site_id, plot_name, plot_method
+            FROM vswir_plants_staging.plot WHERE batch_id = %(batch_id)s
+            ORDER BY plot_id
+            ON CONFLICT DO NOTHING
+            RETURNING plot_id, campaign_name, plot_name
+        )
+        INSERT INTO _plot_map (staging_id, plot_id)
+        SELECT s.plot_id, i.plot_id
+        FROM inserted i
+        JOIN vswir_plants_staging.plot s
+            ON s.campaign_name = i.campaign_name AND s.plot_name = i.plot_name
+        WHERE s.batch_id = %(batch_id)s
+    """, {"batch_id": batch_id})
+    cur.execute("ANALYZE _plot_map")
+    cur.execute("SELECT plot_id FROM _plot_map ORDER BY plot_id")
+    return [r[0] for r in cur.fetchall()]
+
+
+def _promote_plot_raster_intersect(cur, batch_id: str):
+    cur.execute("""
+        INSERT INTO vswir_plants.plot_raster_intersect (
+            plot_id, granule_id, plot_shape_id, extraction_method,
+            delineation_method, shape_aligned_to_granule
+        )
+        SELECT pm.plot_id, s.granule_id, sm.plot_shape_id, s.extraction_method,
+               s.delineation_method, s.shape_aligned_to_granule
+        FROM vswir_plants_staging.plot_raster_intersect s
+        JOIN _plot_map  pm ON pm.staging_id = s.plot_id
+        JOIN _shape_map sm ON sm.staging_id = s.plot_shape_id
+        WHERE s.batch_id = %s
+    """, (batch_id,))
+
+
+def _promote_traits(cur, batch_id: str):
+    """insitu_plot_event → sample → leaf_traits, in FK order."""
+    cur.execute("""
+        INSERT INTO vswir_plants.insitu_plot_event
+            (plot_id, collection_date, plot_veg_type, subplot_cover_method, floristic_survey)
+        SELECT pm.plot_id, s.collection_date, s.plot_veg_type, s.subplot_cover_method,
+               s.floristic_survey
+        FROM vswir_plants_staging.insitu_plot_event s
+        JOIN _plot_map pm ON pm.staging_id = s.plot_id
+        WHERE s.batch_id = %s
+    """, (batch_id,))
+    cur.execute("""
+        INSERT INTO vswir_plants.sample (
+            plot_id, collection_date, sample_name, taxa, veg_or_cover_type, phenophase,
+            sample_fc_class, sample_fc_percent, plant_status, canopy_position
+        )
+        SELECT pm.plot_id, s.collection_date, s.sample_name, s.taxa, s.veg_or_cover_type,
+               s.phenophase, s.sample_fc_class, s.sample_fc_percent, s.plant_status,
+               s.canopy_position
+        FROM vswir_plants_staging.sample s
+        JOIN _plot_map pm ON pm.staging_id = s.plot_id
+        WHERE s.batch_id = %s
+    """, (batch_id,))
+    cur.execute("""
+        INSERT INTO vswir_plants.leaf_traits (
+            plot_id, collection_date, sample_name, trait, value,
+            method, handling, units, error, error_type
+        )
+        SELECT pm.plot_id, s.collection_date, s.sample_name, s.trait, s.value,
+               s.method, s.handling, s.units, s.error, s.error_type
+        FROM vswir_plants_staging.leaf_traits s
+        JOIN _plot_map pm ON pm.staging_id = s.plot_id
+        WHERE s.batch_id = %s
+    """, (batch_id,))
+    logger.info("leaf_traits rows: %s", cur.rowcount)
+
+
+def _promote_pixels(cur, batch_id: str):
+    columns = ", ".join(PIXEL_COLUMNS)
+    staged  = ", ".join(f"s.{c}" for c in PIXEL_COLUMNS)
+    cur.execute("CREATE TEMP TABLE _pixel_map (staging_id INTEGER PRIMARY KEY, pixel_id INTEGER) ON COMMIT DROP")
+    cur.execute(f"""
+        WITH inserted AS (
+            INSERT INTO vswir_plants.pixel (plot_id, {columns})
+            SELECT pm.plot_id, {staged}
+            FROM vswir_plants_staging.pixel s
+            JOIN _plot_map pm ON pm.staging_id = s.plot_id
+            WHERE s.batch_id = %(batch_id)s
+            ORDER BY pm.plot_id, s.granule_id, s.glt_row, s.glt_column
+            RETURNING pixel_id, plot_id, granule_id, glt_row, glt_column
+        )
+        INSERT INTO _pixel_map (staging_id, pixel_id)
+        SELECT s.pixel_id, i.pixel_id
+        FROM inserted i
+        JOIN _plot_map pm ON pm.plot_id = i.plot_id
+        JOIN vswir_plants_staging.pixel s
+            ON  s.batch_id   = %(batch_id)s
+            AND s.plot_id    = pm.staging_id
+            AND s.granule_id = i.granule_id
+            AND s.glt_row    = i.glt_row
+            AND s.glt_column = i.glt_column
+    """, {"batch_id": batch_id})
+    logger.info("pixel rows: %s", cur.rowcount)
+    cur.execute("ANALYZE _pixel_map")
+
+
+def _promote_spectra(cur, batch_id: str):
+    cur.execute("""
+        INSERT INTO vswir_plants.extracted_spectra (pixel_id, radiance)
+        SELECT m.pixel_id, s.radiance
+        FROM vswir_plants_staging.extracted_spectra s
+        JOIN _pixel_map m ON m.staging_id = s.pixel_id
+        WHERE s.batch_id = %s
+    """, (batch_id,))
+    logger.info("extracted_spectra rows: %s", cur.rowcount)
@@ -0,0 +1,220 @@
+"""
+Timing benchmarks for the promotion steps (app/promote_sql.py).
+
+--stage writes a synthetic batch into vswir_plants_staging: --plots plots,
+each intersecting --granules-per-plot granules with --pixels pixels apiece and
+--bands radiance values per pixel. Scenarios:
+
+    sql:<step>      app.promote_sql._promote_<step>
+
+Each scenario runs the steps that come before <step>, times <step> alone and
+rolls the transaction back, so one staged batch serves any number of runs.
+--verify then also counts, before the rollback, the staged rows the step did
+not reproduce under their production ids (CHECKS), joining through
+promote_sql's id maps: 0 means every staging id mapped to a production row
+with the same natural key and values.
+Needs a database built from schema/*.sql (PostGIS included) in which the
+batch's campaign is not already promoted.
+
+    cd api/backend/ingestion/promotion
+    DB_HOST=localhost python benchmarks/bench_promote.py --stage --plots 20000 --pixels 125
+    DB_HOST=localhost python benchmarks/bench_promote.py -k pixels --verify
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+import psycopg2
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app import promote_sql  # noqa: E402
+
+STEPS     = ("campaign", "granule", "plot_shapes", "plots", "plot_raster_intersect",
+             "traits", "pixels", "spectra")
+SCENARIOS = [f"sql:{step}" for step in ("plot_shapes", "pixels", "spectra")]
+
+# step → staged rows of the batch with no matching production row
+CHECKS = {
+    "plot_shapes": """
+        SELECT count(*)
+        FROM vswir_plants_staging.plot_shape s
+        LEFT JOIN _shape_map m ON m.staging_id = s.plot_shape_id
+        LEFT JOIN vswir_plants.plot_shape p ON p.plot_shape_id = m.plot_shape_id
+        WHERE s.batch_id = %(b)s
+          AND (p.plot_shape_id IS NULL OR p.geom::text IS DISTINCT FROM s.geom::text)
+    """,
+    "pixels": """
+        SELECT count(*)
+        FROM vswir_plants_staging.pixel s
+        JOIN _plot_map pm ON pm.staging_id = s.plot_id
+        LEFT JOIN _pixel_map m ON m.staging_id = s.pixel_id
+        LEFT JOIN vswir_plants.pixel p ON p.pixel_id = m.pixel_id
+        WHERE s.batch_id = %(b)s
+          AND (p.pixel_id IS NULL OR p.plot_id <> pm.plot_id OR p.granule_id <> s.granule_id
+               OR p.glt_row <> s.glt_row OR p.glt_column <> s.glt_column OR p.lon <> s.lon)
+    """,
+    "spectra": """
+        SELECT count(*)
+        FROM vswir_plants_staging.extracted_spectra s
+        LEFT JOIN _pixel_map m ON m.staging_id = s.pixel_id
+        LEFT JOIN vswir_plants.extracted_spectra p ON p.pixel_id = m.pixel_id
+        WHERE s.batch_id = %(b)s AND (p.pixel_id IS NULL OR p.radiance IS DISTINCT FROM s.radiance)
+    """,
+}
+
+
+def connect():
+    return psycopg2.connect(
+        host=os.environ.get("DB_HOST", "localhost"),
+        port=os.environ.get("DB_PORT", "5432"),
+        user=os.environ.get("DB_USER", "postgres"),
+        password=os.environ.get("DB_PASS", ""),
+        dbname=os.environ.get("DB_NAME", "vswirplants"),
+    )
+
+
+def stage(conn, batch_id: str, plots: int, granules_per_plot: int, pixels: int, bands: int):
+    """Synthetic batch, shaped like a QAQC-passed upload. Pixel rows are staged in random order."""
+    campaign = f"bench_{batch_id}"
+    p = {"b": batch_id, "c": campaign, "plots": plots, "g": granules_per_plot,
+         "granules": granules_per_plot * 4, "x": pixels, "bands": bands}
+    with conn, conn.cursor() as cur:
+        cur.execute("""
+            INSERT INTO vswir_plants_staging.campaign (campaign_name, primary_funding_source, batch_id)
+            VALUES (%(c)s, 'NASA', %(b)s)
+        """, p)
+        cur.execute("""
+            INSERT INTO vswir_plants_staging.sensor_campaign
+                (campaign_name, sensor_name, elevation_source, wavelength_center, fwhm, batch_id)
+            SELECT %(c)s, 'NEON AIS 1', 'NEON AOP Lidar',
+                   array_agg(400 + 5 * i)::float4[], array_agg(5.0)::float4[], %(b)s
+            FROM generate_series(1, %(bands)s) i
+        """, p)
+        cur.execute("""
+            INSERT INTO vswir_plants_staging.granule (
+                granule_id, campaign_name, sensor_name, acquisition_start_time,
+                acquisition_date, cloudy_conditions, cloud_type, gsd, raster_epsg, batch_id
+            )
+            SELECT %(b)s || '_ang2020' || lpad(g::text, 4, '0') || 't000000', %(c)s, 'NEON AIS 1',
+                   '10:00', date '2020-01-01' + g, 'Green', 'Stratus', 5.0, 4326, %(b)s
+            FROM generate_series(1, %(granules)s) g
+        """, p)
+        cur.execute("""
+            INSERT INTO vswir_plants_staging.plot_shape (geom, batch_id)
+            SELECT ST_Buffer(ST_SetSRID(ST_MakePoint(-120 + p * 1e-4, 34), 4326), 1e-4, 2), %(b)s
+            FROM generate_series(1, %(plots)s) p
+        """, p)
+        cur.execute("""
+            INSERT INTO vswir_plants_staging.plot (campaign_name, site_id, plot_name, batch_id)
+            SELECT %(c)s, 'site', 'plot_' || p, %(b)s FROM generate_series(1, %(plots)s) p
+        """, p)
+        cur.execute("""
+            INSERT INTO vswir_plants_staging.plot_raster_intersect (
+                plot_id, granule_id, plot_shape_id, extraction_method,
+                delineation_method, shape_aligned_to_granule, batch_id
+            )
+            SELECT pl.plot_id, gr.granule_id, sh.plot_shape_id, 'Buffer', 'In Field', true, %(b)s
+            FROM (SELECT plot_id, row_number() OVER (ORDER BY plot_id) AS rn
+                  FROM vswir_plants_staging.plot WHERE batch_id = %(b)s) pl
+            JOIN (SELECT plot_shape_id, row_number() OVER (ORDER BY plot_shape_id) AS rn
+                  FROM vswir_plants_staging.plot_shape WHERE batch_id = %(b)s) sh USING (rn)
+            CROSS JOIN LATERAL (
+                SELECT granule_id FROM vswir_plants_staging.granule WHERE batch_id = %(b)s
+                ORDER BY md5(granule_id || pl.plot_id) LIMIT %(g)s
+            ) gr
+        """, p)
+        cur.execute("""
+            INSERT INTO vswir_plants_staging.pixel (
+                plot_id, granule_id, glt_row, glt_column, shade_mask, path_length,
+                to_sensor_azimuth, to_sensor_zenith, to_sun_azimuth, to_sun_zenith,
+                solar_phase, slope, aspect, utc_time, cosine_i, raw_cosine_i,
+                lon, lat, elevation, batch_id
+            )
+            SELECT pri.plot_id, pri.granule_id, x / 16, x %% 16, false, 1000, 10, 20, 30, 40,
+                   50, 1, 2, 18.5, 0.9, NULL, -120 + x * 1e-5, 34, 100, %(b)s
+            FROM vswir_plants_staging.plot_raster_intersect pri, generate_series(0, %(x)s - 1) x
+            WHERE pri.batch_id = %(b)s
+            ORDER BY random()
+        """, p)
+        cur.execute("""
+            INSERT INTO vswir_plants_staging.extracted_spectra (pixel_id, radiance, batch_id)
+            SELECT pixel_id, (SELECT array_agg((pixel_id %% 97 + i * 0.5)::float4)
+                              FROM generate_series(1, %(bands)s) i), %(b)s
+            FROM vswir_plants_staging.pixel WHERE batch_id = %(b)s
+        """, p)
+        cur.execute("SELECT count(*) FROM vswir_plants_staging.pixel WHERE batch_id = %(b)s", p)
+        return cur.fetchone()[0]
+
+
+def build_scenario(conn, name: str, batch_id: str):
+    """Run the steps before the scenario's own; return a zero-argument callable for it."""
+    _, step = name.split(":")
+    if step not in STEPS:
+        raise ValueError(f"Unknown scenario '{name}'")
+    with conn.cursor() as cur:
+        for prior in STEPS[:STEPS.index(step)]:
+            getattr(promote_sql, f"_promote_{prior}")(cur, batch_id)
+
+    def run():
+        with conn.cursor() as cur:
+            getattr(promote_sql, f"_promote_{step}")(cur, batch_id)
+    return run
+
+
+def run_scenario(conn, name: str, batch_id: str, verify: bool = False) -> tuple:
+    """(seconds, mismatched rows — None unless verify and the step has a check)."""
+    try:
+        run = build_scenario(conn, name, batch_id)
+        t0 = time.perf_counter()
+        run()
+        seconds = time.perf_counter() - t0
+
+        check = CHECKS.get(name.split(":")[1]) if verify else None
+        if check is None:
+            return seconds, None
+        with conn.cursor() as cur:
+            cur.execute(check, {"b": batch_id})
+            return seconds, cur.fetchone()[0]
+    finally:
+        conn.rollback()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--batch-id", default="bench")
+    parser.add_argument("--stage", action="store_true", help="stage a synthetic batch and exit")
+    parser.add_argument("--plots", type=int, default=2000)
+    parser.add_argument("--granules-per-plot", type=int, default=2)
+    parser.add_argument("--pixels", type=int, default=125, help="pixels per plot/granule intersect")
+    parser.add_argument("--bands", type=int, default=425)
+    parser.add_argument("-k", "--filter", action="append", default=[],
+                        help="only scenarios whose name contains this (repeatable)")
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--verify", action="store_true",
+                        help="check each step's output against staging before rolling back")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    conn = connect()
+
+    if args.stage:
+        t0 = time.perf_counter()
+        n = stage(conn, args.batch_id, args.plots, args.granules_per_plot, args.pixels, args.bands)
+        print(f"staged {n} pixels as batch_id={args.batch_id} in {time.perf_counter() - t0:.0f} s")
+        return
+
+    print(f"{'scenario':24s} {'seconds':>9s} {'mismatched':>11s}")
+    for name in SCENARIOS:
+        if args.filter and not any(f in name for f in args.filter):
+            continue
+        for _ in range(args.repeat):
+            seconds, mismatched = run_scenario(conn, name, args.batch_id, args.verify)
+            print(f"{name:24s} {seconds:9.2f} {'' if mismatched is None else mismatched:>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -18,7 +18,7 @@ from __future__ import annotations
 import pandas as pd
 
 from app.checks.types import CheckContext, CheckResult
-from app.checks.universal import load_config, run_mechanical_checks, check_not_in_db
+from app.checks.universal import load_config, run_mechanical_checks, check_not_in_db, key_isin
 
 CONFIG = load_config("campaign_metadata")
 CONFIG["_file_name"] = "campaign_metadata"
@@ -45,15 +45,14 @@ def _check_no_existing_campaigns(df: pd.DataFrame, context: CheckContext) -> lis
 
 def _check_no_existing_sensor_campaigns(df: pd.DataFrame, context: CheckContext) -> list[dict]:
     """(campaign_name, sensor_name) must not already exist in production sensor_campaign."""
-    errors = []
-    for idx, row in df.iterrows():
-        key = (row["campaign_name"], row["sensor_name"])
-        if key in context.db["campaign_sensor_set"]:
-            errors.append({
-                "file": "campaign_metadata", "row": int(idx + 2), "column": None,
-                "message": "sensor_campaign already exists in database",
-            })
-    return errors
+    exists = key_isin(df, ["campaign_name", "sensor_name"], context.db["campaign_sensor_set"])
+    return [
+        {
+            "file": "campaign_metadata", "row": int(idx + 2), "column": None,
+            "message": "sensor_campaign already exists in database",
+        }
+        for idx in df.index[exists]
+    ]
 
 
 # ── Forwarded output ───────────────────────────────────────────────────────────
@@ -28,14 +28,15 @@ Checks (in order):
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
-from shapely.geometry import Point
+import shapely
 
 from app.checks.types import CheckContext, CheckResult
 from app.checks.universal import (
     load_config, run_mechanical_checks,
     check_required_columns, check_no_missing_values,
-    check_castable, check_extra_columns, check_foreign_key,
+    check_castable, check_extra_columns, key_isin, parse_float,
     _resolve_types,
 )
 
@@ -122,9 +123,12 @@ def _check_per_row(
     context: CheckContext,
 ) -> tuple[list[dict], list[dict]]:
     """
-    Run all per-row checks in a single pass.
+    Run all per-row checks. Each is a mask over the whole file; the errors
+    come back in row order, as a row-by-row pass would report them.
     Returns (errors, warnings).
 
+    - Rows whose plot or plot-granule intersection does not resolve get that
+      one error and are left out of every later check.
     - Coordinate bounds violations and DB duplicate pixels are collected and
       summarised into batch messages to avoid flooding the report.
     - Point-in-polygon (footprint outside plot shape) is a warning, not an
@@ -132,60 +136,58 @@ def _check_per_row(
     """
     all_plots, all_shape_map, all_band_counts, all_gsd_map = _build_reference_sets(context)
 
-    errors          = []
-    warnings        = []
-    pk_seen         = set()
-    out_of_bounds   = []   # row numbers where lon/lat are outside WGS84 range
-    outside_polygon = []   # (row_number, distance_m) — warning, not error
-
-    for idx, row in df.iterrows():
-        campaign = row["campaign_name"]
-        plot     = row["plot_name"]
-        sensor   = row["sensor_name"]
-        granule  = row["granule_id"]
-        plot_key = (campaign, plot)
-        int_key  = (campaign, plot, granule)
-
-        if plot_key not in all_plots:
-            errors.append({
-                "file": "spectra", "row": int(idx + 2), "column": "plot_name",
-                "message": (
-                    f"(campaign_name='{campaign}', plot_name='{plot}') "
-                    f"not found in plots.geojson or database"
-                ),
-            })
-            continue  # remaining checks depend on the plot resolving
-
-        if int_key not in all_shape_map:
-            errors.append({
-                "file": "spectra", "row": int(idx + 2), "column": "granule_id",
-                "message": (
-                    f"(campaign_name='{campaign}', plot_name='{plot}', "
-                    f"granule_id='{granule}') not found in plot_raster_intersect"
-                ),
-            })
-            continue  # remaining checks depend on the intersection resolving
-
-        errors += _check_band_count(campaign, sensor, band_cols, all_band_counts, idx)
-
-        pk = (campaign, plot, granule, row["glt_row"], row["glt_column"])
-        if pk in pk_seen:
-            errors.append({
-                "file": "spectra", "row": int(idx + 2), "column": None,
-                "message": "duplicate pixel within file",
-            })
-        elif pk in context.db["pixel_set"]:
-            errors.append({
-                "file": "spectra", "row": int(idx + 2), "column": None,
-                "message": "pixel already exists in database",
-            })
-        pk_seen.add(pk)
-
-        row_out_of_bounds, row_outside_polygon = _check_coordinates(
-            row, all_shape_map[int_key], all_gsd_map.get(granule), idx
-        )
-        out_of_bounds   += row_out_of_bounds
-        outside_polygon += row_outside_polygon
+    plot_found = key_isin(df, ["campaign_name", "plot_name"], all_plots)
+    int_found  = key_isin(df, ["campaign_name", "plot_name", "granule_id"], all_shape_map.keys())
+    resolved   = plot_found & int_found
+
+    # (position, order within the row, error) — sorted into row order at the end
+    found = []
+    for pos in np.flatnonzero(~plot_found):
+        campaign, plot = df["campaign_name"].iat[pos], df["plot_name"].iat[pos]
+        found.append((pos, 0, {
+            "file": "spectra", "row": int(df.index[pos] + 2), "column": "plot_name",
+            "message": (
+                f"(campaign_name='{campaign}', plot_name='{plot}') "
+                f"not found in plots.geojson or database"
+            ),
+        }))
+    for pos in np.flatnonzero(plot_found & ~int_found):
+        campaign, plot, granule = (df[c].iat[pos] for c in ("campaign_name", "plot_name", "granule_id"))
+        found.append((pos, 0, {
+            "file": "spectra", "row": int(df.index[pos] + 2), "column": "granule_id",
+            "message": (
+                f"(campaign_name='{campaign}', plot_name='{plot}', "
+                f"granule_id='{granule}') not found in plot_raster_intersect"
+            ),
+        }))
+
+    for pos in np.flatnonzero(resolved & _band_count_mismatch(df, band_cols, all_band_counts)):
+        campaign, sensor = df["campaign_name"].iat[pos], df["sensor_name"].iat[pos]
+        found += [(pos, 1, e) for e in _check_band_count(
+            campaign, sensor, band_cols, all_band_counts, df.index[pos]
+        )]
+
+    # Unresolved rows take no part in the pixel uniqueness checks
+    positions = np.flatnonzero(resolved)
+    pixels    = df.iloc[positions][["campaign_name", "plot_name", "granule_id", "glt_row", "glt_column"]]
+    repeated  = pixels.duplicated().to_numpy()
+    in_db     = ~repeated & key_isin(pixels, list(pixels.columns), context.db["pixel_set"])
+    for pos in positions[repeated]:
+        found.append((pos, 2, {
+            "file": "spectra", "row": int(df.index[pos] + 2), "column": None,
+            "message": "duplicate pixel within file",
+        }))
+    for pos in positions[in_db]:
+        found.append((pos, 2, {
+            "file": "spectra", "row": int(df.index[pos] + 2), "column": None,
+            "message": "pixel already exists in database",
+        }))
+
+    found.sort(key=lambda f: (f[0], f[1]))
+    errors   = [e for _, _, e in found]
+    warnings = []
+
+    out_of_bounds, outside_polygon = _check_coordinates(df, positions, all_shape_map, all_gsd_map)
 
     errors   += _summarise_coord_errors(
         out_of_bounds,
@@ -217,6 +219,16 @@ def _build_reference_sets(context: CheckContext) -> tuple[set, dict, dict, dict]
     return all_plots, all_shape_map, all_band_counts, all_gsd_map
 
 
+def _band_count_mismatch(df: pd.DataFrame, band_cols: list[int], all_band_counts: dict) -> np.ndarray:
+    """Rows whose (campaign, sensor) declares a wavelength count other than len(band_cols)."""
+    sensors    = set(zip(df["campaign_name"], df["sensor_name"]))
+    mismatched = [
+        key for key in sensors
+        if all_band_counts.get(key) is not None and all_band_counts[key] != len(band_cols)
+    ]
+    return key_isin(df, ["campaign_name", "sensor_name"], mismatched)
+
+
 def _check_band_count(
     campaign: str,
     sensor: str,
@@ -238,49 +250,70 @@ def _check_band_count(
 
 
 def _check_coordinates(
-    row: pd.Series,
-    plot_geom,
-    gsd: float | None,
-    idx: int,
+    df: pd.DataFrame,
+    positions: np.ndarray,
+    all_shape_map: dict,
+    all_gsd_map: dict,
 ) -> tuple[list[int], list[tuple[int, float]]]:
     """
-    Check lon/lat for WGS84 bounds and pixel footprint intersection.
-    Returns (out_of_bounds_rows, outside_polygon_entries).
+    Check lon/lat for WGS84 bounds and pixel footprint intersection, for the
+    rows at positions (those whose plot-granule intersection resolved).
+    Returns (out_of_bounds_rows, outside_polygon_entries), both in row order.
 
     outside_polygon_entries is a list of (row_number, distance_m) where
     distance_m is the distance from the pixel centroid to the nearest point
     on the polygon boundary — used to bucket violations by severity.
 
     When GSD is known, constructs a GSD × GSD square centred on the pixel
-    centroid (cap_style=3) and checks whether it intersects the plot polygon.
+    centroid and checks whether it intersects the plot polygon.
     This matches rioxarray's all_touched=True semantics — any pixel whose
     footprint overlaps the plot boundary is accepted.
 
     When GSD is unknown, falls back to a plain centroid intersects check.
-    """
-    try:
-        lon = float(row["lon"])
-        lat = float(row["lat"])
-    except (ValueError, TypeError):
-        return [], []  # non-castable values already caught by the type check
-
-    if not (-180 <= lon <= 180 and -90 <= lat <= 90):
-        return [idx + 2], []  # skip footprint check if coordinates are garbage
 
-    pt = Point(lon, lat)
-
-    if gsd is not None:
-        radius_deg      = (float(gsd) / 2) / 111320
-        pixel_footprint = pt.buffer(radius_deg, cap_style=3)
-        intersects      = plot_geom.intersects(pixel_footprint)
-    else:
-        intersects = plot_geom.intersects(pt)
-
-    if not intersects:
-        dist_m = plot_geom.exterior.distance(pt) * 111320
-        return [], [(idx + 2, dist_m)]
-
-    return [], []
+    Pixels are grouped by (campaign, plot, granule); each plot polygon is
+    prepared once and tested against all of its pixels as one array.
+    """
+    rows = df.index[positions] + 2
+    lon, lon_ok = parse_float(df["lon"].iloc[positions])
+    lat, lat_ok = parse_float(df["lat"].iloc[positions])
+    castable    = lon_ok & lat_ok  # non-castable values already caught by the type check
+
+    in_bounds     = (-180 <= lon) & (lon <= 180) & (-90 <= lat) & (lat <= 90)
+    out_of_bounds = rows[castable & ~in_bounds].tolist()
+
+    # Footprint check only for usable coordinates
+    checked = np.flatnonzero(castable & in_bounds)
+    keys    = df.iloc[positions[checked]][["campaign_name", "plot_name", "granule_id"]]
+    outside_at, outside_dist = [], []
+
+    for (campaign, plot, granule), group in keys.groupby(
+        ["campaign_name", "plot_name", "granule_id"], sort=False
+    ).indices.items():
+        at        = checked[group]
+        plot_geom = all_shape_map[(campaign, plot, granule)]
+        shapely.prepare(plot_geom)
+        points = shapely.points(lon[at], lat[at])
+
+        gsd = all_gsd_map.get(granule)
+        if gsd is not None:
+            radius_deg = (float(gsd) / 2) / 111320
+            footprints = shapely.box(lon[at] - radius_deg, lat[at] - radius_deg,
+                                     lon[at] + radius_deg, lat[at] + radius_deg)
+            intersects = shapely.intersects(plot_geom, footprints)
+        else:
+            intersects = shapely.intersects(plot_geom, points)
+
+        if not intersects.all():
+            outside_at.append(at[~intersects])
+            outside_dist.append(shapely.distance(plot_geom.exterior, points[~intersects]) * 111320)
+
+    if not outside_at:
+        return out_of_bounds, []
+    at    = np.concatenate(outside_at)
+    dist  = np.concatenate(outside_dist)
+    order = np.argsort(at, kind="stable")
+    return out_of_bounds, list(zip(rows[at[order]].tolist(), dist[order].tolist()))
 
 
 def _summarise_outside_polygon(
@@ -26,7 +26,7 @@ import pandas as pd
 
 from app.checks.types import CheckContext, CheckResult
 from app.checks.universal import (
-    load_config, run_mechanical_checks, check_foreign_key,
+    load_config, run_mechanical_checks, check_foreign_key, key_isin,
 )
 
 CONFIG = load_config("traits")
@@ -59,17 +59,20 @@ def _check_plot_fk(df: pd.DataFrame, context: CheckContext) -> list[dict]:
 
 def _check_error_type_conditional(df: pd.DataFrame) -> list[dict]:
     """error_type is required whenever the error column contains a value."""
-    errors = []
-    for idx, row in df.iterrows():
-        error_val  = row.get("error")
-        error_type = row.get("error_type")
-        if (pd.notna(error_val) and str(error_val).strip() != ""
-                and (pd.isna(error_type) or str(error_type).strip() == "")):
-            errors.append({
-                "file": "traits", "row": int(idx + 2), "column": "error_type",
-                "message": "error_type is required when error is set",
-            })
-    return errors
+    if "error" not in df.columns:
+        return []
+    error_set = df["error"].notna() & (df["error"].astype(str).str.strip() != "")
+    if "error_type" in df.columns:
+        type_missing = df["error_type"].isna() | (df["error_type"].astype(str).str.strip() == "")
+    else:
+        type_missing = True
+    return [
+        {
+            "file": "traits", "row": int(idx + 2), "column": "error_type",
+            "message": "error_type is required when error is set",
+        }
+        for idx in df.index[(error_set & type_missing).to_numpy()]
+    ]
 
 
 def _check_no_existing_plot_events(df: pd.DataFrame, context: CheckContext) -> list[dict]:
@@ -78,20 +81,11 @@ def _check_no_existing_plot_events(df: pd.DataFrame, context: CheckContext) -> l
     production insitu_plot_event. One error per violating row with a consistent
     message so the frontend groups them into a bold Rows X-Y summary.
     """
-    db_set = context.db["insitu_plot_event_set"]
-    seen   = set()
-    errors = []
-    for idx, row in df.iterrows():
-        key = (row["campaign_name"], row["plot_name"], str(row["collection_date"]).strip())
-        if key in seen:
-            continue
-        seen.add(key)
-        if key in db_set:
-            errors.append({
-                "file": "traits", "row": int(idx + 2), "column": None,
-                "message": "insitu_plot_event already exists in database",
-            })
-    return errors
+    return _existing_rows(
+        _trait_keys(df, ["campaign_name", "plot_name", "collection_date"]),
+        context.db["insitu_plot_event_set"], "insitu_plot_event already exists in database",
+        first_only=True,
+    )
 
 
 def _check_no_existing_samples(df: pd.DataFrame, context: CheckContext) -> list[dict]:
@@ -99,23 +93,11 @@ def _check_no_existing_samples(df: pd.DataFrame, context: CheckContext) -> list[
     (campaign_name, plot_name, collection_date, sample_name) must not already
     exist in production sample.
     """
-    db_set = context.db["sample_set"]
-    seen   = set()
-    errors = []
-    for idx, row in df.iterrows():
-        key = (
-            row["campaign_name"], row["plot_name"],
-            str(row["collection_date"]).strip(), row["sample_name"],
-        )
-        if key in seen:
-            continue
-        seen.add(key)
-        if key in db_set:
-            errors.append({
-                "file": "traits", "row": int(idx + 2), "column": None,
-                "message": "sample already exists in database",
-            })
-    return errors
+    return _existing_rows(
+        _trait_keys(df, ["campaign_name", "plot_name", "collection_date", "sample_name"]),
+        context.db["sample_set"], "sample already exists in database",
+        first_only=True,
+    )
 
 
 def _check_no_existing_leaf_traits(df: pd.DataFrame, context: CheckContext) -> list[dict]:
@@ -123,17 +105,30 @@ def _check_no_existing_leaf_traits(df: pd.DataFrame, context: CheckContext) -> l
     (campaign_name, plot_name, collection_date, sample_name, trait) must not
     already exist in production leaf_traits.
     """
-    db_set = context.db["leaf_trait_set"]
-    errors = []
-    for idx, row in df.iterrows():
-        key = (
-            row["campaign_name"], row["plot_name"],
-            str(row["collection_date"]).strip(), row["sample_name"],
-            str(row["trait"]),
-        )
-        if key in db_set:
-            errors.append({
-                "file": "traits", "row": int(idx + 2), "column": None,
-                "message": "leaf_trait already exists in database",
-            })
-    return errors
+    keys = _trait_keys(df, ["campaign_name", "plot_name", "collection_date", "sample_name", "trait"])
+    keys["trait"] = keys["trait"].astype(str)
+    return _existing_rows(
+        keys, context.db["leaf_trait_set"], "leaf_trait already exists in database",
+        first_only=False,
+    )
+
+
+def _trait_keys(df: pd.DataFrame, key_cols: list[str]) -> pd.DataFrame:
+    """Key columns for the existing-row checks; collection_date is compared as stripped text."""
+    keys = df[key_cols].copy()
+    keys["collection_date"] = keys["collection_date"].astype(str).str.strip()
+    return keys
+
+
+def _existing_rows(keys: pd.DataFrame, db_set: set, message: str, first_only: bool) -> list[dict]:
+    """
+    One error per row whose key is in db_set. With first_only, only the first
+    row of each repeated key is reported.
+    """
+    exists = key_isin(keys, list(keys.columns), db_set)
+    if first_only:
+        exists &= ~keys.duplicated().to_numpy()
+    return [
+        {"file": "traits", "row": int(idx + 2), "column": None, "message": message}
+        for idx in keys.index[exists]
+    ]
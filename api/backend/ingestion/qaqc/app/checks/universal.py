@@ -21,6 +21,14 @@ Every function returns a list of error or warning dicts (empty list = pass):
 ── Cross-reference checks ────────────────────────────────────────────────────
     check_foreign_key(df, key_cols, reference_set, file_name, column)
     check_not_in_db(df, key_col, db_set, file_name, column)
+
+── Column helpers (shared by the per-file checks) ────────────────────────────
+    parse_float(values)
+    key_isin(df, key_cols, reference)
+
+Checks work on whole columns — masks, isin, duplicated — and only loop over
+the rows that fail, to build their error dicts. Row numbers are the
+DataFrame index + 2 (header row, 1-based).
 """
 
 from __future__ import annotations
@@ -29,6 +37,7 @@ import json
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 # ── Config loading ─────────────────────────────────────────────────────────────
@@ -43,6 +52,13 @@ _TYPE_MAP = {
     "time":  "time",
 }
 
+_BOOL_LABELS = ("true", "false", "1", "0", "yes", "no")
+
+# Fast-path patterns for check_castable. Everything they match casts; values
+# they miss are tried one at a time with the original cast.
+_INT_RE  = r"[+-]?[0-9]+"
+_TIME_RE = r"(?:[01][0-9]|2[0-3]):[0-5][0-9]:[0-5][0-9]"
+
 
 def load_config(file_name: str) -> dict:
     """
@@ -136,11 +152,12 @@ def check_enum_values(
         if col not in df.columns:
             continue
         valid        = enums.get(enum_type, set())
+        valid_desc   = sorted(valid)
         invalid_mask = ~df[col].isin(valid) & df[col].notna() & (df[col].astype(str).str.strip() != "")
-        for idx, row in df[invalid_mask].iterrows():
+        for idx, val in df.loc[invalid_mask, col].items():
             errors.append(_err(
                 file_name,
-                f"'{row[col]}' is not a valid value for '{col}' (valid: {sorted(valid)})",
+                f"'{val}' is not a valid value for '{col}' (valid: {valid_desc})",
                 row=idx + 2,
                 column=col,
             ))
@@ -167,31 +184,53 @@ def check_castable(df: pd.DataFrame, type_cols: dict, file_name: str) -> list[di
     for col, typ in type_cols.items():
         if col not in df.columns:
             continue
-        for idx, val in df[col].items():
-            if pd.isna(val):
-                continue
-            try:
-                if typ == float:
-                    float(val)
-                elif typ == int:
-                    int(val)
-                elif typ == bool:
-                    if str(val).lower() not in ("true", "false", "1", "0", "yes", "no"):
-                        raise ValueError
-                elif typ == "date":
-                    pd.to_datetime(str(val), dayfirst=False)
-                elif typ == "time":
-                    datetime.strptime(str(val), "%H:%M:%S")
-            except (ValueError, TypeError):
-                errors.append(_err(
-                    file_name,
-                    f"'{val}' in column '{col}' cannot be cast to {typ}",
-                    row=idx + 2,
-                    column=col,
-                ))
+        values = df[col][df[col].notna()]
+        failed = values[~_castable(values, typ)]
+        for idx, val in failed.items():
+            errors.append(_err(
+                file_name,
+                f"'{val}' in column '{col}' cannot be cast to {typ}",
+                row=idx + 2,
+                column=col,
+            ))
     return errors
 
 
+def _castable(values: pd.Series, typ) -> np.ndarray:
+    """
+    Boolean mask: which values the per-type cast accepts.
+    A vectorised pass clears the common forms; only what it rejects is cast
+    one value at a time, so the result matches casting every value.
+    """
+    if typ == bool:
+        return values.astype(str).str.lower().isin(_BOOL_LABELS).to_numpy()
+
+    if typ == float:
+        ok, cast = pd.to_numeric(values, errors="coerce").notna(), float
+    elif typ == int:
+        ok, cast = values.astype(str).str.fullmatch(_INT_RE), int
+    elif typ == "date":
+        ok = pd.to_datetime(values.astype(str), format="%Y-%m-%d", errors="coerce").notna()
+        def cast(val):
+            pd.to_datetime(str(val), dayfirst=False)
+    elif typ == "time":
+        ok = values.astype(str).str.fullmatch(_TIME_RE)
+        def cast(val):
+            datetime.strptime(str(val), "%H:%M:%S")
+    else:
+        return np.ones(len(values), dtype=bool)
+
+    ok  = np.array(ok, dtype=bool)
+    arr = values.to_numpy()
+    for i in np.flatnonzero(~ok):
+        try:
+            cast(arr[i])
+            ok[i] = True
+        except (ValueError, TypeError):
+            pass
+    return ok
+
+
 def check_extra_columns(
     df: pd.DataFrame,
     known_cols: list[str],
@@ -231,17 +270,16 @@ def check_foreign_key(
             "granule_metadata",
         )
     """
-    errors = []
-    for idx, row in df.iterrows():
-        key = tuple(row[c] for c in key_cols) if len(key_cols) > 1 else row[key_cols[0]]
-        if key not in reference_set:
-            cols_desc = ", ".join(f"{c}='{row[c]}'" for c in key_cols)
-            errors.append(_err(
-                file_name,
-                f"({cols_desc}) not found in bundle or database",
-                row=idx + 2,
-                column=column,
-            ))
+    errors  = []
+    missing = df.loc[~key_isin(df, key_cols, reference_set), key_cols]
+    for idx, values in zip(missing.index, missing.itertuples(index=False, name=None)):
+        cols_desc = ", ".join(f"{c}='{v}'" for c, v in zip(key_cols, values))
+        errors.append(_err(
+            file_name,
+            f"({cols_desc}) not found in bundle or database",
+            row=idx + 2,
+            column=column,
+        ))
     return errors
 
 
@@ -262,13 +300,50 @@ def check_not_in_db(
     Example — granule_id must not already exist:
         check_not_in_db(df, "granule_id", db_granule_ids, "granule_metadata", "granule_id")
     """
-    errors = []
-    already_exists = df[df[key_col].isin(db_set)]
-    for idx, row in already_exists.iterrows():
-        errors.append(_err(
-            file_name,
-            f"{key_col} already exists in database",
-            row=idx + 2,
-            column=column or key_col,
-        ))
-    return errors
+    return [
+        _err(file_name, f"{key_col} already exists in database", row=idx + 2, column=column or key_col)
+        for idx in df.index[df[key_col].isin(db_set)]
+    ]
+
+
+# ── Column helpers ─────────────────────────────────────────────────────────────
+
+def parse_float(values: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    """
+    float(value) for a whole column. Returns (floats, castable): floats is NaN
+    wherever float() raises, castable marks where it did not.
+
+    numpy's object → float64 cast calls float() on each value, so the numbers
+    are exactly the ones float() gives (pd.to_numeric can differ in the last
+    digit). It fails on the whole column at the first bad value, so a column
+    with bad values is split with pd.to_numeric first and what that rejects
+    ("1_000", "nan", real errors) goes through float() one value at a time.
+    """
+    arr = values.to_numpy(dtype=object)
+    try:
+        return arr.astype(float), np.ones(len(arr), dtype=bool)
+    except (ValueError, TypeError):
+        pass
+
+    ok     = np.array(pd.to_numeric(values, errors="coerce").notna(), dtype=bool)
+    floats = np.full(len(arr), np.nan)
+    floats[ok] = arr[ok].astype(float)
+    for i in np.flatnonzero(~ok):
+        try:
+            floats[i] = float(arr[i])
+            ok[i]     = True
+        except (ValueError, TypeError):
+            pass
+    return floats, ok
+
+
+def key_isin(df: pd.DataFrame, key_cols: list[str], reference) -> np.ndarray:
+    """
+    Boolean mask: whether each row's key is in reference — a collection of
+    plain values for a single column, of tuples for several.
+    """
+    if len(key_cols) == 1:
+        return df[key_cols[0]].isin(reference).to_numpy()
+    if len(df) == 0:
+        return np.zeros(0, dtype=bool)
+    return pd.MultiIndex.from_frame(df[key_cols]).isin(reference)
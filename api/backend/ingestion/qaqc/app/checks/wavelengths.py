@@ -23,7 +23,7 @@ from __future__ import annotations
 import pandas as pd
 
 from app.checks.types import CheckContext, CheckResult
-from app.checks.universal import load_config, run_mechanical_checks
+from app.checks.universal import load_config, run_mechanical_checks, parse_float
 
 CONFIG = load_config("wavelengths")
 CONFIG["_file_name"] = "wavelengths"
@@ -146,22 +146,19 @@ def _check_wavelength_range(df: pd.DataFrame) -> list[dict]:
     ({min}–{max} nm). Values outside this range almost certainly indicate
     the wrong unit (µm instead of nm) or corrupted data.
     """.format(min=_WAVELENGTH_MIN_NM, max=_WAVELENGTH_MAX_NM)
-    errors = []
-    for idx, row in df.iterrows():
-        try:
-            wl = float(row["wavelength"])
-        except (ValueError, TypeError):
-            continue  # non-castable values already caught by the type check
-        if not (_WAVELENGTH_MIN_NM <= wl <= _WAVELENGTH_MAX_NM):
-            errors.append({
-                "file": "wavelengths", "row": int(idx + 2), "column": "wavelength",
-                "message": (
-                    f"wavelength {wl} is outside the plausible VSWIR range "
-                    f"({_WAVELENGTH_MIN_NM}–{_WAVELENGTH_MAX_NM} nm) — "
-                    f"check that values are in nm, not µm"
-                ),
-            })
-    return errors
+    wl, castable = parse_float(df["wavelength"])  # non-castable values already caught by the type check
+    outside = castable & ~((_WAVELENGTH_MIN_NM <= wl) & (wl <= _WAVELENGTH_MAX_NM))
+    return [
+        {
+            "file": "wavelengths", "row": int(idx + 2), "column": "wavelength",
+            "message": (
+                f"wavelength {value} is outside the plausible VSWIR range "
+                f"({_WAVELENGTH_MIN_NM}–{_WAVELENGTH_MAX_NM} nm) — "
+                f"check that values are in nm, not µm"
+            ),
+        }
+        for idx, value in zip(df.index[outside], wl[outside].tolist())
+    ]
 
 
 def _check_fwhm_range(df: pd.DataFrame) -> list[dict]:
@@ -172,19 +169,16 @@ def _check_fwhm_range(df: pd.DataFrame) -> list[dict]:
     monotonicity — it commonly varies non-monotonically across a sensor's
     spectral range.
     """.format(min=_FWHM_MIN_NM, max=_FWHM_MAX_NM)
-    errors = []
-    for idx, row in df.iterrows():
-        try:
-            fwhm = float(row["fwhm"])
-        except (ValueError, TypeError):
-            continue  # non-castable values already caught by the type check
-        if not (_FWHM_MIN_NM <= fwhm <= _FWHM_MAX_NM):
-            errors.append({
-                "file": "wavelengths", "row": int(idx + 2), "column": "fwhm",
-                "message": (
-                    f"fwhm {fwhm} is outside the plausible range "
-                    f"({_FWHM_MIN_NM}–{_FWHM_MAX_NM} nm) — "
-                    f"check that values are in nm, not µm"
-                ),
-            })
-    return errors
+    fwhm, castable = parse_float(df["fwhm"])  # non-castable values already caught by the type check
+    outside = castable & ~((_FWHM_MIN_NM <= fwhm) & (fwhm <= _FWHM_MAX_NM))
+    return [
+        {
+            "file": "wavelengths", "row": int(idx + 2), "column": "fwhm",
+            "message": (
+                f"fwhm {value} is outside the plausible range "
+                f"({_FWHM_MIN_NM}–{_FWHM_MAX_NM} nm) — "
+                f"check that values are in nm, not µm"
+            ),
+        }
+        for idx, value in zip(df.index[outside], fwhm[outside].tolist())
+    ]
@@ -1,17 +1,24 @@
 import os
 import json
-import boto3
-from sqlalchemy import create_engine, text
+import logging
+
+# boto3 and SQLAlchemy are imported on first use: the QAQC_RUNNING status
+# write and the S3 download don't need them, and bundles that fail to parse
+# never open a connection at all.
 
 REGION = os.environ.get("AWS_REGION", "us-west-2")
 SECRET_ARN = os.environ["STAGING_DB_SECRET_ARN"]
 
+logger = logging.getLogger(__name__)
+
 _engine = None
 
 
 def get_connection():
     global _engine
     if _engine is None:
+        from sqlalchemy import create_engine
+
         creds = _get_secret()
         url = (
             f"postgresql+psycopg2://{creds['username']}:{creds['password']}"
@@ -22,22 +29,45 @@ def get_connection():
 
 
 def _get_secret() -> dict:
+    import boto3
+
     client = boto3.client("secretsmanager", region_name=REGION)
     resp = client.get_secret_value(SecretId=SECRET_ARN)
     return json.loads(resp["SecretString"])
 
 
-_enums_cache = None
+def data_version(conn):
+    """
+    Production data-version stamp (vswir_plants.data_version), bumped by
+    promotion and by schema/add_enum_values.py. None if it cannot be read —
+    callers then load everything from the database.
+    """
+    from sqlalchemy import text
 
-def load_enums(conn=None) -> dict:
+    try:
+        return conn.execute(text("SELECT version FROM vswir_plants.data_version")).scalar()
+    except Exception as exc:
+        logger.warning("Data version unavailable (%s)", exc)
+        conn.rollback()
+        return None
+
+
+_enums_cache = None  # (data version, enums)
+
+def load_enums(conn=None, version=None) -> dict:
     """
     Load all enum values from the production DB into a dict.
     Returns { enum_name: set(values) }
-    Cached per Lambda invocation.
+    Cached per Lambda container for one data version (data_version) —
+    add_enum_values.py bumps the stamp, so new values are picked up on the
+    next invocation. Not cached when the version is unknown.
     """
     global _enums_cache
-    if _enums_cache is not None:
-        return _enums_cache
+    if version is not None and _enums_cache is not None and _enums_cache[0] == version:
+        return _enums_cache[1]
+
+    from sqlalchemy import text
+
     if conn is None:
         conn = get_connection()
     rows = conn.execute(text("""
@@ -52,5 +82,5 @@ def load_enums(conn=None) -> dict:
     enums = {}
     for typname, label in rows:
         enums.setdefault(typname, set()).add(label)
-    _enums_cache = enums
+    _enums_cache = (version, enums)
     return enums
@@ -3,14 +3,39 @@ Production DB reference set loaders for the QAQC lambda.
 
 Uses pandas/geopandas instead of raw psycopg2 cursors.
 Requires a SQLAlchemy connection (from db.get_connection()).
+
+Three loaders return the same named sets/maps:
+  load_all         every production key, whatever the bundle holds.
+  load_scoped      the production rows of the bundle's campaigns and
+                   granules, each set fetched on its own connection.
+  load_for_bundle  only the production rows the bundle's keys collide with.
+                   The bundle's candidate keys are COPYed into temp tables
+                   (dropped at commit) and joined against production, so
+                   memory and read volume follow the bundle, not the database.
+The checks only ever test bundle keys for membership, and every bundle key
+carries one of the bundle's campaign names or granule ids, so all three give
+the same report.
 """
 
+import io
+import json
+import hashlib
 import logging
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
-import geopandas as gpd
 
 logger = logging.getLogger(__name__)
 
+SCOPED_WORKERS = 4  # connections load_scoped holds at once
+
+PLOT_KEY      = ["campaign_name", "plot_name"]
+INTERSECT_KEY = ["campaign_name", "plot_name", "granule_id"]
+TRAIT_KEY     = ["campaign_name", "plot_name", "collection_date", "sample_name", "trait"]
+PIXEL_KEY     = ["campaign_name", "plot_name", "granule_id", "glt_row", "glt_column"]
+KEY_COLUMNS   = ["campaign_name", "plot_name", "granule_id", "collection_date",
+                 "sample_name", "trait", "glt_row", "glt_column"]
+
 
 def load_all(conn) -> dict:
     """
@@ -44,75 +69,233 @@ def load_all(conn) -> dict:
     }
 
 
+def load_scoped(connect, campaigns: set, granule_ids: set) -> dict:
+    """
+    load_all, restricted to the given campaigns and granules (bundle_scope).
+    The fetches are independent, so they run concurrently, each on its own
+    connection from connect() (db.get_connection).
+    """
+    logger.info("Loading production reference sets for campaigns %s", sorted(campaigns))
+    fetches = {
+        # campaign
+        "campaign_names":             (fetch_campaign_names, campaigns),
+        "campaign_sensor_set":        (fetch_campaign_sensor_set, campaigns),
+        # granule
+        "granule_ids":                (fetch_granule_ids, granule_ids),
+        "granule_gsd_map":            (fetch_granule_gsd_map, granule_ids),
+        # plots
+        "plot_set":                   (fetch_plot_set, campaigns),
+        "plot_intersect_set":         (fetch_plot_intersect_set, campaigns),
+        "plot_shape_map":             (fetch_plot_shape_map, campaigns),
+        # traits
+        "insitu_plot_event_set":      (fetch_insitu_plot_event_set, campaigns),
+        "sample_set":                 (fetch_sample_set, campaigns),
+        "leaf_trait_set":             (fetch_leaf_trait_set, campaigns),
+        # spectra
+        "pixel_set":                  (fetch_pixel_set, campaigns),
+        # wavelengths (band counts — used for spectra band count check)
+        "wavelength_band_counts":     (fetch_wavelength_band_counts, campaigns),
+    }
+
+    def run(fetch, scope):
+        with connect() as conn:
+            return fetch(conn, scope)
+
+    with ThreadPoolExecutor(max_workers=SCOPED_WORKERS) as pool:
+        futures = {name: pool.submit(run, *fetch) for name, fetch in fetches.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+
+def bundle_scope(data: dict) -> tuple[set, set]:
+    """
+    (campaign_names, granule_ids) named anywhere in the parsed bundle (the
+    CheckContext data dict) — the scope for load_scoped.
+    """
+    props = _plot_properties(data["plots"])
+    files = [props, *(data[name] for name in
+                      ("campaign_metadata", "wavelengths", "granule_metadata", "traits", "spectra"))]
+    campaigns   = set().union(*(_key_frame(df, ["campaign_name"])["campaign_name"] for df in files))
+    granule_ids = set().union(*(_key_frame(df, ["granule_id"])["granule_id"] for df in files))
+    return campaigns, granule_ids
+
+
+def bundle_key_digest(data: dict) -> bytes:
+    """
+    Digest of every key column load_for_bundle reads (KEY_COLUMNS of plots,
+    traits and spectra). Bundles with equal digests load equal sets from the
+    same data version — ref_cache files them under it.
+    """
+    digest = hashlib.sha256()
+    files  = {"plots": _plot_properties(data["plots"]), "traits": data["traits"], "spectra": data["spectra"]}
+    for name, df in files.items():
+        key_cols = [c for c in KEY_COLUMNS if c in df.columns]
+        digest.update(json.dumps([name, key_cols, len(df)]).encode())
+        if key_cols:
+            hashes = pd.util.hash_pandas_object(df[key_cols].astype(str), index=False)
+            digest.update(hashes.to_numpy().tobytes())
+    return digest.digest()
+
+
+def load_for_bundle(conn, data: dict) -> dict:
+    """
+    load_all, restricted to the keys in the parsed bundle (the CheckContext
+    data dict). Plots are matched first; intersection, trait and pixel keys
+    are only sent to the database for plots that already exist there, so a
+    bundle for a new campaign copies nothing beyond its plot names. The
+    campaign, sensor_campaign and granule sets are read for bundle_scope.
+    """
+    logger.info("Loading production reference sets for the bundle's keys")
+    raw = conn.connection
+    campaigns, granule_ids = bundle_scope(data)
+    props    = _plot_properties(data["plots"])
+    traits   = data["traits"]
+    spectra  = data["spectra"]
+
+    plot_keys = pd.concat([_key_frame(props, PLOT_KEY), _key_frame(traits, PLOT_KEY),
+                           _key_frame(spectra, PLOT_KEY)])
+    _copy_keys(raw, "_bundle_plot", plot_keys)
+    plot_set = fetch_bundle_plot_set(conn)
+
+    trait_keys = _key_frame(traits, TRAIT_KEY)
+    trait_keys["collection_date"] = trait_keys["collection_date"].str.strip()
+    intersect_keys = pd.concat([_key_frame(props, INTERSECT_KEY), _key_frame(spectra, INTERSECT_KEY)])
+    _copy_keys(raw, "_bundle_intersect", _in_plot_set(intersect_keys, plot_set))
+    _copy_keys(raw, "_bundle_trait",     _in_plot_set(trait_keys, plot_set))
+    _copy_keys(raw, "_bundle_pixel",     _in_plot_set(_key_frame(spectra, PIXEL_KEY), plot_set))
+
+    return {
+        # campaign
+        "campaign_names":             fetch_campaign_names(conn, campaigns),
+        "campaign_sensor_set":        fetch_campaign_sensor_set(conn, campaigns),
+        # granule
+        "granule_ids":                fetch_granule_ids(conn, granule_ids),
+        "granule_gsd_map":            fetch_granule_gsd_map(conn, granule_ids),
+        # plots
+        "plot_set":                   plot_set,
+        "plot_intersect_set":         fetch_bundle_plot_intersect_set(conn),
+        "plot_shape_map":             fetch_bundle_plot_shape_map(conn),
+        # traits
+        "insitu_plot_event_set":      fetch_bundle_insitu_plot_event_set(conn),
+        "sample_set":                 fetch_bundle_sample_set(conn),
+        "leaf_trait_set":             fetch_bundle_leaf_trait_set(conn),
+        # spectra
+        "pixel_set":                  fetch_bundle_pixel_set(conn),
+        # wavelengths (band counts — used for spectra band count check)
+        "wavelength_band_counts":     fetch_wavelength_band_counts(conn, campaigns),
+    }
+
+
 # ── campaign ───────────────────────────────────────────────────────────────────
 
-def fetch_campaign_names(conn) -> set:
+def fetch_campaign_names(conn, campaigns: set | None = None) -> set:
     """Set of campaign_names already in production campaign table."""
-    df = pd.read_sql("SELECT campaign_name FROM vswir_plants.campaign", conn)
+    where, params = _scope("campaign_name", campaigns)
+    df = pd.read_sql(f"SELECT campaign_name FROM vswir_plants.campaign {where}", conn, params=params)
     return set(df["campaign_name"])
 
 
-def fetch_campaign_sensor_set(conn) -> set:
+def fetch_campaign_sensor_set(conn, campaigns: set | None = None) -> set:
     """Set of (campaign_name, sensor_name) tuples in production sensor_campaign."""
+    where, params = _scope("campaign_name", campaigns)
     df = pd.read_sql(
-        "SELECT campaign_name, sensor_name FROM vswir_plants.sensor_campaign",
-        conn,
+        f"SELECT campaign_name, sensor_name FROM vswir_plants.sensor_campaign {where}",
+        conn, params=params,
     )
     return set(zip(df["campaign_name"], df["sensor_name"]))
 
 
 # ── granule ────────────────────────────────────────────────────────────────────
 
-def fetch_granule_ids(conn) -> set:
+def fetch_granule_ids(conn, granule_ids: set | None = None) -> set:
     """Set of granule_ids already in production."""
-    df = pd.read_sql("SELECT granule_id FROM vswir_plants.granule", conn)
+    where, params = _scope("granule_id", granule_ids)
+    df = pd.read_sql(f"SELECT granule_id FROM vswir_plants.granule {where}", conn, params=params)
     return set(df["granule_id"])
 
 
-def fetch_granule_gsd_map(conn) -> dict:
+def fetch_granule_gsd_map(conn, granule_ids: set | None = None) -> dict:
     """Map of granule_id → gsd (metres) from production."""
-    df = pd.read_sql("SELECT granule_id, gsd FROM vswir_plants.granule", conn)
+    where, params = _scope("granule_id", granule_ids)
+    df = pd.read_sql(f"SELECT granule_id, gsd FROM vswir_plants.granule {where}", conn, params=params)
     return dict(zip(df["granule_id"], df["gsd"].astype(float)))
 
 
 # ── plots ──────────────────────────────────────────────────────────────────────
 
-def fetch_plot_set(conn) -> set:
+def fetch_plot_set(conn, campaigns: set | None = None) -> set:
     """Set of (campaign_name, plot_name) tuples in production plot table."""
+    where, params = _scope("campaign_name", campaigns)
     df = pd.read_sql(
-        "SELECT campaign_name, plot_name FROM vswir_plants.plot",
-        conn,
+        f"SELECT campaign_name, plot_name FROM vswir_plants.plot {where}",
+        conn, params=params,
     )
     return set(zip(df["campaign_name"], df["plot_name"]))
 
 
-def fetch_plot_intersect_set(conn) -> set:
+def fetch_plot_intersect_set(conn, campaigns: set | None = None) -> set:
     """Set of (campaign_name, plot_name, granule_id) in production plot_raster_intersect."""
+    where, params = _scope("pl.campaign_name", campaigns)
     df = pd.read_sql(
-        """
+        f"""
         SELECT pl.campaign_name, pl.plot_name, pri.granule_id
         FROM vswir_plants.plot_raster_intersect pri
         JOIN vswir_plants.plot pl ON pl.plot_id = pri.plot_id
+        {where}
+        """,
+        conn, params=params,
+    )
+    return set(zip(df["campaign_name"], df["plot_name"], df["granule_id"]))
+
+
+def fetch_bundle_plot_set(conn) -> set:
+    """fetch_plot_set, for the keys in _bundle_plot."""
+    df = pd.read_sql(
+        """
+        SELECT pl.campaign_name, pl.plot_name
+        FROM (SELECT DISTINCT campaign_name, plot_name FROM _bundle_plot) k
+        JOIN vswir_plants.plot pl
+            ON pl.campaign_name = k.campaign_name AND pl.plot_name = k.plot_name
+        """,
+        conn,
+    )
+    return set(zip(df["campaign_name"], df["plot_name"]))
+
+
+def fetch_bundle_plot_intersect_set(conn) -> set:
+    """fetch_plot_intersect_set, for the keys in _bundle_intersect."""
+    df = pd.read_sql(
+        """
+        SELECT pl.campaign_name, pl.plot_name, pri.granule_id
+        FROM (SELECT DISTINCT campaign_name, plot_name, granule_id FROM _bundle_intersect) k
+        JOIN vswir_plants.plot pl
+            ON pl.campaign_name = k.campaign_name AND pl.plot_name = k.plot_name
+        JOIN vswir_plants.plot_raster_intersect pri
+            ON pri.plot_id = pl.plot_id AND pri.granule_id = k.granule_id
         """,
         conn,
     )
     return set(zip(df["campaign_name"], df["plot_name"], df["granule_id"]))
 
 
-def fetch_plot_shape_map(conn) -> dict:
+def fetch_plot_shape_map(conn, campaigns: set | None = None) -> dict:
     """
     Map of (campaign_name, plot_name, granule_id) → Shapely geometry.
     geopandas.read_postgis handles PostGIS geometry parsing automatically.
     """
+    import geopandas as gpd
+
+    where, params = _scope("pl.campaign_name", campaigns)
+
     gdf = gpd.read_postgis(
-        """
+        f"""
         SELECT pl.campaign_name, pl.plot_name, pri.granule_id,
                ps.geom
         FROM vswir_plants.plot_raster_intersect pri
         JOIN vswir_plants.plot pl ON pl.plot_id = pri.plot_id
         JOIN vswir_plants.plot_shape ps ON ps.plot_shape_id = pri.plot_shape_id
+        {where}
         """,
-        conn,
+        conn, params=params,
         geom_col="geom",
     )
     return {
@@ -121,40 +304,65 @@ def fetch_plot_shape_map(conn) -> dict:
     }
 
 
+def fetch_bundle_plot_shape_map(conn) -> dict:
+    """fetch_plot_shape_map, for the keys in _bundle_intersect."""
+    import geopandas as gpd
+
+    gdf = gpd.read_postgis(
+        """
+        SELECT pl.campaign_name, pl.plot_name, pri.granule_id,
+               ps.geom
+        FROM (SELECT DISTINCT campaign_name, plot_name, granule_id FROM _bundle_intersect) k
+        JOIN vswir_plants.plot pl
+            ON pl.campaign_name = k.campaign_name AND pl.plot_name = k.plot_name
+        JOIN vswir_plants.plot_raster_intersect pri
+            ON pri.plot_id = pl.plot_id AND pri.granule_id = k.granule_id
+        JOIN vswir_plants.plot_shape ps ON ps.plot_shape_id = pri.plot_shape_id
+        """,
+        conn,
+        geom_col="geom",
+    )
+    return dict(zip(zip(gdf["campaign_name"], gdf["plot_name"], gdf["granule_id"]), gdf["geom"]))
+
+
 # ── traits ─────────────────────────────────────────────────────────────────────
 
-def fetch_insitu_plot_event_set(conn) -> set:
+def fetch_insitu_plot_event_set(conn, campaigns: set | None = None) -> set:
     """
     Set of (campaign_name, plot_name, collection_date) in production.
     PK on insitu_plot_event is (plot_id, collection_date) — joined to plot
     to get the natural key.
     """
+    where, params = _scope("pl.campaign_name", campaigns)
     df = pd.read_sql(
-        """
+        f"""
         SELECT pl.campaign_name, pl.plot_name,
                ipe.collection_date::text AS collection_date
         FROM vswir_plants.insitu_plot_event ipe
         JOIN vswir_plants.plot pl ON pl.plot_id = ipe.plot_id
+        {where}
         """,
-        conn,
+        conn, params=params,
     )
     return set(zip(df["campaign_name"], df["plot_name"], df["collection_date"]))
 
 
-def fetch_sample_set(conn) -> set:
+def fetch_sample_set(conn, campaigns: set | None = None) -> set:
     """
     Set of (campaign_name, plot_name, collection_date, sample_name) in production.
     PK on sample is (plot_id, collection_date, sample_name).
     """
+    where, params = _scope("pl.campaign_name", campaigns)
     df = pd.read_sql(
-        """
+        f"""
         SELECT pl.campaign_name, pl.plot_name,
                s.collection_date::text AS collection_date,
                s.sample_name
         FROM vswir_plants.sample s
         JOIN vswir_plants.plot pl ON pl.plot_id = s.plot_id
+        {where}
         """,
-        conn,
+        conn, params=params,
     )
     return set(zip(
         df["campaign_name"], df["plot_name"],
@@ -162,18 +370,86 @@ def fetch_sample_set(conn) -> set:
     ))
 
 
-def fetch_leaf_trait_set(conn) -> set:
+def fetch_leaf_trait_set(conn, campaigns: set | None = None) -> set:
     """
     Set of (campaign_name, plot_name, collection_date, sample_name, trait) in production.
     PK on leaf_traits is (plot_id, collection_date, sample_name, trait).
     """
+    where, params = _scope("pl.campaign_name", campaigns)
     df = pd.read_sql(
-        """
+        f"""
         SELECT pl.campaign_name, pl.plot_name,
                lt.collection_date::text AS collection_date,
                lt.sample_name, lt.trait::text AS trait
         FROM vswir_plants.leaf_traits lt
         JOIN vswir_plants.plot pl ON pl.plot_id = lt.plot_id
+        {where}
+        """,
+        conn, params=params,
+    )
+    return set(zip(
+        df["campaign_name"], df["plot_name"],
+        df["collection_date"], df["sample_name"], df["trait"],
+    ))
+
+
+def fetch_bundle_insitu_plot_event_set(conn) -> set:
+    """fetch_insitu_plot_event_set, for the keys in _bundle_trait."""
+    df = pd.read_sql(
+        """
+        SELECT pl.campaign_name, pl.plot_name,
+               ipe.collection_date::text AS collection_date
+        FROM (SELECT DISTINCT campaign_name, plot_name, collection_date FROM _bundle_trait) k
+        JOIN vswir_plants.plot pl
+            ON pl.campaign_name = k.campaign_name AND pl.plot_name = k.plot_name
+        JOIN vswir_plants.insitu_plot_event ipe
+            ON ipe.plot_id = pl.plot_id AND ipe.collection_date::text = k.collection_date
+        """,
+        conn,
+    )
+    return set(zip(df["campaign_name"], df["plot_name"], df["collection_date"]))
+
+
+def fetch_bundle_sample_set(conn) -> set:
+    """fetch_sample_set, for the keys in _bundle_trait."""
+    df = pd.read_sql(
+        """
+        SELECT pl.campaign_name, pl.plot_name,
+               s.collection_date::text AS collection_date,
+               s.sample_name
+        FROM (SELECT DISTINCT campaign_name, plot_name, collection_date, sample_name
+              FROM _bundle_trait) k
+        JOIN vswir_plants.plot pl
+            ON pl.campaign_name = k.campaign_name AND pl.plot_name = k.plot_name
+        JOIN vswir_plants.sample s
+            ON  s.plot_id = pl.plot_id
+            AND s.collection_date::text = k.collection_date
+            AND s.sample_name = k.sample_name
+        """,
+        conn,
+    )
+    return set(zip(
+        df["campaign_name"], df["plot_name"],
+        df["collection_date"], df["sample_name"],
+    ))
+
+
+def fetch_bundle_leaf_trait_set(conn) -> set:
+    """fetch_leaf_trait_set, for the keys in _bundle_trait."""
+    df = pd.read_sql(
+        """
+        SELECT pl.campaign_name, pl.plot_name,
+               lt.collection_date::text AS collection_date,
+               lt.sample_name, lt.trait::text AS trait
+        FROM (SELECT DISTINCT campaign_name, plot_name, collection_date, sample_name, trait
+              FROM _bundle_trait) k
+        JOIN vswir_plants.plot pl
+            ON pl.campaign_name = k.campaign_name AND pl.plot_name = k.plot_name
+        JOIN vswir_plants.leaf_traits lt
+            ON  lt.plot_id = pl.plot_id
+            AND lt.collection_date::text = k.collection_date
+            AND lt.sample_name = k.sample_name
+            AND lt.trait::text = k.trait
         """,
         conn,
     )
@@ -185,18 +461,45 @@ def fetch_leaf_trait_set(conn) -> set:
 
 # ── spectra ────────────────────────────────────────────────────────────────────
 
-def fetch_pixel_set(conn) -> set:
+def fetch_pixel_set(conn, campaigns: set | None = None) -> set:
     """
     Set of (campaign_name, plot_name, granule_id, glt_row, glt_column) in production.
     Unique index on pixel is (plot_id, granule_id, glt_row, glt_column) — joined
-    to plot to get the natural key.
+    to plot to get the natural key. glt_row / glt_column come back as text,
+    as spectra.csv is read.
     """
+    where, params = _scope("pl.campaign_name", campaigns)
     df = pd.read_sql(
-        """
+        f"""
         SELECT pl.campaign_name, pl.plot_name,
-               px.granule_id, px.glt_row, px.glt_column
+               px.granule_id, px.glt_row::text AS glt_row, px.glt_column::text AS glt_column
         FROM vswir_plants.pixel px
         JOIN vswir_plants.plot pl ON pl.plot_id = px.plot_id
+        {where}
+        """,
+        conn, params=params,
+    )
+    return set(zip(
+        df["campaign_name"], df["plot_name"],
+        df["granule_id"], df["glt_row"], df["glt_column"],
+    ))
+
+
+def fetch_bundle_pixel_set(conn) -> set:
+    """fetch_pixel_set, for the keys in _bundle_pixel."""
+    df = pd.read_sql(
+        """
+        SELECT pl.campaign_name, pl.plot_name,
+               px.granule_id, px.glt_row::text AS glt_row, px.glt_column::text AS glt_column
+        FROM (SELECT DISTINCT campaign_name, plot_name, granule_id, glt_row, glt_column
+              FROM _bundle_pixel) k
+        JOIN vswir_plants.plot pl
+            ON pl.campaign_name = k.campaign_name AND pl.plot_name = k.plot_name
+        JOIN vswir_plants.pixel px
+            ON  px.plot_id = pl.plot_id
+            AND px.granule_id = k.granule_id
+            AND px.glt_row::text = k.glt_row
+            AND px.glt_column::text = k.glt_column
         """,
         conn,
     )
@@ -208,17 +511,71 @@ def fetch_pixel_set(conn) -> set:
 
 # ── wavelengths ────────────────────────────────────────────────────────────────
 
-def fetch_wavelength_band_counts(conn) -> dict:
+def fetch_wavelength_band_counts(conn, campaigns: set | None = None) -> dict:
     """Map of (campaign_name, sensor_name) → band count in production."""
+    where, params = _scope("campaign_name", campaigns)
     df = pd.read_sql(
-        """
+        f"""
         SELECT campaign_name, sensor_name,
                array_length(wavelength_center, 1) AS band_count
         FROM vswir_plants.sensor_campaign
+        {where}
         """,
-        conn,
+        conn, params=params,
     )
     return {
         (row["campaign_name"], row["sensor_name"]): row["band_count"]
         for _, row in df.iterrows()
     }
+
+
+# ── bundle keys ────────────────────────────────────────────────────────────────
+
+def _scope(column: str, values: set | None) -> tuple[str, tuple | None]:
+    """WHERE clause and params restricting column to values; none when values is None."""
+    if values is None:
+        return "", None
+    return f"WHERE {column} = ANY(%s)", (sorted(values),)
+
+
+def _plot_properties(geojson) -> pd.DataFrame:
+    """
+    The features' properties as a frame; empty if plots.geojson is malformed
+    (plots.py reports it).
+    """
+    features = geojson.get("features") if isinstance(geojson, dict) else None
+    if not isinstance(features, list):
+        return pd.DataFrame()
+    return pd.DataFrame([f.get("properties") or {} for f in features if isinstance(f, dict)])
+
+
+def _key_frame(df: pd.DataFrame, key_cols: list[str]) -> pd.DataFrame:
+    """
+    Distinct non-null keys from one bundle file, as text. Files missing a key
+    column contribute none — their required-column check fails instead.
+    """
+    if not set(key_cols) <= set(df.columns):
+        return pd.DataFrame(columns=key_cols, dtype=str)
+    return df[key_cols].dropna().astype(str).drop_duplicates()
+
+
+def _in_plot_set(keys: pd.DataFrame, plot_set: set) -> pd.DataFrame:
+    """Keys whose (campaign_name, plot_name) is in production; no others can collide."""
+    if keys.empty or not plot_set:
+        return keys.iloc[:0]
+    return keys[pd.MultiIndex.from_frame(keys[PLOT_KEY]).isin(plot_set)]
+
+
+def _copy_keys(conn, table: str, keys: pd.DataFrame):
+    """COPY keys into a new temp table of text columns, dropped at commit."""
+    keys    = keys.drop_duplicates()
+    columns = ", ".join(f"{c} TEXT" for c in keys.columns)
+    buf = io.StringIO()
+    keys.to_csv(buf, index=False, header=False, na_rep="\\N")
+    buf.seek(0)
+
+    with conn.cursor() as cur:
+        cur.execute(f"CREATE TEMP TABLE {table} ({columns}) ON COMMIT DROP")
+        cur.copy_expert(f"COPY {table} FROM STDIN WITH (FORMAT CSV, NULL '\\N')", buf)
+        cur.execute(f"ANALYZE {table}")
+    logger.info("%s: %d bundle keys", table, len(keys))
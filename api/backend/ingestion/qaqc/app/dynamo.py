@@ -7,12 +7,19 @@ import os
 import logging
 from datetime import datetime, timezone
 
-import boto3
-
-logger   = logging.getLogger(__name__)
-dynamodb = boto3.client("dynamodb", region_name=os.environ.get("AWS_REGION", "us-west-2"))
+logger    = logging.getLogger(__name__)
 JOB_TABLE = os.environ["JOB_TABLE"]
 
+_dynamodb = None
+
+
+def _client():
+    global _dynamodb
+    if _dynamodb is None:
+        import boto3
+        _dynamodb = boto3.client("dynamodb", region_name=os.environ.get("AWS_REGION", "us-west-2"))
+    return _dynamodb
+
 
 def update_status(batch_id: str, status: str, qaqc_report: dict = None, s3_key: str = None):
     """
@@ -29,7 +36,7 @@ def update_status(batch_id: str, status: str, qaqc_report: dict = None, s3_key:
 
     if status == "QAQC_RUNNING":
         # Atomic increment of run_count + record start time
-        dynamodb.update_item(
+        _client().update_item(
             TableName=JOB_TABLE,
             Key={"job_id": {"S": batch_id}},
             UpdateExpression=(
@@ -78,7 +85,7 @@ def update_status(batch_id: str, status: str, qaqc_report: dict = None, s3_key:
         expr        += ", qaqc_report_s3_key = :k"
         values[":k"] = {"S": s3_key}
 
-    dynamodb.update_item(
+    _client().update_item(
         TableName=JOB_TABLE,
         Key={"job_id": {"S": batch_id}},
         UpdateExpression=expr,
@@ -1,9 +1,10 @@
 import logging
+import os
 
-from app.db import get_connection, load_enums
+from app.db import get_connection
 from app.s3_files import download_raw_files, parse_files, write_report
 from app.dynamo import update_status
-from app.db_refs import load_all as load_db_refs
+from app import db_refs, ref_cache
 from app.staging import load_all as load_staging
 from app.checks.types import CheckContext
 from app.checks.runner import run_all as run_checks
@@ -11,6 +12,12 @@ from app.checks.runner import run_all as run_checks
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 'bundle' loads only the production rows the bundle's keys collide with
+# (db_refs.load_for_bundle); 'campaign' loads the rows of the bundle's campaigns
+# and granules over concurrent connections (db_refs.load_scoped); 'full' loads
+# every production key (db_refs.load_all).
+DB_REFS_MODE = os.environ.get("DB_REFS_MODE", "bundle").lower()
+
 
 def lambda_handler(event, context):
     batch_id = event["batch_id"]
@@ -44,10 +51,20 @@ def _run_qaqc(batch_id: str):
         update_status(batch_id, "QAQC_FAIL", report, s3_key)
         return
 
+    data = {
+        "campaign_metadata": df_campaign,
+        "wavelengths":       df_wl,
+        "granule_metadata":  df_granule,
+        "plots":             geojson,
+        "traits":            df_traits,
+        "spectra":           df_spectra,
+    }
+
     # ── 2. Load DB enums and production reference sets ────────────────────────
-    conn  = get_connection()
-    enums = load_enums(conn)
-    db    = load_db_refs(conn)
+    # Cached across invocations per data version (ref_cache), so a recheck
+    # whose keys have not changed does not reload them.
+    conn      = get_connection()
+    enums, db = ref_cache.load(conn, data, DB_REFS_MODE, lambda: _load_db_refs(conn, data))
 
     # ── 3. Build context and run all checks ───────────────────────────────────
     # Pre-compute bundle band counts and seed them into context.output before
@@ -60,14 +77,7 @@ def _run_qaqc(batch_id: str):
     context = CheckContext(
         enums=enums,
         db=db,
-        data={
-            "campaign_metadata": df_campaign,
-            "wavelengths":       df_wl,
-            "granule_metadata":  df_granule,
-            "plots":             geojson,
-            "traits":            df_traits,
-            "spectra":           df_spectra,
-        },
+        data=data,
         output={
             # Seed band counts so SpectraCheck can find them even if
             # WavelengthsCheck hasn't explicitly forwarded them.
@@ -121,3 +131,11 @@ def _run_qaqc(batch_id: str):
 
     update_status(batch_id, "QAQC_PASS", report, s3_key)
     logger.info("QAQC complete for batch_id=%s", batch_id)
+
+
+def _load_db_refs(conn, data: dict) -> dict:
+    if DB_REFS_MODE == "full":
+        return db_refs.load_all(conn)
+    if DB_REFS_MODE == "campaign":
+        return db_refs.load_scoped(get_connection, *db_refs.bundle_scope(data))
+    return db_refs.load_for_bundle(conn, data)
@@ -0,0 +1,181 @@
+"""
+Cross-invocation cache of the QAQC reference data: the enums and the
+db_refs sets/maps a bundle is checked against.
+
+Entries are keyed by the production data-version stamp (db.data_version),
+which promotion and schema/add_enum_values.py bump, and by the scope the sets
+were loaded for (scope_key) — the whole database, the bundle's campaigns and
+granules, or the bundle's keys, following DB_REFS_MODE. A recheck of a batch
+whose keys have not changed therefore skips the reference reload.
+
+Two tiers:
+  in-container   the last REF_CACHE_ENTRIES entries, for warm invocations
+  config bucket  ingestion/qaqc-ref-cache/<version>/<scope>.parquet, one
+                 long-format Parquet table per entry, for cold ones
+
+The stamp is read before anything is loaded, so an entry is never older than
+the version it is filed under. If the stamp cannot be read the cache is
+bypassed. REF_CACHE_ENTRIES=0 disables the cache; REF_CACHE_SNAPSHOTS=false
+keeps it in-container only.
+"""
+
+import io
+import json
+import os
+import hashlib
+import logging
+from collections import OrderedDict
+
+import pandas as pd
+
+from app import db_refs
+from app.db import data_version, load_enums
+from app.s3_files import read_ref_snapshot, write_ref_snapshot
+
+logger = logging.getLogger(__name__)
+
+CACHE_ENTRIES = int(os.environ.get("REF_CACHE_ENTRIES", "2"))
+SNAPSHOTS     = os.environ.get("REF_CACHE_SNAPSHOTS", "true").lower() == "true"
+
+# Snapshot layout: db_refs entry → (key width, value kind). Keys go in
+# k0..k4; map values in "value" (float / int) or "geom" (WKB).
+LAYOUT = {
+    "campaign_names":         (1, None),
+    "campaign_sensor_set":    (2, None),
+    "granule_ids":            (1, None),
+    "granule_gsd_map":        (1, "float"),
+    "plot_set":               (2, None),
+    "plot_intersect_set":     (3, None),
+    "plot_shape_map":         (3, "geom"),
+    "insitu_plot_event_set":  (3, None),
+    "sample_set":             (4, None),
+    "leaf_trait_set":         (5, None),
+    "pixel_set":              (5, None),
+    "wavelength_band_counts": (2, "int"),
+}
+KEY_COLS = ["k0", "k1", "k2", "k3", "k4"]
+
+_entries = OrderedDict()  # (version, scope) → (enums, db)
+
+
+def load(conn, data: dict, mode: str, load_refs) -> tuple[dict, dict]:
+    """
+    (enums, db) for this bundle: from the cache if an entry for the current
+    data version and this scope exists, else load_enums plus load_refs() —
+    the DB_REFS_MODE loader — stored in both tiers.
+    """
+    version = data_version(conn) if CACHE_ENTRIES > 0 else None
+    if version is None:
+        return load_enums(conn), load_refs()
+
+    key = (version, scope_key(mode, data))
+    if key in _entries:
+        logger.info("Reference data from container cache (version=%s, scope=%s)", *key)
+        _entries.move_to_end(key)
+        return _entries[key]
+
+    entry = _read_snapshot(key) if SNAPSHOTS else None
+    if entry is None:
+        entry = load_enums(conn, version), load_refs()
+        if SNAPSHOTS:
+            _write_snapshot(key, entry)
+
+    _entries[key] = entry
+    while len(_entries) > CACHE_ENTRIES:
+        _entries.popitem(last=False)
+    return entry
+
+
+def scope_key(mode: str, data: dict) -> str:
+    """
+    What the reference sets are loaded for. Within one data version, equal
+    scope keys mean equal sets.
+    """
+    if mode == "full":
+        return "full"
+    campaigns, granule_ids = db_refs.bundle_scope(data)
+    digest = hashlib.sha256(json.dumps([sorted(campaigns), sorted(granule_ids)]).encode())
+    if mode != "campaign":
+        digest.update(db_refs.bundle_key_digest(data))
+    return f"{mode}-{digest.hexdigest()[:32]}"
+
+
+# ── Snapshots ─────────────────────────────────────────────────────────────────
+
+def _snapshot_name(key: tuple) -> str:
+    version, scope = key
+    return f"{version}/{scope}.parquet"
+
+
+def _read_snapshot(key: tuple):
+    body = read_ref_snapshot(_snapshot_name(key))
+    if body is None:
+        return None
+    try:
+        entry = decode(body)
+    except Exception:
+        logger.warning("Unreadable reference snapshot %s — reloading", _snapshot_name(key), exc_info=True)
+        return None
+    logger.info("Reference data from snapshot (version=%s, scope=%s)", *key)
+    return entry
+
+
+def _write_snapshot(key: tuple, entry: tuple):
+    """A failed write only costs the next cold start a reload."""
+    try:
+        write_ref_snapshot(_snapshot_name(key), encode(*entry))
+    except Exception:
+        logger.warning("Could not write reference snapshot %s", _snapshot_name(key), exc_info=True)
+
+
+def encode(enums: dict, db: dict) -> bytes:
+    """(enums, db) as one Parquet table: a row per set member / map entry, tagged by ref."""
+    import shapely
+
+    frames = [pd.DataFrame(
+        [(name, label) for name, labels in enums.items() for label in labels],
+        columns=["k0", "k1"],
+    ).assign(ref="enum")]
+    for ref, (width, kind) in LAYOUT.items():
+        entries = db[ref]
+        keys    = list(entries)
+        frame   = pd.DataFrame(keys if width > 1 else {"k0": keys}, columns=KEY_COLS[:width])
+        if kind == "geom":
+            frame["geom"] = shapely.to_wkb(list(entries.values()))
+        elif kind is not None:
+            frame["value"] = pd.Series(list(entries.values()), dtype="float64")
+        frames.append(frame.assign(ref=ref))
+
+    table = pd.concat(frames, ignore_index=True)
+    table["ref"] = table["ref"].astype("category")
+    buf = io.BytesIO()
+    table.to_parquet(buf, index=False)
+    return buf.getvalue()
+
+
+def decode(body: bytes) -> tuple[dict, dict]:
+    """Inverse of encode."""
+    import shapely
+
+    table = pd.read_parquet(io.BytesIO(body))
+    parts = dict(tuple(table.groupby("ref", observed=True)))
+    empty = table.iloc[:0]
+
+    enum_rows = parts.get("enum", empty)
+    enums = {}
+    for name, label in zip(enum_rows["k0"], enum_rows["k1"]):
+        enums.setdefault(name, set()).add(label)
+
+    db = {}
+    for ref, (width, kind) in LAYOUT.items():
+        frame = parts.get(ref, empty)
+        keys  = frame["k0"].tolist() if width == 1 else list(zip(*(frame[c].tolist() for c in KEY_COLS[:width])))
+        if kind is None:
+            db[ref] = set(keys)
+        elif kind == "geom":
+            db[ref] = dict(zip(keys, shapely.from_wkb(frame["geom"].to_numpy())))
+        elif kind == "int":
+            db[ref] = dict(zip(keys, (int(v) if v == v else v for v in frame["value"].tolist())))
+        else:
+            db[ref] = dict(zip(keys, frame["value"].tolist()))
+    return enums, db
@@ -4,23 +4,33 @@ S3 operations for the QAQC lambda:
 - Downloading raw bundle files
 - Parsing files into DataFrames / dicts
 - Writing the QAQC report back to S3
+- Reading and writing reference-data snapshots (ref_cache.py)
 """
 
 import io
 import json
 import os
 import logging
-import boto3
 import pandas as pd
 from datetime import datetime, timezone
 from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
-s3     = boto3.client("s3", region_name=os.environ.get("AWS_REGION", "us-west-2"))
 BUCKET = os.environ["CONFIG_BUCKET"]
 
+_s3 = None
+
+
+def _client():
+    global _s3
+    if _s3 is None:
+        import boto3
+        _s3 = boto3.client("s3", region_name=os.environ.get("AWS_REGION", "us-west-2"))
+    return _s3
+
 BUNDLE_CONFIG_KEY = "ingestion/bundle_config.json"
+REF_CACHE_PREFIX  = "ingestion/qaqc-ref-cache/"
 
 
 @lru_cache(maxsize=1)
@@ -30,7 +40,7 @@ def get_file_slots() -> dict:
     Cached per warm Lambda instance.
     Returns { slot_name: extension } e.g. { "spectra": ".csv" }
     """
-    resp   = s3.get_object(Bucket=BUCKET, Key=BUNDLE_CONFIG_KEY)
+    resp   = _client().get_object(Bucket=BUCKET, Key=BUNDLE_CONFIG_KEY)
     config = json.loads(resp["Body"].read())
     return config["file_slots"]
 
@@ -43,7 +53,7 @@ def download_raw_files(batch_id: str) -> dict:
     raw = {}
     for slot, ext in get_file_slots().items():
         key = f"ingestion/{batch_id}/raw/{slot}{ext}"
-        resp = s3.get_object(Bucket=BUCKET, Key=key)
+        resp = _client().get_object(Bucket=BUCKET, Key=key)
         raw[slot] = resp["Body"].read()
         logger.info("Downloaded %s", key)
     return raw
@@ -80,7 +90,7 @@ def write_report(batch_id: str, status: str, qaqc_report: dict) -> str:
         "checked_at": datetime.now(timezone.utc).isoformat(),
         "files":      qaqc_report,
     }
-    s3.put_object(
+    _client().put_object(
         Bucket=BUCKET,
         Key=key,
         Body=json.dumps(full_report, indent=2).encode(),
@@ -88,3 +98,26 @@ def write_report(batch_id: str, status: str, qaqc_report: dict) -> str:
     )
     logger.info("Wrote QAQC report to s3://%s/%s", BUCKET, key)
     return key
+
+
+def read_ref_snapshot(name: str) -> bytes | None:
+    """
+    Reference-data snapshot written by write_ref_snapshot, or None if there is
+    none. Without s3:ListBucket a missing key reads as AccessDenied, so any
+    client error counts as a miss.
+    """
+    from botocore.exceptions import ClientError
+
+    key = REF_CACHE_PREFIX + name
+    try:
+        resp = _client().get_object(Bucket=BUCKET, Key=key)
+    except ClientError as e:
+        logger.info("No reference snapshot at s3://%s/%s (%s)", BUCKET, key, e.response["Error"]["Code"])
+        return None
+    return resp["Body"].read()
+
+
+def write_ref_snapshot(name: str, body: bytes):
+    key = REF_CACHE_PREFIX + name
+    _client().put_object(Bucket=BUCKET, Key=key, Body=body)
+    logger.info("Wrote reference snapshot to s3://%s/%s (%d bytes)", BUCKET, key, len(body))
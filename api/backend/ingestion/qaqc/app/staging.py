@@ -8,11 +8,7 @@ Uses pandas/geopandas for bulk inserts and copy_expert for large tables.
 import io
 import json
 import logging
-import numpy as np
 import pandas as pd
-import geopandas as gpd
-from shapely.geometry import shape
-from sqlalchemy import text
 import psycopg2.extras
 
 logger     = logging.getLogger(__name__)
@@ -106,6 +102,9 @@ def _load_plot_shapes(conn, engine, geojson: dict, batch_id: str) -> dict:
     Insert plot shapes using GeoPandas to_postgis.
     Returns { (campaign_name, plot_name, granule_id): staging_plot_shape_id }
     """
+    import geopandas as gpd
+    from shapely.geometry import shape
+
     features = geojson["features"]
     geoms    = [shape(f["geometry"]) for f in features]
     keys     = [
@@ -304,31 +303,40 @@ def _load_pixels(conn, df: pd.DataFrame, plot_id_map: dict, batch_id: str) -> di
 def _load_spectra(conn, df: pd.DataFrame, pixel_id_map: dict, batch_id: str) -> int:
     """
     Bulk insert extracted_spectra using copy_expert.
-    Assembles the radiance array per pixel and streams to Postgres.
+    The band columns are written by pandas' CSV writer as one comma-separated
+    line per pixel; the first and last columns carry the pixel_id / batch_id
+    around it, so each line is already a COPY TEXT row with a radiance array
+    literal. No band value passes through Python on its own.
     """
     band_cols = sorted([c for c in df.columns if _is_band_col(c)], key=int)
+    if not band_cols or not pixel_id_map:
+        return 0
 
-    rows = []
-    for _, row in df.iterrows():
-        key = (row["campaign_name"], row["plot_name"], row["granule_id"],
-               int(row["glt_row"]), int(row["glt_column"]))
-        pixel_id = pixel_id_map.get(key)
-        if not pixel_id:
-            continue
-        radiance = "{" + ",".join(str(row[c]) for c in band_cols) + "}"
-        rows.append(f"{pixel_id}\t{radiance}\t{batch_id}\n")
-
-    if not rows:
+    keys = pd.MultiIndex.from_arrays([
+        df["campaign_name"], df["plot_name"], df["granule_id"],
+        df["glt_row"].astype(int), df["glt_column"].astype(int),
+    ])
+    pixel_ids = pd.Series(pixel_id_map).reindex(keys)
+    found     = pixel_ids.notna().to_numpy()
+    if not found.any():
         return 0
 
-    buf = io.StringIO("".join(rows))
+    out = df.loc[found, band_cols].copy()
+    first, last = band_cols[0], band_cols[-1]
+    out[first] = pixel_ids[found].astype(int).astype(str).to_numpy() + "\t{" + out[first]
+    out[last]  = out[last] + "}\t" + batch_id
+
+    buf = io.StringIO()
+    out.to_csv(buf, sep=",", index=False, header=False)
+    buf.seek(0)
+
     with conn.cursor() as cur:
         cur.copy_expert("""
             COPY vswir_plants_staging.extracted_spectra (pixel_id, radiance, batch_id)
             FROM STDIN WITH (FORMAT TEXT)
         """, buf)
 
-    return len(rows)
+    return len(out)
 
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
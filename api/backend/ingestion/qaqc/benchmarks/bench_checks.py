@@ -0,0 +1,270 @@
+"""
+Timing benchmark and golden-report comparison for the QAQC checks.
+
+Builds a synthetic bundle in memory — CSV bytes parsed by s3_files.parse_files,
+as the Lambda does — with enums and production reference sets to match, then
+runs every check module in runner order and reports the time each takes.
+--bad sets the fraction of rows carrying a fault (bad casts, invalid enums,
+unresolved keys, rows already in the DB, out-of-range values, pixels outside
+their plot), so the error paths are exercised as well as the clean ones.
+
+The bundle depends only on the arguments, so reports from two versions of the
+checks can be compared: --save writes the report as JSON, --golden compares
+against a saved one and exits non-zero on any difference.
+
+    cd api/backend/ingestion/qaqc
+    python benchmarks/bench_checks.py --pixels 200000 --save golden.json
+    python benchmarks/bench_checks.py --pixels 200000 --golden golden.json
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+os.environ.setdefault("CONFIG_BUCKET", "local")
+
+CAMPAIGN = "bench_campaign"
+SENSOR   = "AVIRIS-NG"
+GSD      = 5.0
+
+ENUMS = {
+    "Repository":           {"ORNL DAAC", "EcoSIS"},
+    "Sensor_name":          {SENSOR, "NEON AIS 1"},
+    "ELEVATION_source":     {"NEON AOP Lidar", "Copernicus DEM"},
+    "CLOUD_conditions":     {"Green", "Yellow"},
+    "CLOUD_type":           {"Stratus", "Cumulus"},
+    "EXTRACTION_method":    {"Buffer", "Polygon"},
+    "DELINEATION_method":   {"In Field", "Imagery"},
+    "PLOT_method":          {"Transect", "Quadrat"},
+    "VEGETATION_type":      {"Shrub", "Grass"},
+    "SUBPLOT_cover_method": {"Point", "Visual"},
+    "TAXA":                 {"Agrostis spp", "Quercus agrifolia"},
+    "VEG_or_cover_type":    {"Grass", "Tree"},
+    "PHENOPHASE":           {"Leaves fully expanded", "Senescing"},
+    "FRACTIONAL_class":     {"pv", "npv"},
+    "PLANT_status":         {"Healthy", "Insect damaged"},
+    "CANOPY_position":      {"Full sun", "Shaded"},
+    "Trait":                {"LMA", "LWC", "Nitrogen"},
+    "Trait_method":         {"Chemical analysis", "Gravimetric"},
+    "Sample_handling":      {"Fresh", "Frozen"},
+    "Trait_units":          {"g/m2", "percentage"},
+    "Error_type":           {"SD", "SE"},
+}
+
+SPECTRA_COLS = [
+    "plot_name", "campaign_name", "sensor_name", "granule_id", "glt_row", "glt_column",
+    "lon", "lat", "elevation", "shade_mask", "path_length", "to_sensor_azimuth",
+    "to_sensor_zenith", "to_sun_azimuth", "to_sun_zenith", "solar_phase", "slope",
+    "aspect", "utc_time", "cosine_i", "raw_cosine_i",
+]
+TRAIT_COLS = [
+    "plot_name", "campaign_name", "collection_date", "plot_veg_type", "subplot_cover_method",
+    "floristic_survey", "sample_name", "taxa", "veg_or_cover_type", "phenophase",
+    "sample_fc_class", "sample_fc_percent", "plant_status", "canopy_position", "trait",
+    "value", "method", "handling", "units", "error", "error_type",
+]
+
+
+def _csv(header: list, rows: list) -> bytes:
+    return "\n".join([",".join(header)] + [",".join(str(v) for v in r) for r in rows]).encode()
+
+
+def _plot_centre(p: int) -> tuple:
+    return -120 + (p % 100) * 0.01, 34 + (p // 100) * 0.01
+
+
+def make_bundle(pixels: int, plots: int, granules: int, bands: int, bad: float, seed: int):
+    """Returns (raw_files, db_refs) — raw_files as s3_files.download_raw_files returns them."""
+    rng = random.Random(seed)
+    def faulty():
+        return rng.random() < bad
+
+    granule_ids = [f"ang2020{g:04d}t000000" for g in range(granules)]
+    raw = {
+        "campaign_metadata": _csv(
+            ["campaign_name", "primary_funding_source", "sensor_name", "elevation_source",
+             "data_repository", "doi", "taxa_system"],
+            [[CAMPAIGN, "NASA", SENSOR, "NEON AOP Lidar", "EcoSIS", "", ""]],
+        ),
+        "wavelengths": _csv(
+            ["campaign_name", "sensor_name", "band", "wavelength", "fwhm"],
+            [[CAMPAIGN, SENSOR, b, 4000 if faulty() else 380 + 5 * b, 0.01 if faulty() else 5.0]
+             for b in range(bands)],
+        ),
+        "granule_metadata": _csv(
+            ["granule_id", "campaign_name", "sensor_name", "acquisition_date",
+             "acquisition_start_time", "cloudy_conditions", "cloud_type", "gsd", "raster_epsg"],
+            [[g, CAMPAIGN, SENSOR, "2020-13-01" if faulty() else "2020-06-01",
+              "25:00:00" if faulty() else "10:30:00", "Green", "Stratus", GSD, 32611]
+             for g in granule_ids],
+        ),
+    }
+
+    intersects, features = [], []
+    for p in range(plots):
+        lon, lat = _plot_centre(p)
+        ring = [[lon - 2e-4, lat - 2e-4], [lon + 2e-4, lat - 2e-4], [lon + 2e-4, lat + 2e-4],
+                [lon - 2e-4, lat + 2e-4], [lon - 2e-4, lat - 2e-4]]
+        for g in rng.sample(granule_ids, min(2, granules)):
+            intersects.append((f"plot_{p}", g, lon, lat))
+            features.append({
+                "type": "Feature",
+                "geometry": {"type": "Polygon", "coordinates": [ring]},
+                "properties": {
+                    "plot_name": f"plot_{p}", "campaign_name": CAMPAIGN, "site_id": "site",
+                    "granule_id": g, "extraction_method": "Buffer",
+                    "delineation_method": "In Field", "shape_aligned_to_granule": True,
+                },
+            })
+    raw["plots"] = json.dumps({"type": "FeatureCollection", "features": features}).encode()
+
+    trait_rows = []
+    for p in range(plots):
+        for s in range(3):
+            for trait in ("LMA", "LWC"):
+                error = "0.5" if faulty() else ""
+                trait_rows.append([
+                    f"plot_{p}" if not faulty() else f"missing_{p}", CAMPAIGN,
+                    "2020-06-01" if not faulty() else "06/01/2020",
+                    "Shrub", "Point", "maybe" if faulty() else "true", f"S{s}",
+                    "Agrostis spp", "Grass" if not faulty() else "Moss", "Leaves fully expanded",
+                    "pv", 50, "Healthy", "Full sun", trait,
+                    f"{rng.uniform(0, 300):.4f}" if not faulty() else "n/a",
+                    "Chemical analysis", "Fresh", "percentage",
+                    error, "SD" if error and not faulty() else "",
+                ])
+    raw["traits"] = _csv(TRAIT_COLS, trait_rows)
+
+    spectra_rows = []
+    for i in range(pixels):
+        plot, granule, lon, lat = intersects[i % len(intersects)]
+        row, col = divmod(i // len(intersects), 16)
+        if faulty():
+            fault = rng.randrange(6)
+            if fault == 0:
+                plot = f"missing_{plot}"
+            elif fault == 1:
+                granule = granule_ids[(granule_ids.index(granule) + 1) % granules]
+            elif fault == 2:
+                lon += 0.005
+            elif fault == 3:
+                lat = 95.0
+            elif fault == 4:
+                row = "1.5"
+            else:
+                row, col = 0, 0
+        spectra_rows.append(
+            [plot, CAMPAIGN, SENSOR, granule, row, col,
+             f"{lon + rng.uniform(-1e-4, 1e-4):.7f}", f"{lat + rng.uniform(-1e-4, 1e-4):.7f}",
+             100.0, "false", 1000.0, 10.0, 20.0, 30.0, 40.0, 50.0, 1.0, 2.0, 18.5, 0.9, ""]
+            + [f"{rng.uniform(0, 1):.5f}" for _ in range(bands)]
+        )
+    raw["spectra"] = _csv(SPECTRA_COLS + [str(b) for b in range(bands)], spectra_rows)
+
+    # A slice of the bundle already "in production", so the not-in-DB checks fire
+    existing = [r for r in spectra_rows if rng.random() < bad]
+    db_refs = {
+        "campaign_names":         set(),
+        "campaign_sensor_set":    set(),
+        "granule_ids":            set(granule_ids[:1]) if bad else set(),
+        "granule_gsd_map":        {},
+        "plot_set":               set(),
+        "plot_intersect_set":     set(),
+        "plot_shape_map":         {},
+        "insitu_plot_event_set":  {(r[1], r[0], r[2]) for r in trait_rows[::7]} if bad else set(),
+        "sample_set":             {(r[1], r[0], r[2], r[6]) for r in trait_rows[::11]} if bad else set(),
+        "leaf_trait_set":         {(r[1], r[0], r[2], r[6], r[14]) for r in trait_rows[::13]} if bad else set(),
+        "pixel_set":              {(r[1], r[0], r[3], str(r[4]), str(r[5])) for r in existing},
+        "wavelength_band_counts": {},
+    }
+    return raw, db_refs
+
+
+def build_context(raw: dict, db_refs: dict):
+    """The CheckContext main._run_qaqc builds from a downloaded bundle."""
+    from app.checks.types import CheckContext
+    from app.s3_files import parse_files
+
+    df_campaign, df_wl, df_granule, df_traits, df_spectra, geojson = parse_files(raw)
+    bundle_band_counts = {
+        (camp, sens): len(grp)
+        for (camp, sens), grp in df_wl.groupby(["campaign_name", "sensor_name"])
+    }
+    return CheckContext(
+        enums=ENUMS,
+        db=db_refs,
+        data={
+            "campaign_metadata": df_campaign,
+            "wavelengths":       df_wl,
+            "granule_metadata":  df_granule,
+            "plots":             geojson,
+            "traits":            df_traits,
+            "spectra":           df_spectra,
+        },
+        output={"bundle_band_counts": bundle_band_counts},
+    )
+
+
+def run_checks(context) -> tuple:
+    """runner.run_all, timed per check module. Returns (report, seconds per file)."""
+    from app.checks.runner import CHECKS
+
+    report, timings = {}, {}
+    for module in CHECKS:
+        t0     = time.perf_counter()
+        result = module.check(context)
+        timings[result.file_name] = time.perf_counter() - t0
+        report[result.file_name] = {
+            "row_count": result.row_count,
+            "errors":    result.errors,
+            "warnings":  result.warnings,
+        }
+    return report, timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pixels", type=int, default=200_000, help="spectra.csv rows")
+    parser.add_argument("--plots", type=int, default=500)
+    parser.add_argument("--granules", type=int, default=20)
+    parser.add_argument("--bands", type=int, default=50)
+    parser.add_argument("--bad", type=float, default=0.01, help="fraction of rows carrying a fault")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save", help="write the report to this JSON file")
+    parser.add_argument("--golden", help="report JSON from an earlier --save to compare against")
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    raw, db_refs = make_bundle(args.pixels, args.plots, args.granules, args.bands, args.bad, args.seed)
+    context = build_context(raw, db_refs)
+    print(f"bundle built and parsed in {time.perf_counter() - t0:.1f} s")
+
+    report, timings = run_checks(context)
+    print(f"{'file':20s} {'rows':>8s} {'errors':>7s} {'warnings':>9s} {'seconds':>9s}")
+    for name, seconds in timings.items():
+        r = report[name]
+        print(f"{name:20s} {r['row_count']:8d} {len(r['errors']):7d} {len(r['warnings']):9d} {seconds:9.2f}")
+    print(f"{'total':20s} {'':8s} {'':7s} {'':9s} {sum(timings.values()):9.2f}")
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(report, f, indent=1)
+
+    if args.golden:
+        with open(args.golden) as f:
+            golden = json.load(f)
+        current = json.loads(json.dumps(report))
+        differing = [name for name in golden.keys() | current.keys() if golden.get(name) != current.get(name)]
+        for name in sorted(differing):
+            print(f"REPORT DIFFERS: {name}")
+        if differing:
+            sys.exit(1)
+        print("report matches", args.golden)
+
+
+if __name__ == "__main__":
+    main()
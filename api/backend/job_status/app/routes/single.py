@@ -1,7 +1,49 @@
+import time
+
 from app.auth import respond
 from app.services import dynamo
 
 
+def _number(item: dict, attr: str, cast=int):
+    value = item.get(attr, {}).get("N")
+    return cast(value) if value is not None else None
+
+
+def _eta_seconds(rows_processed: int, total_rows: int | None, rows_per_second: float | None):
+    """
+    Seconds left at the current throughput. total_rows is the planner's
+    estimate, so there is no ETA once the export has outrun it.
+    """
+    if not total_rows or not rows_per_second or rows_processed >= total_rows:
+        return None
+    return round((total_rows - rows_processed) / rows_per_second)
+
+
+def _shard_progress(job_id: str, shard_count: int) -> dict:
+    """
+    Progress of a fanned-out export, summed over its shard jobs. Throughput
+    is measured from the first shard's start, so it reflects the shards
+    running side by side rather than any one of them.
+    """
+    children = dynamo.query_child_jobs(job_id)
+    statuses = [c.get("status", {}).get("S") for c in children]
+    started  = [s for s in (_number(c, "started_at") for c in children) if s]
+    rows     = sum(_number(c, "rows_processed") or 0 for c in children)
+    elapsed  = time.time() - min(started) if started else 0
+
+    return {
+        "rows_processed":  rows,
+        "bytes_uploaded":  sum(_number(c, "bytes_uploaded") or 0 for c in children),
+        "rows_per_second": round(rows / elapsed, 1) if elapsed > 0 else None,
+        "shards": {
+            "total":    shard_count,
+            "complete": statuses.count("complete"),
+            "failed":   statuses.count("failed"),
+            "running":  sum(1 for s in statuses if not s),
+        },
+    }
+
+
 def job_status(event: dict, job_id: str) -> dict:
     """GET /job_status/{id} — single job lookup used by the spectra extraction flow."""
     item = dynamo.get_job(job_id)
@@ -9,9 +51,29 @@ def job_status(event: dict, job_id: str) -> dict:
     if not item:
         return respond(404, {"message": "Job not found"})
 
+    status          = item.get("status", {}).get("S")
+    rows_processed  = _number(item, "rows_processed") or 0
+    rows_per_second = _number(item, "rows_per_second", float)
+    total_rows      = _number(item, "total_rows_estimate")
+    bytes_uploaded  = _number(item, "bytes_uploaded")
+    shards          = None
+
+    shard_count = _number(item, "shard_count")
+    if shard_count:
+        progress        = _shard_progress(job_id, shard_count)
+        rows_processed  = progress["rows_processed"]
+        bytes_uploaded  = progress["bytes_uploaded"]
+        rows_per_second = progress["rows_per_second"]
+        shards          = progress["shards"]
+
     return respond(200, {
-        "job_id":         job_id,
-        "status":         item.get("status",        {}).get("S"),
-        "rows_processed": int(item.get("rows_processed", {}).get("N", 0)),
-        "presigned_url":  item.get("presigned_url", {}).get("S"),
+        "job_id":              job_id,
+        "status":              status,
+        "rows_processed":      rows_processed,
+        "bytes_uploaded":      bytes_uploaded,
+        "rows_per_second":     rows_per_second,
+        "total_rows_estimate": total_rows,
+        "eta_seconds":         None if status else _eta_seconds(rows_processed, total_rows, rows_per_second),
+        "shards":              shards,
+        "presigned_url":       item.get("presigned_url", {}).get("S"),
     })
@@ -1,7 +1,16 @@
 import os
-import boto3
 
-batch = boto3.client("batch", region_name=os.environ.get("AWS_REGION", "us-west-2"))
+# Only the isofit summary route reconciles against Batch — the client (and
+# boto3 itself) is created on its first call rather than at cold start.
+_batch = None
+
+
+def _client():
+    global _batch
+    if _batch is None:
+        import boto3
+        _batch = boto3.client("batch", region_name=os.environ.get("AWS_REGION", "us-west-2"))
+    return _batch
 
 # Map AWS Batch terminal statuses to our DynamoDB status values.
 # Non-terminal Batch statuses (SUBMITTED, PENDING, RUNNABLE, STARTING, RUNNING)
@@ -31,7 +40,7 @@ def reconcile(in_flight: dict[str, dict]) -> dict[str, str]:
 
     # describe_jobs accepts at most 100 IDs per call
     for i in range(0, len(ids), 100):
-        resp = batch.describe_jobs(jobs=ids[i:i + 100])
+        resp = _client().describe_jobs(jobs=ids[i:i + 100])
         for job in resp.get("jobs", []):
             corrected = _BATCH_TO_STATUS.get(job.get("status"))
             if corrected:
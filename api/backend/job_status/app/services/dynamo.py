@@ -1,14 +1,22 @@
 import os
-import boto3
 from datetime import datetime, timezone
 
-dynamodb = boto3.client("dynamodb", region_name=os.environ.get("AWS_REGION", "us-west-2"))
 JOB_TABLE = os.environ["JOB_TABLE"]
 
+_dynamodb = None
+
+
+def _client():
+    global _dynamodb
+    if _dynamodb is None:
+        import boto3
+        _dynamodb = boto3.client("dynamodb", region_name=os.environ.get("AWS_REGION", "us-west-2"))
+    return _dynamodb
+
 
 def list_parent_jobs(limit: int) -> list[dict]:
     """Query the job_type-index GSI for isofit_parent jobs, newest first."""
-    resp = dynamodb.query(
+    resp = _client().query(
         TableName=JOB_TABLE,
         IndexName="job_type-index",
         KeyConditionExpression="job_type = :t",
@@ -29,7 +37,7 @@ def list_parent_jobs(limit: int) -> list[dict]:
 
 def query_child_jobs(parent_job_id: str) -> list[dict]:
     """Page through all child batch records for a parent job."""
-    paginator = dynamodb.get_paginator("query")
+    paginator = _client().get_paginator("query")
     items = []
     for page in paginator.paginate(
         TableName=JOB_TABLE,
@@ -43,7 +51,7 @@ def query_child_jobs(parent_job_id: str) -> list[dict]:
 
 def get_job(job_id: str) -> dict | None:
     """Fetch a single job record by primary key."""
-    resp = dynamodb.get_item(
+    resp = _client().get_item(
         TableName=JOB_TABLE,
         Key={"job_id": {"S": job_id}},
     )
@@ -52,7 +60,7 @@ def get_job(job_id: str) -> dict | None:
 
 def update_job_status(job_id: str, status: str) -> None:
     """Write a corrected or derived status back to a job record."""
-    dynamodb.update_item(
+    _client().update_item(
         TableName=JOB_TABLE,
         Key={"job_id": {"S": job_id}},
         UpdateExpression="SET #s = :s, updated_at = :ts",
@@ -2,7 +2,6 @@ import logging
 import os
 import json
 import uuid
-import boto3
 import psycopg2
 import psycopg2.extras
 from collections import defaultdict
@@ -18,9 +17,27 @@ JOB_DEFINITION = os.environ["BATCH_JOB_DEFINITION"]
 JOB_TABLE      = os.environ["DYNAMODB_TABLE"]
 BATCH_SIZE     = int(os.environ.get("BATCH_SIZE", "20"))
 
-batch    = boto3.client("batch", region_name=REGION)
-dynamodb = boto3.client("dynamodb", region_name=REGION)
-secrets  = boto3.client("secretsmanager", region_name=REGION)
+# boto3 clients and the DB secret are created on first use and kept for warm
+# invocations — nothing is fetched at cold start, and requests rejected by auth
+# or validation never load boto3.
+_clients   = {}
+_db_secret = None
+
+
+def _client(service: str):
+    if service not in _clients:
+        import boto3
+        _clients[service] = boto3.client(service, region_name=REGION)
+    return _clients[service]
+
+
+def _secret() -> dict:
+    global _db_secret
+    if _db_secret is None:
+        _db_secret = json.loads(
+            _client("secretsmanager").get_secret_value(SecretId=os.environ["DB_SECRET_ARN"])["SecretString"]
+        )
+    return _db_secret
 
 
 def chunk(lst: list, size: int):
@@ -30,9 +47,7 @@ def chunk(lst: list, size: int):
 
 @contextmanager
 def get_connection():
-    secret = json.loads(
-        secrets.get_secret_value(SecretId=os.environ["DB_SECRET_ARN"])["SecretString"]
-    )
+    secret = _secret()
     conn = psycopg2.connect(
         host=secret["host"],
         port="5432",
@@ -95,7 +110,7 @@ def submit_job(
     granule_id: str,
 ) -> str:
     job_id = str(uuid.uuid4())
-    dynamodb.put_item(
+    _client("dynamodb").put_item(
         TableName=JOB_TABLE,
         Item={
             "job_id":        {"S": job_id},
@@ -112,7 +127,7 @@ def submit_job(
         }
     )
     try:
-        response = batch.submit_job(
+        response = _client("batch").submit_job(
             jobName=f"inversion-{job_id[:8]}",
             jobQueue=JOB_QUEUE,
             jobDefinition=JOB_DEFINITION,
@@ -126,7 +141,7 @@ def submit_job(
             }
         )
         # Store the Batch job ID so the status lambda can reconcile via batch.describe_jobs()
-        dynamodb.update_item(
+        _client("dynamodb").update_item(
             TableName=JOB_TABLE,
             Key={"job_id": {"S": job_id}},
             UpdateExpression="SET batch_job_id = :b",
@@ -134,7 +149,7 @@ def submit_job(
         )
     except Exception as e:
         logger.error(f"batch.submit_job failed for job {job_id}: {e}")
-        dynamodb.update_item(
+        _client("dynamodb").update_item(
             TableName=JOB_TABLE,
             Key={"job_id": {"S": job_id}},
             UpdateExpression="SET #s = :s",
@@ -207,7 +222,7 @@ def lambda_handler(event, context):
     job_ids       = []
 
     # Write the parent job record first so it exists before any child jobs
-    dynamodb.put_item(
+    _client("dynamodb").put_item(
         TableName=JOB_TABLE,
         Item={
             "job_id":        {"S": parent_job_id},
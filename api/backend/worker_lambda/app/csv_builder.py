@@ -1,14 +1,45 @@
 import io
+import csv
+import datetime
+
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+
+from app.spectral_block import ArrayText, stack_spectra
+
+
+def _fixed_column(values: tuple) -> pa.Array:
+    """
+    One pass-through column of a spectral export.
+
+    Strings, numbers and dates go to Arrow as-is. Anything else (booleans,
+    times, timestamps, Decimals, arrays, ...) is converted with str() so cells
+    keep the text DataFrame.to_csv used to write (True/False, 10:00:00,
+    2018-06-01 10:00:00, [0.1, 0.2]) rather than Arrow's.
+    """
+    sample = next((v for v in values if v is not None), None)
+    if sample is None or (
+        isinstance(sample, (str, int, float, datetime.date))
+        and not isinstance(sample, (bool, datetime.datetime, ArrayText))
+    ):
+        return pa.array(values, from_pandas=True)
+    return pa.array(
+        [None if v is None else str(v.to_list() if isinstance(v, ArrayText) else v) for v in values],
+        type=pa.string(),
+    )
 
 
-def build_spectral_csv(rows: list, col_descriptions: list, spectral_metadata: dict) -> pd.DataFrame:
+def build_spectral_csv(rows: list, col_descriptions: list, spectral_metadata: dict) -> pa.Table:
     """
-    Build a single-header DataFrame for a spectral export (radiance or reflectance).
+    Build a single-header Arrow table for a spectral export (radiance or reflectance).
 
-    All non-spectral columns are passed through as-is from the query result.
-    The spectral array column is exploded into individual band columns named
-    'wavelength|fwhm' (e.g. '383.8840|5.7398').
+    All non-spectral columns are passed through from the query result. The
+    spectral array column is copied into one preallocated float32 block per
+    chunk (rows × bands, see stack_spectra) and each band becomes a column
+    named 'wavelength|fwhm' (e.g. '383.8840|5.7398') that wraps the block
+    without copying. NaN values and missing arrays are written as empty cells.
 
     Args:
         rows:              Raw rows from the psycopg2 cursor.
@@ -21,19 +52,19 @@ def build_spectral_csv(rows: list, col_descriptions: list, spectral_metadata: di
 
     col_names = [desc[0] for desc in col_descriptions]
     spec_idx  = col_names.index(spectral_col)
-    fixed_cols = [name for name in col_names if name != spectral_col]
-    fixed_idxs = [i for i, name in enumerate(col_names) if name != spectral_col]
+    columns   = list(zip(*rows))
 
-    spectral_headers = [f"{wl:.4f}|{fw:.4f}" for wl, fw in zip(wavelength_center, fwhm_vals)]
-    headers = fixed_cols + spectral_headers
+    names  = [name for name in col_names if name != spectral_col]
+    arrays = [_fixed_column(columns[i]) for i, name in enumerate(col_names) if name != spectral_col]
 
-    data = []
-    for row in rows:
-        fixed_vals    = [row[i] for i in fixed_idxs]
-        spectral_vals = list(row[spec_idx])
-        data.append(fixed_vals + spectral_vals)
+    block, _ = stack_spectra(columns[spec_idx], len(wavelength_center), spectral_col)
+    has_nan  = np.isnan(block).any(axis=0)
+    for band, (wl, fw) in enumerate(zip(wavelength_center, fwhm_vals)):
+        values = block[:, band]
+        names.append(f"{wl:.4f}|{fw:.4f}")
+        arrays.append(pa.array(values, mask=np.isnan(values) if has_nan[band] else None))
 
-    return pd.DataFrame(data, columns=headers)
+    return pa.Table.from_arrays(arrays, names=names)
 
 
 def build_standard_csv(rows: list, col_descriptions: list) -> pd.DataFrame:
@@ -47,3 +78,25 @@ def dataframe_to_csv_buffer(df: pd.DataFrame, write_header: bool) -> io.StringIO
     df.to_csv(buffer, index=False, header=write_header)
     buffer.seek(0)
     return buffer
+
+
+def table_to_csv_buffer(table: pa.Table, write_header: bool) -> io.BytesIO:
+    """
+    Serialise an Arrow table to a BytesIO buffer ready for S3 upload.
+
+    pyarrow's C++ writer formats the float32 band columns (shortest
+    round-trip repr) far faster than DataFrame.to_csv. It quotes every string
+    cell, which any CSV reader parses to the same values; the header line is
+    written here so column names are only quoted when they need to be.
+    """
+    buffer = io.BytesIO()
+    if write_header:
+        header = io.StringIO()
+        csv.writer(header, lineterminator="\n").writerow(table.column_names)
+        buffer.write(header.getvalue().encode())
+    pa_csv.write_csv(
+        table, buffer,
+        pa_csv.WriteOptions(include_header=False, quoting_style="needed"),
+    )
+    buffer.seek(0)
+    return buffer
@@ -6,21 +6,42 @@ import psycopg2
 secret_arn = os.environ['DB_SECRET_ARN']
 region = os.environ.get("AWS_REGION", "us-west-2")
 
-client = boto3.client("secretsmanager", region_name=region)
-secret = json.loads(client.get_secret_value(SecretId=secret_arn)['SecretString'])
-
-DB_HOST = secret["host"]
-DB_USER = secret["username"]
-DB_PASS = secret["password"]
 DB_NAME = "vswirplants"
 
+# Fetched on the first connection rather than at import, and kept for warm
+# invocations — a Secrets Manager round trip is not part of the cold start.
+_secret = None
+
+
+def _get_secret() -> dict:
+    global _secret
+    if _secret is None:
+        client = boto3.client("secretsmanager", region_name=region)
+        _secret = json.loads(client.get_secret_value(SecretId=secret_arn)['SecretString'])
+    return _secret
+
 
 def get_connection():
+    secret = _get_secret()
     return psycopg2.connect(
-        host=DB_HOST,
+        host=secret["host"],
         port='5432',
         dbname=DB_NAME,
-        user=DB_USER,
-        password=DB_PASS,
+        user=secret["username"],
+        password=secret["password"],
         connect_timeout=10,
-    )
\ No newline at end of file
+    )
+
+def estimate_rows(conn, sql: str, params: list) -> int | None:
+    """
+    Planner row estimate for a query (EXPLAIN, not executed) — cheap enough to
+    run before every export, and close enough for a progress ETA.
+    """
+    try:
+        with conn.cursor() as cur:
+            cur.execute("EXPLAIN (FORMAT JSON) " + sql, params)
+            plan = cur.fetchone()[0]
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except (psycopg2.Error, LookupError, TypeError, ValueError):
+        conn.rollback()
+        return None
@@ -1,4 +1,5 @@
 import logging
+import threading
 import time
 import os
 import boto3
@@ -8,18 +9,144 @@ logger = logging.getLogger(__name__)
 dynamodb = boto3.client("dynamodb", region_name=os.environ.get("AWS_REGION", "us-west-2"))
 
 
-def update_progress(job_id: str, rows_processed: int, job_table: str) -> None:
-    """Write incremental row-count progress to DynamoDB during streaming."""
+# Progress is written at most once per interval, or sooner once this many
+# rows have accumulated since the last write.
+PROGRESS_INTERVAL_SECONDS = float(os.environ.get("PROGRESS_INTERVAL_SECONDS", "5"))
+PROGRESS_INTERVAL_ROWS    = int(os.environ.get("PROGRESS_INTERVAL_ROWS", "100000"))
+
+
+def update_progress(
+    job_id: str,
+    job_table: str,
+    rows_processed: int,
+    bytes_uploaded: int,
+    rows_per_second: float,
+    started_at: float,
+    total_rows_estimate: int | None = None,
+) -> None:
+    """Write incremental progress (rows, bytes, throughput) to DynamoDB during streaming."""
+    expression = (
+        "SET rows_processed = :r, bytes_uploaded = :b, rows_per_second = :rate, "
+        "progress_at = :now, started_at = if_not_exists(started_at, :start)"
+    )
+    values = {
+        ":r":     {"N": str(rows_processed)},
+        ":b":     {"N": str(bytes_uploaded)},
+        ":rate":  {"N": f"{rows_per_second:.1f}"},
+        ":now":   {"N": str(int(time.time()))},
+        ":start": {"N": str(int(started_at))},
+    }
+    if total_rows_estimate is not None:
+        expression += ", total_rows_estimate = :t"
+        values[":t"] = {"N": str(total_rows_estimate)}
+
     dynamodb.update_item(
         TableName=job_table,
         Key={"job_id": {"S": job_id}},
-        UpdateExpression="SET rows_processed = :r",
-        ExpressionAttributeValues={":r": {"N": str(rows_processed)}},
+        UpdateExpression=expression,
+        ExpressionAttributeValues=values,
     )
 
 
+class ProgressReporter:
+    """
+    Coalesces export progress and writes it from a background thread.
+
+    stream_to_s3 calls add() as chunks are handed on and parts uploaded; the
+    DynamoDB write happens at most every `interval` seconds, or sooner once
+    `every_rows` rows have accumulated, and never on the export's own threads.
+    close() stops the thread and writes the final totals synchronously, so
+    they are in place before finalize_job runs. Use as a context manager.
+    """
+
+    def __init__(
+        self,
+        job_id: str,
+        job_table: str,
+        total_rows_estimate: int | None = None,
+        interval: float = PROGRESS_INTERVAL_SECONDS,
+        every_rows: int = PROGRESS_INTERVAL_ROWS,
+    ):
+        self.job_id              = job_id
+        self.job_table           = job_table
+        self.total_rows_estimate = total_rows_estimate
+        self.interval            = interval
+        self.every_rows          = every_rows
+
+        self.rows_processed = 0
+        self.bytes_uploaded = 0
+        self._written_rows  = None
+        self._started       = time.time()
+        self._started_clock = time.monotonic()
+        self._lock          = threading.Lock()
+        self._wake          = threading.Event()
+        self._stopped       = False
+        self._thread        = threading.Thread(target=self._run, name="export-progress", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def add(self, rows: int = 0, bytes_uploaded: int = 0) -> None:
+        """Record progress. Thread-safe and non-blocking."""
+        with self._lock:
+            self.rows_processed += rows
+            self.bytes_uploaded += bytes_uploaded
+            due = self.rows_processed - (self._written_rows or 0) >= self.every_rows
+        if due:
+            self._wake.set()
+
+    def rows_per_second(self) -> float:
+        elapsed = time.monotonic() - self._started_clock
+        return self.rows_processed / elapsed if elapsed > 0 else 0.0
+
+    def close(self) -> None:
+        """Stop the background thread and write the final totals."""
+        if self._stopped:
+            return
+        self._stopped = True
+        self._wake.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        self._write(final=True)
+
+    def _run(self) -> None:
+        while not self._stopped:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            if not self._stopped:
+                self._write()
+
+    def _write(self, final: bool = False) -> None:
+        with self._lock:
+            rows, nbytes = self.rows_processed, self.bytes_uploaded
+        if rows == self._written_rows and not final:
+            return
+        try:
+            update_progress(
+                self.job_id, self.job_table, rows, nbytes,
+                self.rows_per_second(), self._started, self.total_rows_estimate,
+            )
+            self._written_rows = rows
+            logger.debug("Progress: rows_processed=%d job_id=%s", rows, self.job_id)
+        except Exception:
+            # progress is informational — a throttled or failed write must not
+            # fail the export
+            logger.warning("Progress update failed for job_id=%s", self.job_id, exc_info=True)
+
+
 def finalize_job(job_id: str, bucket: str, key: str, job_table: str) -> None:
-    """Generate a presigned URL and mark the job complete in DynamoDB."""
+    """
+    Generate a presigned URL and mark the job complete in DynamoDB. The S3 key
+    is recorded so the database API can hand the file out again for an
+    identical request (database_api/app/exports.py).
+    """
     s3 = boto3.client("s3")
     presigned_url = s3.generate_presigned_url(
         ClientMethod="get_object",
@@ -32,10 +159,11 @@ def finalize_job(job_id: str, bucket: str, key: str, job_table: str) -> None:
     dynamodb.update_item(
         TableName=job_table,
         Key={"job_id": {"S": job_id}},
-        UpdateExpression="SET presigned_url = :url, #status = :s, expire_at = :ttl",
+        UpdateExpression="SET presigned_url = :url, s3_key = :key, #status = :s, expire_at = :ttl",
         ExpressionAttributeNames={"#status": "status"},
         ExpressionAttributeValues={
             ":url": {"S": presigned_url},
+            ":key": {"S": key},
             ":s":   {"S": "complete"},
             ":ttl": {"N": str(ttl)},
         },
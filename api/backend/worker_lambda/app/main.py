@@ -5,6 +5,7 @@ from app.db import get_connection
 from app.record_parser import parse_record
 from app.s3_upload import stream_to_s3
 from app.job_store import finalize_job, mark_failed
+from app.shards import run_shard
 
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
@@ -26,6 +27,10 @@ def lambda_handler(event, context):
             job_id = parsed["job_id"]
             logger.debug("Processing job_id=%s s3_key=%s", job_id, parsed["key"])
 
+            if parsed["shard"]:
+                run_shard(parsed, bucket, job_table)
+                continue
+
             with get_connection() as conn:
                 stream_to_s3(
                     conn=conn,
@@ -36,6 +41,7 @@ def lambda_handler(event, context):
                     key=parsed["key"],
                     job_id=job_id,
                     job_table=job_table,
+                    fmt=parsed["format"],
                 )
 
             finalize_job(job_id, bucket, parsed["key"], job_table)
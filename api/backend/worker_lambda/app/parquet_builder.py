@@ -0,0 +1,121 @@
+import io
+import json
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from app.spectral_block import ArrayText, stack_spectra
+
+# Postgres type OID → Arrow type. Anything not listed (text, varchar, enums)
+# is written as a string column.
+_ARROW_TYPES = {
+    16:   pa.bool_(),
+    20:   pa.int64(),
+    21:   pa.int16(),
+    23:   pa.int32(),
+    700:  pa.float32(),
+    701:  pa.float64(),
+    1700: pa.float64(),
+    1082: pa.date32(),
+    1083: pa.time64("us"),
+    1114: pa.timestamp("us"),
+    1184: pa.timestamp("us", tz="UTC"),
+    1007: pa.list_(pa.int32()),
+    1021: pa.list_(pa.float32()),
+    1022: pa.list_(pa.float64()),
+}
+_NUMERIC_OID = 1700
+
+
+def build_schema(col_descriptions: list, spectral_metadata: dict | None) -> pa.Schema:
+    """
+    Arrow schema for a Parquet export, typed from the cursor description.
+
+    For spectral exports the spectral array column becomes a
+    fixed_size_list<float32>[n_bands], and wavelength_center / fwhm are stored
+    in the file's key-value metadata (the Parquet footer) instead of being
+    spelled out in column names.
+    """
+    spectral_col = spectral_metadata["spectral_column"] if spectral_metadata else None
+    fields = []
+    for desc in col_descriptions:
+        if desc.name == spectral_col:
+            n_bands = len(spectral_metadata["wavelength_center"])
+            fields.append(pa.field(desc.name, pa.list_(pa.float32(), n_bands)))
+        else:
+            fields.append(pa.field(desc.name, _ARROW_TYPES.get(desc.type_code, pa.string())))
+
+    metadata = None
+    if spectral_metadata:
+        metadata = {
+            "spectral_column":   spectral_col,
+            "wavelength_center": json.dumps(list(spectral_metadata["wavelength_center"])),
+            "fwhm":              json.dumps(list(spectral_metadata["fwhm"])),
+            "campaign_name":     spectral_metadata.get("campaign_name") or "",
+            "sensor_name":       spectral_metadata.get("sensor_name") or "",
+        }
+    return pa.schema(fields, metadata=metadata)
+
+
+def _spectra_array(values: tuple, list_type: pa.FixedSizeListType, col_name: str) -> pa.Array:
+    """Stack one chunk of spectra into a float32 block and wrap it as a fixed-size-list column."""
+    n_bands = list_type.list_size
+    block, present = stack_spectra(values, n_bands, col_name)
+    mask = None if present.all() else pa.array(~present)
+    # row-major flattening for the list's child values
+    return pa.FixedSizeListArray.from_arrays(pa.array(block.ravel(order="C")), n_bands, mask=mask)
+
+
+def build_table(rows: list, col_descriptions: list, schema: pa.Schema) -> pa.Table:
+    """Build one Arrow table (one Parquet row group) from a chunk of cursor rows."""
+    arrays = []
+    for desc, field, values in zip(col_descriptions, schema, zip(*rows)):
+        if pa.types.is_fixed_size_list(field.type):
+            arrays.append(_spectra_array(values, field.type, field.name))
+        elif pa.types.is_list(field.type):
+            arrays.append(pa.array(
+                [v.to_list() if isinstance(v, ArrayText) else v for v in values], type=field.type
+            ))
+        elif desc.type_code == _NUMERIC_OID:
+            arrays.append(pa.array([None if v is None else float(v) for v in values], type=field.type))
+        else:
+            arrays.append(pa.array(values, type=field.type))
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+class PartSink(io.RawIOBase):
+    """
+    Write-only stream for ParquetWriter that hands its bytes back in pieces.
+
+    tell() reports the total written so the writer's offsets stay correct;
+    drain() returns and forgets everything written since the last drain, so a
+    multipart part can be uploaded without holding the whole file in memory.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._buffer  = bytearray()
+        self._written = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._buffer += data
+        self._written += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._written
+
+    def pending(self) -> int:
+        return len(self._buffer)
+
+    def drain(self) -> bytes:
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+
+def open_writer(sink: PartSink, schema: pa.Schema) -> pq.ParquetWriter:
+    return pq.ParquetWriter(sink, schema, compression="zstd")
@@ -1,5 +1,7 @@
 import json
 
+EXPORT_FORMATS = ("csv", "parquet")
+
 
 def parse_record(record: dict) -> dict:
     """
@@ -12,10 +14,14 @@ def parse_record(record: dict) -> dict:
             params:            list
             debug:             bool
             spectral_metadata: dict | None
-            key:               str   — S3 object key for the output CSV
+            format:            str   — 'csv' (default) | 'parquet'
+            key:               str   — S3 object key this job writes
+            shard:             dict | None — for one shard of a fanned-out export:
+                               {parent_job_id, index, count, final_key}, where
+                               final_key is the parent's output object
         }
 
-    Raises KeyError if required fields are missing.
+    Raises KeyError if required fields are missing, ValueError on an unknown format.
     """
     payload = json.loads(record["body"])
 
@@ -24,14 +30,29 @@ def parse_record(record: dict) -> dict:
     params            = payload.get("params", [])
     debug             = payload.get("debug", False)
     spectral_metadata = payload.get("spectral_metadata")
+    fmt               = (payload.get("format") or "csv").lower()
+    shard             = payload.get("shard")
+
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format '{fmt}'")
 
+    output_id = shard["parent_job_id"] if shard else job_id
     if spectral_metadata:
         campaign_name = spectral_metadata["campaign_name"]
         sensor_name   = spectral_metadata["sensor_name"]
         spectral_col  = spectral_metadata.get("spectral_column", "radiance")
-        key = f"exports/{campaign_name}_{sensor_name}_{spectral_col}_{job_id}.csv"
+        key = f"exports/{campaign_name}_{sensor_name}_{spectral_col}_{output_id}.{fmt}"
     else:
-        key = f"exports/{job_id}.csv"
+        key = f"exports/{output_id}.{fmt}"
+
+    if shard:
+        shard = {
+            "parent_job_id": shard["parent_job_id"],
+            "index":         int(shard["index"]),
+            "count":         int(shard["count"]),
+            "final_key":     key,
+        }
+        key = f"exports/shards/{output_id}/{shard['index']:04d}.{fmt}"
 
     return {
         "job_id":            job_id,
@@ -39,5 +60,7 @@ def parse_record(record: dict) -> dict:
         "params":            params,
         "debug":             debug,
         "spectral_metadata": spectral_metadata,
+        "format":            fmt,
         "key":               key,
+        "shard":             shard,
     }
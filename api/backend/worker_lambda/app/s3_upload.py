@@ -1,15 +1,55 @@
 import logging
+import resource
+import threading
 import boto3
 import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
-from app.csv_builder import build_spectral_csv, build_standard_csv, dataframe_to_csv_buffer
-from app.job_store import update_progress
+from app.csv_builder import (
+    build_spectral_csv, build_standard_csv, dataframe_to_csv_buffer, table_to_csv_buffer,
+)
+from app.db import estimate_rows
+from app.job_store import ProgressReporter
+from app.parquet_builder import PartSink, build_schema, build_table, open_writer
+from app.spectral_block import defer_array_parsing
 
 logger = logging.getLogger(__name__)
 
 s3 = boto3.client("s3")
 CHUNK_SIZE = 30000
 
+# S3 rejects multipart parts under 5 MiB (except the last). CSV chunks are well
+# above that; Parquet row groups are buffered until they reach it.
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+# Spectral chunks are held as one rows × bands float32 block. Rows per chunk
+# are capped so the block stays within this budget whatever the band count.
+SPECTRAL_BLOCK_MB = float(os.environ.get("SPECTRAL_BLOCK_MB", "64"))
+
+MIB = 1024 * 1024
+
+# Export pipeline: the calling thread fetches from the cursor, a pool builds and
+# serialises chunks, another pool uploads parts. A chunk holds one in-flight
+# slot from before its rows are fetched until its bytes are uploaded, which
+# bounds memory to roughly MAX_INFLIGHT_PARTS chunks.
+SERIALISE_WORKERS  = int(os.environ.get("EXPORT_SERIALISE_WORKERS", "2"))
+UPLOAD_WORKERS     = int(os.environ.get("EXPORT_UPLOAD_WORKERS", "4"))
+MAX_INFLIGHT_PARTS = int(os.environ.get("EXPORT_MAX_INFLIGHT_PARTS", "3"))
+
+
+def chunk_rows(spectral_metadata: dict | None) -> int:
+    """Rows to fetch per chunk — CHUNK_SIZE, or fewer for very wide spectra."""
+    if not spectral_metadata:
+        return CHUNK_SIZE
+    row_bytes = 4 * len(spectral_metadata["wavelength_center"])
+    return max(1000, min(CHUNK_SIZE, int(SPECTRAL_BLOCK_MB * MIB) // row_bytes))
+
+
+def peak_rss_mib() -> float:
+    """Peak resident set size of this process so far (ru_maxrss is KiB on Linux)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
 
 def stream_to_s3(
     conn,
@@ -20,10 +60,29 @@ def stream_to_s3(
     key: str,
     job_id: str,
     job_table: str,
-) -> None:
+    fmt: str = "csv",
+    allow_empty: bool = False,
+) -> dict:
     """
-    Execute sql via a server-side cursor, stream results as CSV chunks
-    to S3 via multipart upload, and write DynamoDB progress updates.
+    Execute sql via a server-side cursor, stream results to S3 via multipart
+    upload, and report progress (rows, bytes, throughput) to DynamoDB through
+    a ProgressReporter.
+
+    fmt="csv" uploads one CSV part per chunk. fmt="parquet" writes one row
+    group per chunk (spectra as a fixed-size float32 list column) and uploads
+    whenever at least MIN_PART_SIZE bytes are pending; the footer goes out
+    with the last part.
+
+    Fetching, serialising and uploading overlap: while this thread fetches the
+    next chunk, earlier chunks are being built on the serialise pool and sent
+    on the upload pool. Chunks are handed to the uploader (and Parquet row
+    groups written) strictly in fetch order, so part numbers follow row order
+    however the work interleaves. At most MAX_INFLIGHT_PARTS chunks are held
+    at once.
+
+    Returns {"rows": rows written, "header_bytes": length of the CSV header
+    line (0 for Parquet)}. A query with no rows raises ValueError, unless
+    allow_empty is set, in which case nothing is written and rows is 0.
 
     Raises on any error — the multipart upload is aborted in a finally block.
     """
@@ -31,55 +90,154 @@ def stream_to_s3(
     logger.debug("Started multipart upload: %s", mpu["UploadId"])
 
     parts          = []
-    part_number    = 1
-    rows_processed = 0
+    parts_lock     = threading.Lock()
+    inflight       = threading.BoundedSemaphore(MAX_INFLIGHT_PARTS)
+    pending        = deque()    # (serialise future, row count), in fetch order
+    uploads        = []
+    part_number    = 0
     header_written = False
+    header_bytes   = 0
+    sink, writer, schema = None, None, None
+
+    progress       = ProgressReporter(job_id, job_table, estimate_rows(conn, sql, params))
+    serialise_pool = ThreadPoolExecutor(SERIALISE_WORKERS, thread_name_prefix="export-serialise")
+    upload_pool    = ThreadPoolExecutor(UPLOAD_WORKERS, thread_name_prefix="export-upload")
+
+    def serialise(rows: list, col_descriptions, write_header: bool):
+        """Chunk → Arrow table (Parquet) or CSV part body. Runs on the serialise pool."""
+        nonlocal header_bytes
+        if fmt == "parquet":
+            table = build_table(rows, col_descriptions, schema)
+            chunk_bytes, result, part_bytes = table.nbytes, table, 0
+        elif spectral_metadata:
+            table  = build_spectral_csv(rows, col_descriptions, spectral_metadata)
+            result = table_to_csv_buffer(table, write_header).read()
+            chunk_bytes, part_bytes = table.nbytes, len(result)
+        else:
+            chunk  = build_standard_csv(rows, col_descriptions)
+            result = dataframe_to_csv_buffer(chunk, write_header).read()
+            chunk_bytes, part_bytes = 0, len(result)
+        if write_header and fmt == "csv":
+            header = result[:result.index("\n" if isinstance(result, str) else b"\n") + 1]
+            header_bytes = len(header.encode() if isinstance(header, str) else header)
+        logger.debug(
+            "Chunk: %d rows, %.1f MiB columnar, %.1f MiB serialised, peak RSS %.0f MiB",
+            len(rows), chunk_bytes / MIB, part_bytes / MIB, peak_rss_mib(),
+        )
+        return result
 
-    try:
-        with conn.cursor(name="stream_cursor") as cur:
-            cur.itersize = CHUNK_SIZE
-            cur.execute(sql, params)
-
-            while True:
-                rows = cur.fetchmany(cur.itersize)
-                if not rows:
-                    break
+    def upload(number: int, body) -> None:
+        """Upload one part and free its in-flight slot. Runs on the upload pool."""
+        try:
+            response = s3.upload_part(
+                Bucket=bucket,
+                Key=key,
+                PartNumber=number,
+                UploadId=mpu["UploadId"],
+                Body=body,
+            )
+            with parts_lock:
+                parts.append({"ETag": response["ETag"], "PartNumber": number})
+            progress.add(bytes_uploaded=len(body))
+            logger.debug("Uploaded part %d — ETag %s", number, response["ETag"])
+        finally:
+            inflight.release()
+
+    def submit_part(body) -> None:
+        nonlocal part_number
+        part_number += 1
+        uploads.append(upload_pool.submit(upload, part_number, body))
+
+    def commit_next() -> None:
+        """Hand the oldest serialised chunk on, in order. Its slot passes to its upload."""
+        future, n_rows = pending.popleft()
+        result = future.result()
+        if fmt == "parquet":
+            writer.write_table(result)
+            if sink.pending() >= MIN_PART_SIZE:
+                submit_part(sink.drain())
+            else:
+                inflight.release()
+        else:
+            submit_part(result)
+
+        for done in (f for f in uploads if f.done()):
+            done.result()   # surface a failed upload before fetching more
+
+        progress.add(rows=n_rows)
+
+    def reserve() -> None:
+        """Take an in-flight slot, committing finished chunks while none is free."""
+        while not inflight.acquire(blocking=False):
+            if pending:
+                commit_next()
+            else:
+                inflight.acquire()
+                return
 
+    try:
+        try:
+            progress.start()
+            with conn.cursor(name="stream_cursor") as cur:
+                cur.itersize = chunk_rows(spectral_metadata)
                 if spectral_metadata:
-                    chunk = build_spectral_csv(rows, cur.description, spectral_metadata)
-                else:
-                    chunk = build_standard_csv(rows, cur.description)
-
-                buffer = dataframe_to_csv_buffer(chunk, write_header=not header_written)
-                header_written = True
-
-                response = s3.upload_part(
-                    Bucket=bucket,
-                    Key=key,
-                    PartNumber=part_number,
-                    UploadId=mpu["UploadId"],
-                    Body=buffer.read(),
-                )
-                buffer.close()
-
-                parts.append({"ETag": response["ETag"], "PartNumber": part_number})
-                logger.debug("Uploaded part %d — ETag %s", part_number, response["ETag"])
-
-                part_number    += 1
-                rows_processed += len(rows)
-                update_progress(job_id, rows_processed, job_table)
-                logger.debug("Progress: rows_processed=%d job_id=%s", rows_processed, job_id)
+                    defer_array_parsing(cur)
+                cur.execute(sql, params)
+
+                while True:
+                    reserve()
+                    rows = cur.fetchmany(cur.itersize)
+                    if not rows:
+                        inflight.release()
+                        break
+
+                    if fmt == "parquet" and writer is None:
+                        schema = build_schema(cur.description, spectral_metadata)
+                        sink   = PartSink()
+                        writer = open_writer(sink, schema)
+                    pending.append((
+                        serialise_pool.submit(serialise, rows, cur.description, not header_written),
+                        len(rows),
+                    ))
+                    header_written = True
+                    while pending and pending[0][0].done():
+                        commit_next()
+
+                while pending:
+                    commit_next()
+
+            if writer is not None:
+                writer.close()
+                reserve()
+                submit_part(sink.drain())
+
+            for done in uploads:
+                done.result()
+        finally:
+            for future, _ in pending:
+                future.cancel()
+            serialise_pool.shutdown(cancel_futures=True)
+            upload_pool.shutdown(cancel_futures=True)
+            progress.close()
 
         if not parts:
-            raise ValueError(f"Query returned no rows for job_id={job_id}")
+            if not allow_empty:
+                raise ValueError(f"Query returned no rows for job_id={job_id}")
+            s3.abort_multipart_upload(Bucket=bucket, Key=key, UploadId=mpu["UploadId"])
+            logger.info("Query returned no rows for job_id=%s — nothing written", job_id)
+            return {"rows": 0, "header_bytes": 0}
 
         s3.complete_multipart_upload(
             Bucket=bucket,
             Key=key,
             UploadId=mpu["UploadId"],
-            MultipartUpload={"Parts": parts},
+            MultipartUpload={"Parts": sorted(parts, key=lambda p: p["PartNumber"])},
+        )
+        logger.info(
+            "Multipart upload complete for job_id=%s — %d rows, %d parts, peak RSS %.0f MiB",
+            job_id, progress.rows_processed, len(parts), peak_rss_mib(),
         )
-        logger.debug("Multipart upload complete for job_id=%s", job_id)
+        return {"rows": progress.rows_processed, "header_bytes": header_bytes}
 
     except Exception:
         logger.exception("Aborting multipart upload for job_id=%s", job_id)
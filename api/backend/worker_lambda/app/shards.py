@@ -0,0 +1,264 @@
+"""
+shards.py — worker side of fanned-out CSV exports (database_api/app/shards.py).
+
+Each shard message exports one pixel_id range of the parent's query to its
+own object under exports/shards/<parent_job_id>/. Shard records carry
+parent_job_id, so the job status API can aggregate them through the
+parent_job_id-index GSI.
+
+A finished shard adds its index to the parent's shards_done set. The shard
+whose add completes the set claims the stitch and assembles the final object
+as a multipart upload of UploadPartCopy ranges over the shard files — the
+header line of every shard but the first is skipped by starting its range
+after it — so the data is copied inside S3 rather than downloaded again.
+Shard files too small to be a part on their own (S3's 5 MiB minimum) are read
+and re-uploaded together with the start of the next one. The shard files are
+left for the exports/ lifecycle rule.
+"""
+
+import logging
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.db import get_connection
+from app.job_store import dynamodb, finalize_job, mark_failed
+from app.s3_upload import MIN_PART_SIZE, UPLOAD_WORKERS, s3, stream_to_s3
+
+logger = logging.getLogger(__name__)
+
+# UploadPartCopy copies at most 5 GiB per part.
+MAX_COPY_PART_SIZE = 5 * 1024 ** 3
+
+
+def shard_job_id(parent_job_id: str, index: int) -> str:
+    return f"{parent_job_id}.{index:03d}"
+
+
+def _register_shard(job_id: str, shard: dict, job_table: str) -> None:
+    ttl = int(time.time()) + 24 * 3600
+    dynamodb.update_item(
+        TableName=job_table,
+        Key={"job_id": {"S": job_id}},
+        UpdateExpression="SET parent_job_id = :p, shard_index = :i, expire_at = :ttl",
+        ExpressionAttributeValues={
+            ":p":   {"S": shard["parent_job_id"]},
+            ":i":   {"N": str(shard["index"])},
+            ":ttl": {"N": str(ttl)},
+        },
+    )
+
+
+def _parent_status(parent_job_id: str, job_table: str):
+    item = dynamodb.get_item(
+        TableName=job_table, Key={"job_id": {"S": parent_job_id}}, ConsistentRead=True,
+    ).get("Item") or {}
+    return item.get("status", {}).get("S")
+
+
+def _complete_shard(job_id: str, bucket: str, key: str, summary: dict, job_table: str) -> None:
+    size = s3.head_object(Bucket=bucket, Key=key)["ContentLength"] if summary["rows"] else 0
+    dynamodb.update_item(
+        TableName=job_table,
+        Key={"job_id": {"S": job_id}},
+        UpdateExpression=(
+            "SET #status = :s, s3_key = :key, object_bytes = :size, header_bytes = :h, "
+            "rows_processed = :r"
+        ),
+        ExpressionAttributeNames={"#status": "status"},
+        ExpressionAttributeValues={
+            ":s":    {"S": "complete"},
+            ":key":  {"S": key},
+            ":size": {"N": str(size)},
+            ":h":    {"N": str(summary["header_bytes"])},
+            ":r":    {"N": str(summary["rows"])},
+        },
+    )
+
+
+def _record_done(shard: dict, job_table: str) -> bool:
+    """
+    Add this shard to the parent's shards_done set. Returns True if this call
+    completed the set and won the stitch claim — exactly one shard does, even
+    when SQS redelivers a shard that already finished.
+    """
+    parent_key = {"job_id": {"S": shard["parent_job_id"]}}
+    try:
+        response = dynamodb.update_item(
+            TableName=job_table,
+            Key=parent_key,
+            UpdateExpression="ADD shards_done :i SET progress_at = :now",
+            ConditionExpression="attribute_not_exists(#status)",
+            ExpressionAttributeNames={"#status": "status"},
+            ExpressionAttributeValues={
+                ":i":   {"SS": [str(shard["index"])]},
+                ":now": {"N": str(int(time.time()))},
+            },
+            ReturnValues="UPDATED_NEW",
+        )
+    except dynamodb.exceptions.ConditionalCheckFailedException:
+        return False    # parent already complete or failed
+    if len(response["Attributes"]["shards_done"]["SS"]) < shard["count"]:
+        return False
+
+    try:
+        dynamodb.update_item(
+            TableName=job_table,
+            Key=parent_key,
+            UpdateExpression="SET stitch_started_at = :now",
+            ConditionExpression="attribute_not_exists(stitch_started_at)",
+            ExpressionAttributeValues={":now": {"N": str(int(time.time()))}},
+        )
+    except dynamodb.exceptions.ConditionalCheckFailedException:
+        return False
+    return True
+
+
+def plan_parts(pieces: list) -> list:
+    """
+    Lay (key, start, end) byte ranges out as multipart parts, in order.
+
+    Each part is a list of ranges. A part that is one range of at least
+    MIN_PART_SIZE is copied server-side; ranges smaller than that are merged
+    with the start of the following range until the part reaches
+    MIN_PART_SIZE (only the last part may be smaller). Ranges over
+    MAX_COPY_PART_SIZE are split into equal copies.
+    """
+    parts, carry, carried = [], [], 0
+    for key, start, end in pieces:
+        if carry:
+            take = min(end - start, MIN_PART_SIZE - carried)
+            carry.append((key, start, start + take))
+            carried += take
+            start   += take
+            if carried >= MIN_PART_SIZE:
+                parts.append(carry)
+                carry, carried = [], 0
+
+        remaining = end - start
+        if remaining == 0:
+            continue
+        if remaining < MIN_PART_SIZE:
+            carry, carried = [(key, start, end)], remaining
+            continue
+
+        step = math.ceil(remaining / math.ceil(remaining / MAX_COPY_PART_SIZE))
+        parts.extend([(key, s, min(s + step, end))] for s in range(start, end, step))
+
+    if carry:
+        parts.append(carry)
+    return parts
+
+
+def _stitch(shard: dict, bucket: str, job_table: str) -> None:
+    """Assemble the shard files into the parent's final object and finalize it."""
+    parent_job_id = shard["parent_job_id"]
+    final_key     = shard["final_key"]
+
+    pieces = []
+    for index in range(shard["count"]):
+        item = dynamodb.get_item(
+            TableName=job_table,
+            Key={"job_id": {"S": shard_job_id(parent_job_id, index)}},
+            ConsistentRead=True,
+        )["Item"]
+        size = int(item["object_bytes"]["N"])
+        if size:
+            start = int(item["header_bytes"]["N"]) if pieces else 0
+            if start < size:
+                pieces.append((item["s3_key"]["S"], start, size))
+
+    if not pieces:
+        raise ValueError(f"Query returned no rows for job_id={parent_job_id}")
+
+    mpu = s3.create_multipart_upload(Bucket=bucket, Key=final_key)
+
+    def write_part(number: int, ranges: list) -> dict:
+        key, start, end = ranges[0]
+        if len(ranges) == 1 and end - start >= MIN_PART_SIZE:
+            response = s3.upload_part_copy(
+                Bucket=bucket,
+                Key=final_key,
+                PartNumber=number,
+                UploadId=mpu["UploadId"],
+                CopySource={"Bucket": bucket, "Key": key},
+                CopySourceRange=f"bytes={start}-{end - 1}",
+            )
+            etag = response["CopyPartResult"]["ETag"]
+        else:
+            body = b"".join(
+                s3.get_object(Bucket=bucket, Key=k, Range=f"bytes={s}-{e - 1}")["Body"].read()
+                for k, s, e in ranges
+            )
+            etag = s3.upload_part(
+                Bucket=bucket,
+                Key=final_key,
+                PartNumber=number,
+                UploadId=mpu["UploadId"],
+                Body=body,
+            )["ETag"]
+        return {"ETag": etag, "PartNumber": number}
+
+    plan = plan_parts(pieces)
+    try:
+        with ThreadPoolExecutor(UPLOAD_WORKERS, thread_name_prefix="export-stitch") as pool:
+            parts = list(pool.map(write_part, range(1, len(plan) + 1), plan))
+        s3.complete_multipart_upload(
+            Bucket=bucket,
+            Key=final_key,
+            UploadId=mpu["UploadId"],
+            MultipartUpload={"Parts": parts},
+        )
+    except Exception:
+        logger.exception("Aborting stitch upload for job_id=%s", parent_job_id)
+        try:
+            s3.abort_multipart_upload(Bucket=bucket, Key=final_key, UploadId=mpu["UploadId"])
+        except Exception:
+            logger.exception("Failed to abort stitch upload for job_id=%s", parent_job_id)
+        raise
+
+    logger.info(
+        "Stitched %d shards into %s for job_id=%s — %d parts",
+        shard["count"], final_key, parent_job_id, len(parts),
+    )
+    finalize_job(parent_job_id, bucket, final_key, job_table)
+
+
+def run_shard(parsed: dict, bucket: str, job_table: str) -> None:
+    """
+    Export one shard, then stitch the parent's file if it was the last shard
+    to finish. Any failure fails the parent as well, and later shards of a
+    failed parent are skipped.
+    """
+    job_id = parsed["job_id"]
+    shard  = parsed["shard"]
+    parent_job_id = shard["parent_job_id"]
+
+    try:
+        status = _parent_status(parent_job_id, job_table)
+        if status:
+            logger.info("Skipping shard job_id=%s — parent is %s", job_id, status)
+            return
+
+        _register_shard(job_id, shard, job_table)
+        with get_connection() as conn:
+            summary = stream_to_s3(
+                conn=conn,
+                sql=parsed["sql"],
+                params=parsed["params"],
+                spectral_metadata=parsed["spectral_metadata"],
+                bucket=bucket,
+                key=parsed["key"],
+                job_id=job_id,
+                job_table=job_table,
+                fmt=parsed["format"],
+                allow_empty=True,
+            )
+        _complete_shard(job_id, bucket, parsed["key"], summary, job_table)
+
+        if _record_done(shard, job_table):
+            _stitch(shard, bucket, job_table)
+
+    except Exception:
+        mark_failed(parent_job_id, job_table)
+        raise
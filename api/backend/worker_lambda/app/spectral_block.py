@@ -0,0 +1,92 @@
+import io
+
+import numpy as np
+import psycopg2.extensions
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+
+FLOAT4_ARRAY_OID = 1021
+
+
+class ArrayText(str):
+    """A FLOAT4[] value left in Postgres text form ('{0.1,0.2,NULL}') by defer_array_parsing."""
+
+    def to_list(self) -> list:
+        if len(self) <= 2:
+            return []
+        return [None if v == "NULL" else float(v) for v in self[1:-1].split(",")]
+
+
+_FLOAT4_ARRAY_TEXT = psycopg2.extensions.new_type(
+    (FLOAT4_ARRAY_OID,), "FLOAT4ARRAY_TEXT",
+    lambda value, cur: None if value is None else ArrayText(value),
+)
+
+
+def defer_array_parsing(cur) -> None:
+    """
+    Make `cur` return FLOAT4[] values as ArrayText instead of lists.
+
+    psycopg2 otherwise builds one Python float per band while fetching — for a
+    425-band export that is most of the fetch time, all of it holding the GIL.
+    Left as text, a chunk's spectra are parsed later in one call by
+    stack_spectra, off the fetching thread and outside the GIL.
+    """
+    psycopg2.extensions.register_type(_FLOAT4_ARRAY_TEXT, cur)
+
+
+def _parse_array_text(texts: list, n_bands: int, col_name: str) -> pa.Table:
+    """Parse '{v1,...,vn}' strings as CSV lines with pyarrow's multithreaded reader."""
+    names = [str(b) for b in range(n_bands)]
+    data  = "\n".join(t[1:-1] for t in texts).encode()
+    try:
+        table = pa_csv.read_csv(
+            io.BytesIO(data),
+            read_options=pa_csv.ReadOptions(column_names=names),
+            convert_options=pa_csv.ConvertOptions(
+                column_types=dict.fromkeys(names, pa.float32()),
+                null_values=["NULL"],
+            ),
+        )
+    except pa.ArrowInvalid:
+        table = None
+    if table is None or table.num_rows != len(texts):
+        raise ValueError(
+            f"{col_name} arrays do not match the {n_bands} bands in spectral_metadata"
+        )
+    return table
+
+
+def stack_spectra(values: tuple, n_bands: int, col_name: str) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Copy one chunk of spectral arrays into a preallocated (rows, n_bands)
+    float32 block.
+
+    The block is column-major, so each band is a contiguous column that Arrow
+    can wrap without copying. Rows with no array are left as NaN and flagged
+    False in the returned `present` mask; NULL elements inside an array come
+    through as NaN as well. Values may be lists or ArrayText.
+
+    Raises ValueError if an array's length does not match n_bands.
+    """
+    block   = np.full((len(values), n_bands), np.nan, dtype=np.float32, order="F")
+    present = np.fromiter((v is not None for v in values), dtype=bool, count=len(values))
+    if not present.any():
+        return block, present
+
+    if any(isinstance(v, ArrayText) for v in values):
+        table = _parse_array_text([v for v in values if v is not None], n_bands, col_name)
+        rows  = slice(None) if present.all() else present
+        for band, column in enumerate(table.columns):
+            block[rows, band] = column.to_numpy()
+        return block, present
+
+    for i, v in enumerate(values):
+        if v is None:
+            continue
+        if len(v) != n_bands:
+            raise ValueError(
+                f"{col_name} arrays do not match the {n_bands} bands in spectral_metadata"
+            )
+        block[i] = v
+    return block, present
@@ -14,6 +14,12 @@ const getStatusConfig = (status) => {
   }
 };
 
+const formatEta = (seconds) => {
+  if (seconds < 60) return `${seconds}s`;
+  const minutes = Math.round(seconds / 60);
+  return minutes < 60 ? `${minutes} min` : `${Math.floor(minutes / 60)} h ${minutes % 60} min`;
+};
+
 function JobStatus({ jobsBySensor, sensorStatuses }) {
   if (!jobsBySensor || Object.keys(jobsBySensor).length === 0) return null;
 
@@ -42,6 +48,13 @@ function JobStatus({ jobsBySensor, sensorStatuses }) {
               <strong>Rows processed:</strong> {state.rowsProcessed.toLocaleString()}
             </Typography>
 
+            {state.status === 'running' && state.rowsPerSecond && (
+              <Typography variant="body2" color="text.secondary" sx={{ mb: 1 }}>
+                <strong>Throughput:</strong> {Math.round(state.rowsPerSecond).toLocaleString()} rows/s
+                {state.etaSeconds != null && <> · about {formatEta(state.etaSeconds)} remaining</>}
+              </Typography>
+            )}
+
             {state.error && (
               <Typography variant="body2" color="error">{state.error}</Typography>
             )}
@@ -16,6 +16,7 @@ export function useDataQuery(view) {
   const [mapCenter, setMapCenter]         = useState([0, 0]);
   const [mapZoom, setMapZoom]             = useState(2);
   const [offset, setOffset]               = useState(0);
+  const [cursor, setCursor]               = useState(null);
   const [loading, setLoading]             = useState(false);
   const [error, setError]                 = useState(null);
 
@@ -54,7 +55,8 @@ export function useDataQuery(view) {
     setTableData(tableRows);
 
     const hasRows = tableRows.length > 0;
-    setNextDisabled(!hasRows);
+    setCursor(result.nextCursor ?? null);
+    setNextDisabled(!hasRows || !result.nextCursor);
     setExtractDisabled(!hasRows || view === 'trait_view');
     setDownloadTableDisabled(!hasRows);
 
@@ -90,6 +92,7 @@ export function useDataQuery(view) {
     setLoading(true);
     setError(null);
     setOffset(0);
+    setCursor(null);
     try {
       const filters = parseFilters(filterValues, geojsonContent);
       const result = await fetchParquet(view, filters, PAGE_SIZE, 0);
@@ -107,7 +110,7 @@ export function useDataQuery(view) {
     const newOffset = offset + PAGE_SIZE;
     try {
       const filters = parseFilters(filterValues, geojsonContent);
-      const result = await fetchParquet(view, filters, PAGE_SIZE, newOffset);
+      const result = await fetchParquet(view, filters, PAGE_SIZE, newOffset, cursor);
       _applyResult(result, newOffset, false);
       setOffset(newOffset);
     } catch (err) {
@@ -138,6 +141,7 @@ export function useDataQuery(view) {
     setMapCenter([0, 0]);
     setMapZoom(2);
     setOffset(0);
+    setCursor(null);
     setNextDisabled(true);
     setExtractDisabled(true);
     setDownloadTableDisabled(true);
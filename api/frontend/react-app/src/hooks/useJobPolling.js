@@ -35,6 +35,8 @@ export function useJobPolling(jobsBySensor, isPolling, onAllComplete) {
             [sensorKey]: {
               status,
               rowsProcessed: result.rows_processed || 0,
+              rowsPerSecond: result.rows_per_second || null,
+              etaSeconds: result.eta_seconds ?? null,
               downloadUrl: result.presigned_url || null,
               error: null
             }
@@ -30,17 +30,23 @@ export async function fetchLinkedQueryAll(payload) {
 }
 
 /**
- * Fetch Parquet data from API
+ * Fetch Parquet data from API.
+ * Pass the previous page's nextCursor as `cursor` to page by key instead of offset.
  */
-export async function fetchParquet(view, filters, limit = null, offset = 0) {
+export async function fetchParquet(view, filters, limit = null, offset = 0, cursor = null) {
   const select = SELECT_CONFIGS[view];
   const payload = {
     view,
     format: 'parquet',
     select,
-    offset,
   };
 
+  if (cursor) {
+    payload.cursor = cursor;
+  } else {
+    payload.offset = offset;
+  }
+
   if (limit !== null && Number.isInteger(limit)) {
     payload.limit = limit;
   }
@@ -76,7 +82,8 @@ export async function fetchParquet(view, filters, limit = null, offset = 0) {
     throw new Error(err.message || 'Request failed');
   }
 
-  return parseParquetData(response.data, select);
+  const result = await parseParquetData(response.data, select);
+  return { ...result, nextCursor: response.headers['x-next-cursor'] ?? null };
 }
 
 /**
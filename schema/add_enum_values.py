@@ -26,9 +26,9 @@ Notes:
     - New enum values are appended to the end of the sort order.
       If specific ordering relative to existing values is required,
       the enum type must be recreated — this script does not do that.
-    - After adding values, the QAQC lambda will pick them up automatically
-      on its next warm start (load_enums is cached per container, so a
-      Lambda redeploy or cold start may be needed to invalidate the cache).
+    - After adding values the script bumps the data-version stamp
+      (vswir_plants.data_version). The QAQC lambda caches enums and reference
+      sets per data version, so its next run reloads them.
     - The frontend viewConfig.js ENUMS dict is a MANUAL DUPLICATE of the
       DB enum values used for query filter dropdowns. After adding new
       enum values here, update viewConfig.js accordingly.
@@ -78,6 +78,22 @@ def add_enum_value(cursor, schema: str, enum_type: str, value: str, dry_run: boo
     return True
 
 
+def bump_data_version(cursor, schema: str, dry_run: bool):
+    """Move the data-version stamp on, invalidating caches keyed on it."""
+    if dry_run:
+        print(f"  [DRY RUN] Would bump {schema}.data_version")
+        return
+    cursor.execute(
+        f"""
+        UPDATE {schema}.data_version
+        SET version = version + 1, batch_id = NULL, updated_at = now()
+        RETURNING version
+        """
+    )
+    row = cursor.fetchone()
+    print(f"\nData version now {row[0] if row else None}")
+
+
 def main():
     parser = argparse.ArgumentParser(description="Add new values to PostgreSQL enum types")
     parser.add_argument("input", help="YAML file mapping enum_type_name → [new_values]")
@@ -141,6 +157,9 @@ def main():
                     print(f"  ERROR adding '{value}': {exc}", file=sys.stderr)
                     total_errors += 1
 
+        if total_added:
+            bump_data_version(cur, schema, dry_run=args.dry_run)
+
     conn.close()
 
     print(f"\nDone. Added: {total_added}, Skipped: {total_skipped}, Errors: {total_errors}")
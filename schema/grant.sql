@@ -13,6 +13,12 @@ GRANT SELECT ON vswir_plants.extracted_spectra_view  TO postgrest_user;
 GRANT SELECT ON vswir_plants.extracted_metadata_view TO postgrest_user;
 GRANT SELECT ON vswir_plants.reflectance_view        TO postgrest_user;
 
+-- data-version stamp checked by the response cache
+GRANT SELECT ON vswir_plants.data_version            TO postgrest_user;
+
+-- per-plot aggregates behind the linked query's totals
+GRANT SELECT ON vswir_plants.plot_summary            TO postgrest_user;
+
 -- ---------------------------------------------------------------------------
 -- isofit
 -- Reads radiance spectra and sensor metadata; writes reflectance output.
@@ -55,6 +61,9 @@ GRANT SELECT ON vswir_plants.insitu_plot_event      TO ingestion_staging;
 GRANT SELECT ON vswir_plants.sample                 TO ingestion_staging;
 GRANT SELECT ON vswir_plants.leaf_traits            TO ingestion_staging;
 
+-- Production: data-version stamp the QAQC reference cache is keyed on
+GRANT SELECT ON vswir_plants.data_version           TO ingestion_staging;
+
 -- ---------------------------------------------------------------------------
 -- ingestion_promotion
 -- Used by the promotion lambda only.
@@ -95,14 +104,17 @@ GRANT SELECT, INSERT
 GRANT SELECT, INSERT
     ON vswir_plants.extracted_spectra     TO ingestion_promotion;
 
+-- Production: refresh_plot_summary() upserts the promoted plots' summary rows
+GRANT SELECT, INSERT, UPDATE
+    ON vswir_plants.plot_summary          TO ingestion_promotion;
+
+-- Production: bump the data-version stamp at the end of each promotion
+GRANT SELECT, UPDATE
+    ON vswir_plants.data_version          TO ingestion_promotion;
+
 -- Production: sequences for re-generating serial IDs on promotion
 GRANT USAGE ON ALL SEQUENCES IN SCHEMA vswir_plants TO ingestion_promotion;
 
--- Production: refresh the materialized view after promotion
--- plot_pixels_mv has been retired; remove this grant when confirmed removed from DB.
--- GRANT SELECT ON vswir_plants.plot_pixels_mv TO ingestion_promotion;
--- REFRESH MATERIALIZED VIEW CONCURRENTLY requires the user to own the view,
--- or be a superuser. In practice the promotion lambda runs as a superuser
--- role or the view owner executes the refresh via a SECURITY DEFINER function.
--- Uncomment and adapt if using a wrapper function:
--- GRANT EXECUTE ON FUNCTION vswir_plants.refresh_plot_pixels_mv() TO ingestion_promotion;
+-- Production: refresh_plot_pixels() replaces the promoted plots' plot_pixels_mv rows
+GRANT SELECT, INSERT, DELETE
+    ON vswir_plants.plot_pixels_mv        TO ingestion_promotion;
@@ -15,8 +15,7 @@ CREATE TABLE vswir_plants.doi (
     campaign_name VARCHAR NOT NULL,
     CONSTRAINT doi_campaign_key FOREIGN KEY (campaign_name)
         REFERENCES vswir_plants.campaign(campaign_name)
-        ON DELETE CASCADE,
-    CONSTRAINT sensor_campaign_pk PRIMARY KEY (doi)
+        ON DELETE CASCADE
 );
 
 -- elevation source does it need a version?
@@ -217,5 +216,111 @@ CREATE TABLE vswir_plants.leaf_trait_protocols (
     CONSTRAINT leaf_trait_protocol_doi_key FOREIGN KEY (doi)
         REFERENCES vswir_plants.doi(doi)
         ON DELETE CASCADE,
-    CONSTRAINT sensor_campaign_pk PRIMARY KEY(doi)
-);
\ No newline at end of file
+    CONSTRAINT leaf_trait_protocols_pk PRIMARY KEY(doi)
+);
+-- Single-row data-version stamp. Promotion bumps it in the same transaction as
+-- the rows it inserts, and add_enum_values.py after adding enum values; API
+-- response caches and the QAQC reference cache compare against it to tell
+-- whether a cached result predates the latest change.
+CREATE TABLE vswir_plants.data_version (
+    id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+    version BIGINT NOT NULL DEFAULT 0,
+    batch_id VARCHAR,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+INSERT INTO vswir_plants.data_version DEFAULT VALUES;
+
+-- Per-plot aggregates for the linked query's totals and narrowing (database_api
+-- orchestration.py), so they never scan pixel or trait_view for the whole
+-- matched plot set. trait_rows / trait_counts count trait_view rows (samples
+-- without traits count once, under no trait); granule_ids are the granules the
+-- plot has pixels in. Maintained by promotion through refresh_plot_summary.
+CREATE TABLE vswir_plants.plot_summary (
+    plot_id INTEGER PRIMARY KEY,
+    trait_rows BIGINT NOT NULL DEFAULT 0,
+    trait_counts JSONB NOT NULL DEFAULT '{}',
+    collection_date_min DATE,
+    collection_date_max DATE,
+    granule_ids VARCHAR[] NOT NULL DEFAULT '{}',
+    pixel_count BIGINT NOT NULL DEFAULT 0,
+    acquisition_date_min DATE,
+    acquisition_date_max DATE,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    CONSTRAINT plot_summary_plot_fkey FOREIGN KEY (plot_id)
+        REFERENCES vswir_plants.plot(plot_id)
+        ON DELETE CASCADE
+);
+CREATE INDEX plot_summary_granule_ids_idx ON vswir_plants.plot_summary USING GIN (granule_ids);
+
+-- Recompute the summary rows of the given plots (every plot when NULL — the
+-- repair / backfill path) and return how many were written.
+CREATE FUNCTION vswir_plants.refresh_plot_summary(plot_ids INTEGER[] DEFAULT NULL)
+RETURNS INTEGER
+LANGUAGE sql AS $$
+    WITH target AS (
+        SELECT p.plot_id FROM vswir_plants.plot p
+        WHERE plot_ids IS NULL OR p.plot_id = ANY(plot_ids)
+    ),
+    trait_groups AS (
+        SELECT s.plot_id, lt.trait::text AS trait, count(*) AS n,
+               min(s.collection_date) AS date_min, max(s.collection_date) AS date_max
+        FROM vswir_plants.sample s
+        JOIN vswir_plants.insitu_plot_event ipe
+            ON ipe.plot_id = s.plot_id AND ipe.collection_date = s.collection_date
+        LEFT JOIN vswir_plants.leaf_traits lt
+            ON lt.plot_id = s.plot_id AND lt.collection_date = s.collection_date
+            AND lt.sample_name = s.sample_name
+        WHERE s.plot_id IN (SELECT plot_id FROM target)
+        GROUP BY s.plot_id, lt.trait
+    ),
+    traits AS (
+        SELECT plot_id, sum(n) AS trait_rows,
+               COALESCE(jsonb_object_agg(trait, n) FILTER (WHERE trait IS NOT NULL), '{}') AS trait_counts,
+               min(date_min) AS collection_date_min, max(date_max) AS collection_date_max
+        FROM trait_groups
+        GROUP BY plot_id
+    ),
+    pixel_groups AS (
+        SELECT px.plot_id, px.granule_id, count(*) AS n
+        FROM vswir_plants.pixel px
+        WHERE px.plot_id IN (SELECT plot_id FROM target)
+        GROUP BY px.plot_id, px.granule_id
+    ),
+    pixels AS (
+        SELECT pg.plot_id, array_agg(pg.granule_id ORDER BY pg.granule_id) AS granule_ids,
+               sum(pg.n) AS pixel_count,
+               min(g.acquisition_date) AS acquisition_date_min,
+               max(g.acquisition_date) AS acquisition_date_max
+        FROM pixel_groups pg
+        JOIN vswir_plants.granule g ON g.granule_id = pg.granule_id
+        GROUP BY pg.plot_id
+    ),
+    written AS (
+        INSERT INTO vswir_plants.plot_summary AS ps (
+            plot_id, trait_rows, trait_counts, collection_date_min, collection_date_max,
+            granule_ids, pixel_count, acquisition_date_min, acquisition_date_max, updated_at
+        )
+        SELECT t.plot_id,
+               COALESCE(tr.trait_rows, 0), COALESCE(tr.trait_counts, '{}'),
+               tr.collection_date_min, tr.collection_date_max,
+               COALESCE(px.granule_ids, '{}'), COALESCE(px.pixel_count, 0),
+               px.acquisition_date_min, px.acquisition_date_max, now()
+        FROM target t
+        LEFT JOIN traits tr ON tr.plot_id = t.plot_id
+        LEFT JOIN pixels px ON px.plot_id = t.plot_id
+        ON CONFLICT (plot_id) DO UPDATE SET
+            trait_rows           = EXCLUDED.trait_rows,
+            trait_counts         = EXCLUDED.trait_counts,
+            collection_date_min  = EXCLUDED.collection_date_min,
+            collection_date_max  = EXCLUDED.collection_date_max,
+            granule_ids          = EXCLUDED.granule_ids,
+            pixel_count          = EXCLUDED.pixel_count,
+            acquisition_date_min = EXCLUDED.acquisition_date_min,
+            acquisition_date_max = EXCLUDED.acquisition_date_max,
+            updated_at           = EXCLUDED.updated_at
+        RETURNING 1
+    )
+    SELECT count(*)::integer FROM written;
+$$;
+
+SELECT vswir_plants.refresh_plot_summary();
@@ -1,54 +1,95 @@
 -- ── Drop Commands ────────────────────────────────────────────────
 
-DROP MATERIALIZED VIEW plot_pixels_mv;
+-- plot_pixels_mv was a materialized view before it became a table
+DO $$
+BEGIN
+    IF (SELECT relkind FROM pg_class WHERE oid = to_regclass('vswir_plants.plot_pixels_mv')) = 'm' THEN
+        DROP MATERIALIZED VIEW vswir_plants.plot_pixels_mv;
+    END IF;
+END $$;
+DROP TABLE IF EXISTS vswir_plants.plot_pixels_mv;
 DROP VIEW leaf_traits_view;
 DROP VIEW extracted_spectra_view;
 DROP VIEW extracted_metadata_view;
 DROP VIEW reflectance_view;
 
 -- ── plot_pixels_mv ────────────────────────────────────────────────────────────
-
-CREATE MATERIALIZED VIEW vswir_plants.plot_pixels_mv AS
-SELECT
-    pri.plot_id,
-    pl.plot_name,
-    g.campaign_name,
-    g.sensor_name,
-    pri.granule_id,
-    to_date(substring(pri.granule_id from '\d{8}'), 'YYYYMMDD') AS granule_date,
-    g.acquisition_date,
-    g.cloudy_conditions,
-    g.cloud_type,
-    g.gsd,
-    pri.extraction_method,
-    pri.delineation_method,
-    pri.shape_aligned_to_granule,
-    jsonb_agg(p.pixel_id ORDER BY p.pixel_id) AS pixel_ids,
-    ps.geom
-FROM plot_raster_intersect pri
-JOIN plot pl ON pl.plot_id = pri.plot_id
-JOIN plot_shape ps ON ps.plot_shape_id = pri.plot_shape_id
-JOIN granule g ON g.granule_id = pri.granule_id
-JOIN pixel p ON p.granule_id = pri.granule_id AND p.plot_id = pri.plot_id
-GROUP BY
-    pri.plot_id,
-    pl.plot_name,
-    g.campaign_name,
-    g.sensor_name,
-    pri.granule_id,
-    granule_date,
-    g.acquisition_date,
-    g.cloudy_conditions,
-    g.cloud_type,
-    g.gsd,
-    pri.extraction_method,
-    pri.delineation_method,
-    pri.shape_aligned_to_granule,
-    ps.geom;
+-- A plain table, not a materialized view: promotion inserts only the promoted
+-- plots' rows through refresh_plot_pixels(plot_ids) instead of re-running the
+-- whole aggregate with REFRESH MATERIALIZED VIEW. The name is kept so
+-- pygeoapi and the dashboard read it unchanged.
+-- Repair / full rebuild: SELECT vswir_plants.refresh_plot_pixels();
+
+CREATE TABLE vswir_plants.plot_pixels_mv (
+    plot_id INTEGER NOT NULL,
+    plot_name VARCHAR NOT NULL,
+    campaign_name VARCHAR NOT NULL,
+    sensor_name vswir_plants."Sensor_name" NOT NULL,
+    granule_id VARCHAR NOT NULL,
+    granule_date DATE,
+    acquisition_date DATE NOT NULL,
+    cloudy_conditions vswir_plants."CLOUD_conditions" NOT NULL,
+    cloud_type vswir_plants."CLOUD_type" NOT NULL,
+    gsd FLOAT4 NOT NULL,
+    extraction_method vswir_plants."EXTRACTION_method" NOT NULL,
+    delineation_method vswir_plants."DELINEATION_method" NOT NULL,
+    shape_aligned_to_granule BOOLEAN NOT NULL,
+    pixel_ids JSONB NOT NULL,
+    geom geometry(GEOMETRY, 4326) NOT NULL,
+    CONSTRAINT plot_pixels_mv_pk PRIMARY KEY (plot_id, granule_id)
+);
 
 CREATE INDEX idx_plot_pixels_geom ON vswir_plants.plot_pixels_mv USING GIST (geom);
 CREATE INDEX idx_plot_pixels_date ON vswir_plants.plot_pixels_mv (granule_date);
 
+-- Rebuild the rows of the given plots (every plot when NULL) and return how
+-- many were written. Each (plot, granule) pixel list is read through pixel_idx;
+-- presorted aggregation is off so that a stale row estimate on pixel (e.g. the
+-- first promotion into an empty table) cannot swap that for a walk of pixel_pkey
+-- per row.
+CREATE OR REPLACE FUNCTION vswir_plants.refresh_plot_pixels(plot_ids INTEGER[] DEFAULT NULL)
+RETURNS INTEGER
+LANGUAGE sql
+SET enable_presorted_aggregate = off
+AS $$
+    DELETE FROM vswir_plants.plot_pixels_mv
+    WHERE plot_ids IS NULL OR plot_id = ANY(plot_ids);
+
+    WITH written AS (
+        INSERT INTO vswir_plants.plot_pixels_mv
+        SELECT
+            pri.plot_id,
+            pl.plot_name,
+            g.campaign_name,
+            g.sensor_name,
+            pri.granule_id,
+            to_date(substring(pri.granule_id from '\d{8}'), 'YYYYMMDD') AS granule_date,
+            g.acquisition_date,
+            g.cloudy_conditions,
+            g.cloud_type,
+            g.gsd,
+            pri.extraction_method,
+            pri.delineation_method,
+            pri.shape_aligned_to_granule,
+            px.pixel_ids,
+            ps.geom
+        FROM vswir_plants.plot_raster_intersect pri
+        JOIN vswir_plants.plot pl ON pl.plot_id = pri.plot_id
+        JOIN vswir_plants.plot_shape ps ON ps.plot_shape_id = pri.plot_shape_id
+        JOIN vswir_plants.granule g ON g.granule_id = pri.granule_id
+        JOIN LATERAL (
+            SELECT jsonb_agg(p.pixel_id ORDER BY p.pixel_id) AS pixel_ids
+            FROM vswir_plants.pixel p
+            WHERE p.plot_id = pri.plot_id AND p.granule_id = pri.granule_id
+        ) px ON px.pixel_ids IS NOT NULL
+        WHERE plot_ids IS NULL OR pri.plot_id = ANY(plot_ids)
+        RETURNING 1
+    )
+    SELECT count(*)::integer FROM written;
+$$;
+
+SELECT vswir_plants.refresh_plot_pixels();
+
 -- ── extracted_spectra_view ────────────────────────────────────────────────────
 
 CREATE VIEW vswir_plants.extracted_spectra_view AS
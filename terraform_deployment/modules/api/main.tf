@@ -103,6 +103,40 @@ resource "aws_iam_role_policy_attachment" "lambda_sqs_send_attach" {
   policy_arn = aws_iam_policy.lambda_sqs_send_policy.arn
 }
 
+# Export deduplication: the API looks up / claims content-addressed export jobs,
+# re-signs URLs for exports that already exist and registers sharded parents
+# (app/exports.py).
+resource "aws_iam_policy" "lambda_export_jobs_policy" {
+  name = "vswir-plants-lambda-export-jobs-policy"
+
+  policy = jsonencode({
+    Version = "2012-10-17",
+    Statement = [
+      {
+        Effect = "Allow",
+        Action = [
+          "dynamodb:GetItem",
+          "dynamodb:PutItem",
+          "dynamodb:UpdateItem",
+          "dynamodb:DeleteItem"
+        ],
+        Resource = aws_dynamodb_table.export_jobs.arn
+      },
+      {
+        Effect   = "Allow",
+        Action   = ["s3:GetObject"],
+        Resource = "${aws_s3_bucket.vswir_plants_config.arn}/exports/*"
+      }
+    ]
+  })
+
+  tags = var.tags
+}
+resource "aws_iam_role_policy_attachment" "lambda_export_jobs_attach" {
+  role       = aws_iam_role.lambda_exec.name
+  policy_arn = aws_iam_policy.lambda_export_jobs_policy.arn
+}
+
 resource "aws_security_group" "lambda_sg" {
   name        = "lambda-sg"
   description = "SG for Lambda in VPC"
@@ -192,6 +226,8 @@ resource "aws_lambda_function" "vswir-plants" {
     variables = {
       DB_SECRET_ARN = aws_secretsmanager_secret.vswir_plants_db.arn
       SQS_QUEUE_URL = aws_sqs_queue.export_queue.url
+      JOB_TABLE     = aws_dynamodb_table.export_jobs.name
+      EXPORT_BUCKET = aws_s3_bucket.vswir_plants_config.bucket
     }
   }
 
@@ -224,7 +260,8 @@ resource "aws_apigatewayv2_api" "vswir_plants" {
       "authorization"
     ]
     expose_headers = [
-      "content-type"
+      "content-type",
+      "x-next-cursor"
     ]
     max_age = 3600
   }
@@ -404,6 +441,19 @@ resource "aws_s3_bucket_lifecycle_configuration" "vswir_plants_exports" {
       days = 1
     }
   }
+
+  rule {
+    id     = "expire_qaqc_ref_cache"
+    status = "Enabled"
+
+    filter {
+      prefix = "ingestion/qaqc-ref-cache/"
+    }
+
+    expiration {
+      days = 7
+    }
+  }
 }
 
 resource "aws_sqs_queue" "export_dlq" {